@@ -0,0 +1,165 @@
+"""
+Admission Control Module
+Per-class concurrency limits with bounded wait queues and fast 503 load shedding
+"""
+
+import asyncio
+import json
+import math
+import os
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from metrics import ADMISSION_IN_FLIGHT, ADMISSION_REJECTED, ADMISSION_WAITING
+from logging_setup import get_logger
+
+logger = get_logger("admission")
+
+
+class AdmissionClass:
+    """
+    Concurrency limit for one group of routes
+
+    Up to max_concurrency requests run at once; up to max_queue more wait
+    (first come, first served) for at most queue_timeout seconds. Anything
+    beyond that is rejected immediately, so a burst in one class cannot
+    tie up the workers every other class depends on.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_queue: int = 0,
+        queue_timeout: float = 5.0,
+        retry_after: Optional[int] = None
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after if retry_after is not None else max(1, math.ceil(queue_timeout))
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        ADMISSION_IN_FLIGHT.set_function(lambda: self.active, admission_class=name)
+        ADMISSION_WAITING.set_function(lambda: len(self._waiters), admission_class=name)
+
+
+    @classmethod
+    def from_env(
+        cls,
+        name: str,
+        max_concurrency: int,
+        max_queue: int = 0,
+        queue_timeout: float = 5.0
+    ) -> "AdmissionClass":
+        """
+        Build a class whose defaults can be overridden per deployment
+
+        Reads ADMISSION_<NAME>_CONCURRENCY, ADMISSION_<NAME>_QUEUE and
+        ADMISSION_<NAME>_TIMEOUT.
+        """
+        prefix = f"ADMISSION_{name.upper()}"
+        return cls(
+            name,
+            max_concurrency=int(os.getenv(f"{prefix}_CONCURRENCY", str(max_concurrency))),
+            max_queue=int(os.getenv(f"{prefix}_QUEUE", str(max_queue))),
+            queue_timeout=float(os.getenv(f"{prefix}_TIMEOUT", str(queue_timeout)))
+        )
+
+
+    async def acquire(self) -> Optional[str]:
+        """
+        Take a slot, waiting in the queue if needed
+
+        Returns:
+            None once admitted, or the rejection reason ('queue_full' or
+            'queue_timeout')
+        """
+        if self.active < self.max_concurrency and not self._waiters:
+            self.active += 1
+            return None
+
+        if len(self._waiters) >= self.max_queue:
+            return 'queue_full'
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+            return None
+        except asyncio.TimeoutError:
+            if waiter.done():
+                return None  # A slot was handed over just as the wait expired
+            waiter.cancel()
+            self._waiters.remove(waiter)
+            return 'queue_timeout'
+        except asyncio.CancelledError:
+            if waiter.done():
+                self.release()  # Pass on the slot we were just handed
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            raise
+
+
+    def release(self):
+        """Free a slot, handing it straight to the oldest waiter if any"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+class AdmissionMiddleware:
+    """
+    Apply admission classes to requests by path
+
+    Requests for paths without a class (health checks, cheap lookups) are
+    never limited. Rejected requests get 503 with Retry-After.
+    """
+
+    def __init__(self, app, classes: Dict[str, AdmissionClass], routes: Dict[str, str]):
+        self.app = app
+        self.classes = classes
+        self.routes = routes
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope.get('method') == 'OPTIONS':
+            await self.app(scope, receive, send)
+            return
+
+        admission_class = self.classes.get(self.routes.get(scope['path'].rstrip('/') or '/'))
+        if admission_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        reason = await admission_class.acquire()
+        if reason is not None:
+            ADMISSION_REJECTED.inc(admission_class=admission_class.name, reason=reason)
+            logger.warning("Rejected %s (%s: %s)", scope['path'], admission_class.name, reason)
+            await self._reject(send, admission_class)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            admission_class.release()
+
+    async def _reject(self, send, admission_class: AdmissionClass):
+        body = json.dumps({
+            "detail": f"Server busy ({admission_class.name} requests). Please retry shortly."
+        }).encode('utf-8')
+        await send({
+            'type': 'http.response.start',
+            'status': 503,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode('latin-1')),
+                (b'retry-after', str(admission_class.retry_after).encode('latin-1'))
+            ]
+        })
+        await send({'type': 'http.response.body', 'body': body})
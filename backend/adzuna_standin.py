@@ -0,0 +1,299 @@
+"""
+Adzuna Stand-in Module
+Offline Adzuna search API (recorded or synthetic responses) for repeatable benchmarks
+
+Select it with ADZUNA_STANDIN=1 (in-process transports for the sync and
+async collectors) or run it as a server and point ADZUNA_BASE_URL at it:
+
+    python adzuna_standin.py --port 8090
+    ADZUNA_BASE_URL=http://localhost:8090/v1/api/jobs/in/search uvicorn api:app
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from skill_database import get_all_skills
+from logging_setup import get_logger
+
+logger = get_logger("adzuna_standin")
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries', 'Wayne Tech', 'Soylent']
+CITIES = ['Bangalore', 'Mumbai', 'Hyderabad', 'Pune', 'Chennai', 'Delhi', 'Remote']
+
+
+def recording_name(role: str, location: str, page: int) -> str:
+    """File name of a recorded page, e.g. 'python_developer__india__1.json'"""
+    def slug(text: str) -> str:
+        return re.sub(r'[^a-z0-9]+', '_', (text or '').lower()).strip('_') or 'any'
+    return f"{slug(role)}__{slug(location)}__{page}.json"
+
+
+def record_page(record_dir: str, role: str, location: str, page: int, payload: Dict):
+    """Save a live Adzuna response so the stand-in can replay it"""
+    path = Path(record_dir) / recording_name(role, location, page)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False)
+
+
+class StandinConfig:
+    """
+    Behaviour of the stand-in
+
+    latency_ms +/- jitter_ms is added to every response. error_rate and
+    rate_limit_rate are the fractions of requests answered with HTTP 500
+    and with 429 (plus Retry-After: retry_after seconds). Each search has
+    total_results postings. Pages are replayed from recordings_dir when a
+    recording exists, else generated deterministically from seed.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 150.0,
+        jitter_ms: float = 50.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        total_results: int = 200,
+        recordings_dir: Optional[str] = None,
+        seed: int = 0
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.total_results = total_results
+        self.recordings_dir = recordings_dir
+        self.seed = seed
+
+
+    @classmethod
+    def from_env(cls) -> "StandinConfig":
+        """Read ADZUNA_STANDIN_LATENCY_MS, _JITTER_MS, _ERROR_RATE, _429_RATE, _RETRY_AFTER, _RESULTS, _RECORDINGS and _SEED"""
+        return cls(
+            latency_ms=float(os.getenv("ADZUNA_STANDIN_LATENCY_MS", "150")),
+            jitter_ms=float(os.getenv("ADZUNA_STANDIN_JITTER_MS", "50")),
+            error_rate=float(os.getenv("ADZUNA_STANDIN_ERROR_RATE", "0")),
+            rate_limit_rate=float(os.getenv("ADZUNA_STANDIN_429_RATE", "0")),
+            retry_after=float(os.getenv("ADZUNA_STANDIN_RETRY_AFTER", "1")),
+            total_results=int(os.getenv("ADZUNA_STANDIN_RESULTS", "200")),
+            recordings_dir=os.getenv("ADZUNA_STANDIN_RECORDINGS") or None,
+            seed=int(os.getenv("ADZUNA_STANDIN_SEED", "0"))
+        )
+
+
+# ============================================
+# RESPONDER
+# ============================================
+
+class AdzunaStandin:
+    """
+    Answer Adzuna search requests offline
+
+    respond() maps a request URL to (status, headers, body, latency); the
+    transports and the server only differ in how they wait and reply.
+    Fault injection uses its own random stream (seeded), so a benchmark
+    run sees the same sequence of errors every time.
+    """
+
+    def __init__(self, config: Optional[StandinConfig] = None):
+        self.config = config if config is not None else StandinConfig.from_env()
+        self._skills = sorted(get_all_skills())
+        self._faults = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+
+
+    def respond(self, url: str) -> Tuple[int, Dict[str, str], bytes, float]:
+        """
+        Returns:
+            Tuple of (status code, headers, body, latency in seconds)
+        """
+        config = self.config
+        with self._lock:
+            self.requests += 1
+            fault = self._faults.random()
+            latency = max(0.0, config.latency_ms + self._faults.uniform(-config.jitter_ms, config.jitter_ms)) / 1000
+
+        headers = {'content-type': 'application/json'}
+        if fault < config.rate_limit_rate:
+            headers['retry-after'] = f"{config.retry_after:g}"
+            return 429, headers, b'{"exception":"rate limit exceeded"}', latency
+        if fault < config.rate_limit_rate + config.error_rate:
+            return 500, headers, b'{"exception":"internal error"}', latency
+
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query)
+        try:
+            page = int(parsed.path.rstrip('/').rsplit('/', 1)[-1])
+        except ValueError:
+            return 404, headers, b'{"exception":"not found"}', latency
+        role = query.get('what', [''])[0]
+        location = query.get('where', ['India'])[0]
+        per_page = int(query.get('results_per_page', ['50'])[0])
+
+        payload = self._recorded_page(role, location, page)
+        if payload is None:
+            payload = self._synthetic_page(role, location, page, per_page)
+        return 200, headers, json.dumps(payload).encode('utf-8'), latency
+
+
+    def _recorded_page(self, role: str, location: str, page: int) -> Optional[Dict]:
+        if not self.config.recordings_dir:
+            return None
+        path = Path(self.config.recordings_dir) / recording_name(role, location, page)
+        if not path.is_file():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+    def _synthetic_page(self, role: str, location: str, page: int, per_page: int) -> Dict:
+        """
+        Deterministic postings for a search: the same (seed, role, location)
+        always yields the same postings, newest first across pages
+        """
+        search = f"{self.config.seed}:{role.strip().lower()}:{location.strip().lower()}"
+        search_id = int(hashlib.sha256(search.encode('utf-8')).hexdigest()[:12], 16)
+        role_skills = random.Random(search_id).sample(self._skills, min(30, len(self._skills)))
+        newest = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+        start = (page - 1) * per_page
+        results = []
+        for index in range(start, min(start + per_page, self.config.total_results)):
+            rng = random.Random(search_id * 100003 + index)
+            skills = rng.sample(role_skills, rng.randint(4, 8))
+            results.append({
+                'id': str(search_id % 10**8 * 10**5 + index),
+                'title': f"{rng.choice(['', 'Senior ', 'Junior ', 'Lead '])}{role or 'Software Engineer'}",
+                'company': {'display_name': rng.choice(COMPANIES)},
+                'location': {'display_name': rng.choice(CITIES)},
+                'description': (
+                    f"We are hiring a {role or 'developer'} to join our team. "
+                    f"Required: {', '.join(skills[:-2])}. Nice to have: {', '.join(skills[-2:])}."
+                ),
+                'salary_min': rng.randrange(400000, 1500000, 50000),
+                'salary_max': rng.randrange(1500000, 4000000, 50000),
+                'created': (newest - timedelta(hours=index * 2)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'redirect_url': f"https://standin.invalid/jobs/{search_id % 10**8}/{index}",
+                'contract_type': 'permanent',
+                'category': {'label': 'IT Jobs'}
+            })
+        return {'count': self.config.total_results, 'results': results}
+
+
+_standin: Optional[AdzunaStandin] = None
+_standin_lock = threading.Lock()
+
+
+def get_standin() -> AdzunaStandin:
+    """Process-wide stand-in (configured from the environment on first use)"""
+    global _standin
+    with _standin_lock:
+        if _standin is None:
+            _standin = AdzunaStandin()
+            logger.warning("Using the offline Adzuna stand-in (ADZUNA_STANDIN)")
+        return _standin
+
+
+# ============================================
+# TRANSPORTS
+# ============================================
+
+class StandinAdapter(BaseAdapter):
+    """requests transport adapter answering from the stand-in"""
+
+    def __init__(self, standin: Optional[AdzunaStandin] = None):
+        super().__init__()
+        self.standin = standin if standin is not None else get_standin()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        status, headers, body, latency = self.standin.respond(request.url)
+        read_timeout = timeout[1] if isinstance(timeout, tuple) else timeout
+        if read_timeout is not None and latency > read_timeout:
+            time.sleep(read_timeout)
+            raise requests.exceptions.ReadTimeout(f"Stand-in latency {latency:.2f}s exceeded timeout", request=request)
+        time.sleep(latency)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+if httpx is not None:
+    class StandinAsyncTransport(httpx.AsyncBaseTransport):
+        """httpx transport answering from the stand-in"""
+
+        def __init__(self, standin: Optional[AdzunaStandin] = None):
+            self.standin = standin if standin is not None else get_standin()
+
+        async def handle_async_request(self, request: "httpx.Request") -> "httpx.Response":
+            status, headers, body, latency = self.standin.respond(str(request.url))
+            read_timeout = request.extensions.get('timeout', {}).get('read')
+            if read_timeout is not None and latency > read_timeout:
+                await asyncio.sleep(read_timeout)
+                raise httpx.ReadTimeout(f"Stand-in latency {latency:.2f}s exceeded timeout", request=request)
+            await asyncio.sleep(latency)
+            return httpx.Response(status, headers=headers, content=body, request=request)
+
+
+# ============================================
+# SERVER
+# ============================================
+
+def create_app(standin: Optional[AdzunaStandin] = None):
+    """FastAPI app serving the stand-in at Adzuna's search path"""
+    from fastapi import FastAPI, Request, Response
+
+    standin = standin if standin is not None else AdzunaStandin()
+    app = FastAPI(title="Adzuna stand-in")
+
+    @app.get("/v1/api/jobs/{country}/search/{page}")
+    async def search(request: Request, country: str, page: int):
+        status, headers, body, latency = standin.respond(str(request.url))
+        await asyncio.sleep(latency)
+        return Response(content=body, status_code=status, headers=headers)
+
+    return app
+
+
+if __name__ == "__main__":
+    import argparse
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Offline Adzuna stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    args = parser.parse_args()
+
+    print(f"\n🧪 Adzuna stand-in on http://{args.host}:{args.port}/v1/api/jobs/in/search")
+    uvicorn.run(create_app(), host=args.host, port=args.port)
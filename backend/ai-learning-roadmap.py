@@ -5,12 +5,20 @@ Generates personalized learning paths with REAL YouTube and Documentation links
 
 import os
 import json
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, List, Optional
 from datetime import datetime
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+from metrics import stage_timer, track_executor
+from resilience import CircuitOpenError, Deadline, call_timeout, get_breaker
+from logging_setup import get_logger
+
+logger = get_logger("roadmap")
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -27,6 +35,10 @@ class Config:
     
     # Gemini settings
     GEMINI_MODEL = "models/gemini-flash-latest"
+    GEMINI_TIMEOUT = float(os.getenv("GEMINI_TIMEOUT_SECONDS", "30"))
+    GEMINI_BREAKER_FAILURES = int(os.getenv("GEMINI_BREAKER_FAILURES", "5"))
+    GEMINI_BREAKER_SLOW_SECONDS = float(os.getenv("GEMINI_BREAKER_SLOW_SECONDS", "25"))
+    GEMINI_BREAKER_RESET_SECONDS = float(os.getenv("GEMINI_BREAKER_RESET_SECONDS", "60"))
     
     # Resource platforms
     PLATFORMS = [
@@ -46,6 +58,45 @@ class Config:
 # GEMINI AI ROADMAP GENERATOR
 # ============================================
 
+def gemini_breaker():
+    """Breaker shared by every Gemini caller"""
+    return get_breaker(
+        'gemini',
+        failure_threshold=Config.GEMINI_BREAKER_FAILURES,
+        slow_call_seconds=Config.GEMINI_BREAKER_SLOW_SECONDS,
+        reset_timeout=Config.GEMINI_BREAKER_RESET_SECONDS
+    )
+
+
+def generate_content(model, prompt: str, deadline: Optional[Deadline] = None):
+    """
+    Call Gemini through its circuit breaker with a bounded timeout
+    
+    Raises:
+        CircuitOpenError: Gemini is failing; the call was not made
+        DeadlineExceeded: The request's budget is already used up
+    """
+    if deadline is not None:
+        deadline.check("Gemini call")
+    
+    breaker = gemini_breaker()
+    breaker.allow()
+    
+    start = time.monotonic()
+    try:
+        with stage_timer('gemini_call'):
+            response = model.generate_content(
+                prompt,
+                request_options={"timeout": call_timeout(deadline, Config.GEMINI_TIMEOUT)}
+            )
+    except Exception as e:
+        breaker.record_failure(type(e).__name__)
+        raise
+    
+    breaker.record_success(time.monotonic() - start)
+    return response
+
+
 class GeminiRoadmapGenerator:
     """Generate learning roadmaps using Gemini AI"""
     
@@ -57,20 +108,20 @@ class GeminiRoadmapGenerator:
         self.model = genai.GenerativeModel(Config.GEMINI_MODEL)
     
     
-    def generate_roadmap(self, skill: str, user_level: str = "beginner") -> Dict:
+    def generate_roadmap(self, skill: str, user_level: str = "beginner", deadline: Optional[Deadline] = None) -> Dict:
         """
         Generate learning roadmap for a skill
         
         Args:
             skill: Skill to learn (e.g., "React")
             user_level: beginner, intermediate, advanced
+            deadline: Optional time budget for the Gemini call
             
         Returns:
             Dictionary with roadmap structure
         """
         
-        print(f"\n🤖 Generating roadmap for: {skill}")
-        print(f"📊 Level: {user_level}")
+        logger.debug("Generating roadmap for: %s (level: %s)", skill, user_level)
         
         prompt = f"""
 You are an expert learning path designer. Create a detailed learning roadmap for someone who wants to learn {skill}.
@@ -120,8 +171,9 @@ Make it comprehensive and practical. Include 3-5 prerequisites, 4-6 learning sta
 Return ONLY valid JSON, no markdown formatting.
 """
         
+        text = ""
         try:
-            response = self.model.generate_content(prompt)
+            response = generate_content(self.model, prompt, deadline)
             
             # Clean response
             text = response.text.strip()
@@ -139,19 +191,21 @@ Return ONLY valid JSON, no markdown formatting.
             # Parse JSON
             roadmap = json.loads(text)
             
-            print(f"✅ Roadmap generated successfully!")
-            print(f"   • {len(roadmap.get('prerequisites', []))} prerequisites")
-            print(f"   • {len(roadmap.get('learning_path', []))} learning stages")
-            print(f"   • {len(roadmap.get('projects', []))} project ideas")
+            logger.debug(
+                "Roadmap for %s: %d prerequisites, %d learning stages, %d project ideas",
+                skill,
+                len(roadmap.get('prerequisites', [])),
+                len(roadmap.get('learning_path', [])),
+                len(roadmap.get('projects', []))
+            )
             
             return roadmap
             
         except json.JSONDecodeError as e:
-            print(f"❌ JSON parsing error: {e}")
-            print(f"Response text: {text[:500]}")
+            logger.error("Roadmap JSON parsing error: %s; response text: %s", e, text[:500])
             raise
         except Exception as e:
-            print(f"❌ Error generating roadmap: {e}")
+            logger.error("Error generating roadmap: %s", e)
             raise
 
 
@@ -165,31 +219,32 @@ class ResourceFinder:
     def __init__(self, youtube_api_key: Optional[str] = None):
         self.youtube_api_key = youtube_api_key
         self.gemini_model = genai.GenerativeModel(Config.GEMINI_MODEL)
-        print("ℹ️ Resource finder initialized (using AI for dynamic resources)")
+        logger.debug("Resource finder initialized (using AI for dynamic resources)")
     
     
-    def find_resources_for_skill(self, skill_name: str, count: int = 5) -> List[Dict]:
+    def find_resources_for_skill(self, skill_name: str, count: int = 5, deadline: Optional[Deadline] = None) -> List[Dict]:
         """
         Dynamically find learning resources with REAL YouTube and documentation links
         
         Args:
             skill_name: Name of the skill
             count: Number of resources to find
+            deadline: Optional time budget; generic resources are used
+                once it runs out or while Gemini's circuit is open
             
         Returns:
             List of resource dictionaries with working URLs
         """
         
-        print(f"🔍 Finding resources for: {skill_name}")
         
         # Use AI to find real resources dynamically
-        resources = self._find_dynamic_resources(skill_name, count)
+        resources = self._find_dynamic_resources(skill_name, count, deadline)
         
-        print(f"✅ Found {len(resources)} resources")
+        logger.debug("Found %d resources for: %s", len(resources), skill_name)
         return resources
     
     
-    def _find_dynamic_resources(self, skill_name: str, count: int) -> List[Dict]:
+    def _find_dynamic_resources(self, skill_name: str, count: int, deadline: Optional[Deadline] = None) -> List[Dict]:
         """Use AI to dynamically find real YouTube videos and documentation links"""
         
         prompt = f"""Find the {count} BEST real learning resources for: {skill_name}
@@ -223,7 +278,7 @@ Return ONLY valid JSON array, no markdown.
 """
         
         try:
-            response = self.gemini_model.generate_content(prompt)
+            response = generate_content(self.gemini_model, prompt, deadline)
             text = response.text.strip()
             
             # Clean markdown formatting
@@ -244,8 +299,11 @@ Return ONLY valid JSON array, no markdown.
             else:
                 return [resources][:count]
                 
+        except CircuitOpenError:
+            logger.debug("Gemini circuit open; generic resources for %s", skill_name)
+            return self._get_generic_resources(skill_name, count)
         except Exception as e:
-            print(f"⚠️ AI resource finding failed: {e}")
+            logger.warning("AI resource finding failed for %s: %s", skill_name, e)
             # Fallback to generic resources
             return self._get_generic_resources(skill_name, count)
     
@@ -449,50 +507,61 @@ class RoadmapVisualizer:
 class RoadmapBuilder:
     """Main class to build complete learning roadmap"""
     
-    def __init__(self, gemini_api_key: str, youtube_api_key: Optional[str] = None):
+    def __init__(self, gemini_api_key: str, youtube_api_key: Optional[str] = None, resource_workers: int = 8):
         self.roadmap_generator = GeminiRoadmapGenerator(gemini_api_key)
         self.resource_finder = ResourceFinder(youtube_api_key)
         self.visualizer = RoadmapVisualizer()
+        
+        # Shared pool for the per-prerequisite/per-stage resource lookups
+        self.resource_executor = ThreadPoolExecutor(
+            max_workers=resource_workers,
+            thread_name_prefix="roadmap-resources"
+        )
+        track_executor('roadmap_resources', self.resource_executor)
     
     
-    def build_complete_roadmap(self, skill: str, level: str = "beginner") -> Dict:
+    def build_complete_roadmap(self, skill: str, level: str = "beginner", deadline: Optional[Deadline] = None) -> Dict:
         """
         Build complete roadmap with resources
         
         Args:
             skill: Skill to learn
             level: User's current level
+            deadline: Optional time budget for the whole build; resource
+                lookups still running when it expires get generic resources
             
         Returns:
             Complete roadmap dictionary with REAL YouTube and Documentation links
         """
         
-        print(f"\n{'='*60}")
-        print(f"🎯 BUILDING LEARNING ROADMAP")
-        print(f"{'='*60}")
-        print(f"Skill: {skill}")
-        print(f"Level: {level}")
+        logger.debug("Building learning roadmap: %s (level: %s)", skill, level)
         
         # Step 1: Generate roadmap structure
-        roadmap = self.roadmap_generator.generate_roadmap(skill, level)
+        roadmap = self.roadmap_generator.generate_roadmap(skill, level, deadline)
         
         # Step 2: Find resources for each prerequisite
-        print(f"\n{'='*60}")
-        print(f"📚 FINDING RESOURCES (WITH REAL LINKS)")
-        print(f"{'='*60}")
-        
-        for prereq in roadmap.get("prerequisites", []):
-            prereq["resources"] = self.resource_finder.find_resources_for_skill(
-                prereq["name"], 
-                count=3
-            )
+        lookups = [
+            (prereq, prereq["name"], 3) for prereq in roadmap.get("prerequisites", [])
+        ]
         
         # Step 3: Find resources for each learning stage
-        for stage in roadmap.get("learning_path", []):
-            stage["resources"] = self.resource_finder.find_resources_for_skill(
-                stage["name"],
-                count=5
-            )
+        lookups += [
+            (stage, stage["name"], 5) for stage in roadmap.get("learning_path", [])
+        ]
+        
+        # Resource lookups are independent, so run them concurrently
+        futures = [
+            (item, name, count, self.resource_executor.submit(
+                self.resource_finder.find_resources_for_skill, name, count, deadline
+            ))
+            for item, name, count in lookups
+        ]
+        for item, name, count, future in futures:
+            try:
+                item["resources"] = future.result(timeout=deadline.remaining() if deadline is not None else None)
+            except FutureTimeoutError:
+                logger.warning("Resource lookup for %s exceeded the deadline; using generic resources", name)
+                item["resources"] = self.resource_finder._get_generic_resources(name, count)
         
         # Step 4: Create graph visualization data
         roadmap["graph_data"] = self.visualizer.create_graph_data(roadmap)
@@ -507,7 +576,7 @@ class RoadmapBuilder:
             "estimated_total_time": self._calculate_total_time(roadmap)
         }
         
-        print(f"\n✅ Complete roadmap built successfully with REAL resource links!")
+        logger.info("Roadmap built for %s (%d resource lookups)", skill, len(lookups))
         
         return roadmap
     
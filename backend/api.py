@@ -3,14 +3,19 @@ FastAPI Backend for SkillSphere
 Connects frontend to existing gap analyzer backend logic
 """
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, Request, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Optional, Union
+from typing import AsyncIterator, Callable, List, Dict, Optional, Tuple, Union
 import sys
 import json
+import asyncio
+import fnmatch
+import hashlib
 import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import PyPDF2
 
@@ -21,9 +26,36 @@ load_dotenv()
 # Import backend modules
 from resume_parser import ResumeParser
 from skill_extractor_updated import SkillExtractor
-from gap_analyzer import GapAnalyzer
-from multi_source_collector import JobCollector
+from gap_analyzer import GapAnalyzer, load_market_analysis
+from multi_source_collector import AsyncJobCollector
 from resume_feedback_analyzer import ResumeFeedbackAnalyzer
+from admission import AdmissionClass, AdmissionMiddleware
+from metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    REGISTRY as METRICS_REGISTRY,
+    MetricsMiddleware,
+    stage_timer,
+    track_executor
+)
+from response_utils import (
+    CompressionMiddleware,
+    FastJSONResponse,
+    conditional_response,
+    make_etag,
+    project_fields,
+    projected_response
+)
+from logging_setup import get_logger, sampled
+from cache import TTLCache
+from job_store import DEFAULT_JOB_STORE_PATH, JobStore
+from role_catalog import DEFAULT_ROLES, RoleCatalog
+from role_canonicalizer import RoleCanonicalizer
+from resilience import CircuitOpenError, Deadline, DeadlineExceeded, OPEN
+from prefix_index import PrefixIndex, normalize_key
+from skill_database import build_normalization_table, get_skill_category
+from task_queue import TaskQueue, task_key, QUEUED, RUNNING, FAILED, CANCELLED
+
+logger = get_logger("api")
 
 
 # Import roadmap module
@@ -40,11 +72,45 @@ try:
     RoadmapBuilder = roadmap_module.RoadmapBuilder
     ROADMAP_AVAILABLE = True
 except Exception as e:
-    print(f"⚠️ Warning: Roadmap module not available: {e}")
+    logger.warning("Roadmap module not available: %s", e)
     ROADMAP_AVAILABLE = False
     RoadmapBuilder = None
 
-app = FastAPI(title="SkillSphere API", version="1.0.0")
+app = FastAPI(
+    title="SkillSphere API",
+    version="1.0.0",
+    default_response_class=FastJSONResponse
+)
+
+# Compress responses (brotli/gzip, negotiated per request)
+app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+# Admission control: expensive route groups get bounded concurrency and
+# wait queues and are shed with 503 + Retry-After when full; all other
+# routes are never limited (override limits via ADMISSION_<CLASS>_* env)
+ADMISSION_CLASSES = {
+    "roadmap": AdmissionClass.from_env("roadmap", max_concurrency=4, max_queue=8, queue_timeout=10.0),
+    "realtime": AdmissionClass.from_env("realtime", max_concurrency=8, max_queue=32, queue_timeout=5.0),
+    "documents": AdmissionClass.from_env("documents", max_concurrency=4, max_queue=16, queue_timeout=5.0),
+}
+ADMISSION_ROUTES = {
+    "/api/generate-roadmap": "roadmap",
+    "/api/generate-roadmaps-bulk": "roadmap",
+    "/api/gap-analysis": "realtime",
+    "/api/gap-analysis-batch": "realtime",
+    "/api/gap-analysis/stream": "realtime",
+    "/api/search-jobs": "realtime",
+    "/api/upload-resume": "documents",
+    "/api/gap-analysis-with-pdf": "documents",
+    "/api/match-job": "documents",
+    "/api/match-jobs": "documents",
+    "/api/resume-pipeline": "documents",
+    "/api/analyze-job-descriptions": "documents",
+}
+app.add_middleware(AdmissionMiddleware, classes=ADMISSION_CLASSES, routes=ADMISSION_ROUTES)
+
+# Per-route request counts and latency histograms (served at /metrics)
+app.add_middleware(MetricsMiddleware)
 
 # Configure CORS
 app.add_middleware(
@@ -53,31 +119,127 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 # Initialize modules
 resume_parser = ResumeParser()
 skill_extractor = SkillExtractor()
 gap_analyzer = GapAnalyzer()
-job_collector = JobCollector()
+async_job_collector = AsyncJobCollector(
+    max_concurrency=int(os.getenv("ADZUNA_MAX_CONCURRENCY", "5"))
+)  # Rate limited by the process-wide Adzuna bucket (ADZUNA_REQUESTS_PER_SECOND)
 feedback_analyzer = ResumeFeedbackAnalyzer()
 
 # Initialize roadmap builder if available
 roadmap_builder = None
+roadmap_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("ROADMAP_BULK_CONCURRENCY", "4")),
+    thread_name_prefix="roadmap"
+)
+track_executor('roadmap', roadmap_executor)
+
+# Default executor for loop.run_in_executor(None, ...) (store I/O, analyses),
+# installed at startup so its backlog shows up in /metrics too
+default_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("DEFAULT_EXECUTOR_WORKERS", str(min(32, (os.cpu_count() or 1) + 4)))),
+    thread_name_prefix="default"
+)
+track_executor('default', default_executor)
+
+# Shared cache of normalized Adzuna search pages, keyed by (canonical role, location, page)
+search_cache = TTLCache(
+    "search_pages",
+    ttl_seconds=float(os.getenv("SEARCH_CACHE_TTL", "300")),
+    max_entries=int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1000"))
+)
+_search_inflight: Dict[tuple, asyncio.Task] = {}
+
+# Skills extracted per job posting, keyed by (source, job id)
+job_skills_cache = TTLCache(
+    "job_skills",
+    ttl_seconds=float(os.getenv("JOB_SKILLS_CACHE_TTL", "86400")),
+    max_entries=int(os.getenv("JOB_SKILLS_CACHE_MAX_ENTRIES", "20000"))
+)
+
+# Latency budgets for requests that call upstreams (Adzuna, Gemini)
+MARKET_COLLECTION_DEADLINE_SECONDS = float(os.getenv("MARKET_COLLECTION_DEADLINE_SECONDS", "15"))
+ROADMAP_DEADLINE_SECONDS = float(os.getenv("ROADMAP_DEADLINE_SECONDS", "90"))
+
+# Last good market profile per canonical role: the fallback while Adzuna is unavailable
+market_profile_cache = TTLCache(
+    "market_profiles",
+    ttl_seconds=float(os.getenv("MARKET_PROFILE_CACHE_TTL", "86400")),
+    max_entries=int(os.getenv("MARKET_PROFILE_CACHE_MAX_ENTRIES", "500"))
+)
+
+# Parsed resumes, keyed by content hash (the resume_id handed to clients)
+resume_store = TTLCache(
+    "parsed_resumes",
+    ttl_seconds=float(os.getenv("RESUME_STORE_TTL", "3600")),
+    max_entries=int(os.getenv("RESUME_STORE_MAX_ENTRIES", "500"))
+)
+
+# Prefix index over all skills and their variations, built once for /api/skills/suggest
+skill_names = build_normalization_table()  # lowercased name/variation -> canonical skill
+skill_index = PrefixIndex()
+for _name, _skill in skill_names.items():
+    skill_index.add(_name, _skill, {"skill": _skill, "category": get_skill_category(_skill)})
+
+# Canonical role names: every role-keyed cache, crawl and catalog lookup goes
+# through it so "python dev" and "Python Developers" share cached work
+role_canonicalizer = RoleCanonicalizer(DEFAULT_ROLES)
+
+# Every job collected live, deduplicated by source and job ID
+job_store = JobStore(DEFAULT_JOB_STORE_PATH)
+MARKET_FALLBACK_DAYS = float(os.getenv("MARKET_FALLBACK_DAYS", "30"))
+MARKET_FALLBACK_MAX_JOBS = int(os.getenv("MARKET_FALLBACK_MAX_JOBS", "500"))
+# Profiles built from stored jobs are cached for less time than live ones
+MARKET_FALLBACK_CACHE_TTL = float(os.getenv("MARKET_FALLBACK_CACHE_TTL", "900"))
+_stored_profile_inflight: Dict[str, asyncio.Future] = {}
+
+# Known target roles for autocomplete (job store, job files + saved market profiles)
+role_catalog = RoleCatalog(
+    os.getenv("MARKET_DATA_DIR", "."),
+    canonicalizer=role_canonicalizer,
+    job_store=job_store
+)
+ROLE_CATALOG_REFRESH_SECONDS = float(os.getenv("ROLE_CATALOG_REFRESH_SECONDS", "300"))
+_role_catalog_refresh: Dict[str, object] = {"at": 0.0, "task": None}
+
+# Background tasks for long-running analyses (submit/poll)
+task_queue = TaskQueue(
+    max_workers=int(os.getenv("TASK_QUEUE_WORKERS", "4")),
+    result_ttl=float(os.getenv("TASK_RESULT_TTL", "3600"))
+)
 if ROADMAP_AVAILABLE:
     try:
         gemini_key = os.getenv("GEMINI_API_KEY")
         if gemini_key:
             roadmap_builder = RoadmapBuilder(gemini_key)
-            print("✅ Roadmap Builder initialized successfully")
+            logger.info("Roadmap builder initialized")
         else:
-            print("⚠️ GEMINI_API_KEY not found - roadmap features will be disabled")
+            logger.warning("GEMINI_API_KEY not found - roadmap features will be disabled")
     except Exception as e:
-        print(f"⚠️ Could not initialize roadmap builder: {e}")
+        logger.warning("Could not initialize roadmap builder: %s", e)
+
+@app.on_event("startup")
+async def startup():
+    """Install the tracked default executor and load the role catalog off the event loop"""
+    asyncio.get_running_loop().set_default_executor(default_executor)
+    _refresh_role_catalog()
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release pooled HTTP connections and stop background work"""
+    await async_job_collector.aclose()
+    task_queue.shutdown()
+    default_executor.shutdown(wait=False)
 
 # Request/Response Models
 class ResumeUploadResponse(BaseModel):
     success: bool
+    resume_id: Optional[str] = None
     skills: List[str]
     name: Optional[str] = None
     email: Optional[str] = None
@@ -89,16 +251,32 @@ class JobDescriptionRequest(BaseModel):
     job_description: str
     job_title: Optional[str] = "Target Role"
 
+class JobDescriptionBatchRequest(BaseModel):
+    job_descriptions: List[JobDescriptionRequest]
+
 class GapAnalysisRequest(BaseModel):
+    user_skills: List[str] = []
+    resume_id: Optional[str] = None  # use the skills of an uploaded resume
+    job_description: Optional[str] = None
+    target_role: Optional[str] = None
+    use_saved_market_data: bool = False
+    market_data_file: Optional[str] = None
+
+class SkillProfile(BaseModel):
+    id: Optional[str] = None
     user_skills: List[str]
+
+class BatchGapAnalysisRequest(BaseModel):
+    profiles: List[SkillProfile]
     job_description: Optional[str] = None
     target_role: Optional[str] = None
     use_saved_market_data: bool = False
     market_data_file: Optional[str] = None
 
 class ResumeFeedbackRequest(BaseModel):
-    resume_text: str
-    skills: List[str]
+    resume_text: Optional[str] = None
+    skills: Optional[List[str]] = None
+    resume_id: Optional[str] = None  # instead of resume_text/skills
     target_role: Optional[str] = None
 
 class ResumeFeedbackResponse(BaseModel):
@@ -116,11 +294,18 @@ class RoadmapRequest(BaseModel):
 class RoadmapSkillsRequest(BaseModel):
     skills: List[str]
     level: str = "beginner"
+    stream: bool = True
+
+class TaskSubmitRequest(BaseModel):
+    kind: str
+    payload: Dict
 
 class JobSearchRequest(BaseModel):
     role: str
     location: str = "India"
     page: int = 1
+    user_skills: Optional[List[str]] = None  # rank results by skill match
+    resume_id: Optional[str] = None  # or use the skills of an uploaded resume
 
 @app.get("/")
 async def root():
@@ -131,79 +316,154 @@ async def root():
         "version": "1.0.0"
     }
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus-style metrics: routes, pipeline stages, caches, executors"""
+    return Response(content=METRICS_REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+SUPPORTED_RESUME_SUFFIXES = ('.pdf', '.docx', '.doc')
+
+def _parse_resume_bytes(content: bytes, suffix: str) -> Dict:
+    """Parse resume file contents via a temporary file"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+        tmp_file.write(content)
+        tmp_path = tmp_file.name
+    
+    logger.debug("Temp file saved at: %s", tmp_path, extra=sampled())
+    try:
+        return resume_parser.parse_file(tmp_path)
+    finally:
+        Path(tmp_path).unlink(missing_ok=True)
+
+async def _store_resume_upload(file: UploadFile) -> Tuple[str, Dict]:
+    """
+    Parse an uploaded resume once and keep it server-side
+    
+    The resume_id is the SHA-256 of the file contents, so uploading the
+    same file again reuses the stored parse.
+    
+    Returns:
+        Tuple of (resume_id, parsed resume data)
+    """
+    if not file.filename.endswith(SUPPORTED_RESUME_SUFFIXES):
+        raise HTTPException(
+            status_code=400, 
+            detail="Only PDF and DOCX files are supported"
+        )
+    
+    content = await file.read()
+    resume_id = hashlib.sha256(content).hexdigest()
+    
+    resume_data = resume_store.get(resume_id)
+    if resume_data is None:
+        loop = asyncio.get_running_loop()
+        resume_data = await loop.run_in_executor(
+            None, _parse_resume_bytes, content, Path(file.filename).suffix
+        )
+        resume_store.set(resume_id, resume_data)
+        logger.info("Parsed resume %s: %d skills", resume_id[:12], len(resume_data.get('skills', [])), extra=sampled())
+    else:
+        logger.debug("Reusing parsed resume %s", resume_id[:12], extra=sampled())
+    
+    return resume_id, resume_data
+
+def _get_stored_resume(resume_id: str) -> Dict:
+    """Look up a parsed resume by ID"""
+    resume_data = resume_store.get(resume_id)
+    if resume_data is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Resume not found or expired: {resume_id}. Upload it again via /api/upload-resume."
+        )
+    return resume_data
+
+def _resume_upload_response(resume_id: str, resume_data: Dict) -> ResumeUploadResponse:
+    return ResumeUploadResponse(
+        success=True,
+        resume_id=resume_id,
+        skills=resume_data.get('skills', []),
+        name=resume_data.get('name'),
+        email=resume_data.get('email'),
+        phone=resume_data.get('phone'),
+        experience_years=resume_data.get('experience_years'),
+        raw_text=resume_data.get('raw_text')
+    )
+
 @app.post("/api/upload-resume", response_model=ResumeUploadResponse)
-async def upload_resume(file: UploadFile = File(...)):
+async def upload_resume(
+    file: UploadFile = File(...),
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
+):
     """
     Upload and parse resume to extract skills
     Supports PDF and DOCX formats
+    
+    The parsed resume is kept server-side for a while; pass the returned
+    resume_id to /api/resume-feedback, /api/gap-analysis or /api/match-job
+    instead of sending the text or skills back.
+    Use fields/exclude (comma-separated) to trim the response,
+    e.g. exclude=raw_text
     """
-    import traceback
     try:
-        print(f"📄 Received file: {file.filename}")
+        logger.info("Resume upload: %s", file.filename, extra=sampled())
         
-        # Validate file type
-        if not file.filename.endswith(('.pdf', '.docx', '.doc')):
-            raise HTTPException(
-                status_code=400, 
-                detail="Only PDF and DOCX files are supported"
-            )
+        resume_id, resume_data = await _store_resume_upload(file)
         
-        # Save temporarily
-        suffix = Path(file.filename).suffix
-        print(f"💾 Saving temp file with suffix: {suffix}")
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
-        
-        print(f"📂 Temp file saved at: {tmp_path}")
-        
-        # Parse resume
-        print(f"🔍 Parsing resume...")
-        resume_data = resume_parser.parse_file(tmp_path)
-        print(f"✅ Parsed successfully. Found {len(resume_data.get('skills', []))} skills")
-        
-        # Clean up temp file
-        Path(tmp_path).unlink()
-        
-        return ResumeUploadResponse(
-            success=True,
-            skills=resume_data.get('skills', []),
-            name=resume_data.get('name'),
-            email=resume_data.get('email'),
-            phone=resume_data.get('phone'),
-            experience_years=resume_data.get('experience_years'),
-            raw_text=resume_data.get('raw_text')
-        )
+        return projected_response(_resume_upload_response(resume_id, resume_data), fields, exclude)
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ ERROR: {str(e)}")
-        print(traceback.format_exc())
-        # Clean up temp file if exists
-        if 'tmp_path' in locals():
-            try:
-                Path(tmp_path).unlink()
-            except:
-                pass
+        logger.exception("Error parsing resume: %s", e)
         raise HTTPException(status_code=500, detail=f"Error parsing resume: {str(e)}")
 
+@app.get("/api/resumes/{resume_id}", response_model=ResumeUploadResponse)
+async def get_resume(
+    request: Request,
+    resume_id: str,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
+):
+    """
+    Get a previously uploaded, parsed resume
+    
+    The resume_id is a content hash, so it doubles as the ETag
+    (If-None-Match -> 304).
+    """
+    resume_data = _get_stored_resume(resume_id)
+    return conditional_response(
+        request,
+        make_etag(resume_id, fields, exclude),
+        lambda: projected_response(_resume_upload_response(resume_id, resume_data), fields, exclude)
+    )
+
 @app.post("/api/resume-feedback", response_model=ResumeFeedbackResponse)
 async def analyze_resume_feedback(request: ResumeFeedbackRequest):
     """
     Analyze resume and provide smart feedback & improvement suggestions
     """
-    import traceback
+    resume_text, skills = request.resume_text, request.skills
+    if request.resume_id:
+        resume_data = _get_stored_resume(request.resume_id)
+        resume_text = resume_text if resume_text is not None else resume_data.get('raw_text', '')
+        skills = skills if skills is not None else resume_data.get('skills', [])
+    
+    if resume_text is None or skills is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Please provide either a resume_id or resume_text and skills."
+        )
+    
     try:
-        print(f"📋 Analyzing resume for feedback...")
-        
         # Analyze resume with target role context
         feedback = feedback_analyzer.analyze_resume(
-            resume_text=request.resume_text,
-            skills=request.skills,
+            resume_text=resume_text,
+            skills=skills,
             target_role=request.target_role
         )
         
-        print(f"✅ Resume feedback analysis complete. Overall score: {feedback['overall_score']}")
+        logger.info("Resume feedback complete: overall score %s", feedback['overall_score'], extra=sampled())
         
         return ResumeFeedbackResponse(
             overall_score=feedback['overall_score'],
@@ -215,8 +475,7 @@ async def analyze_resume_feedback(request: ResumeFeedbackRequest):
         )
         
     except Exception as e:
-        print(f"❌ ERROR analyzing resume feedback: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error analyzing resume feedback: %s", e)
         raise HTTPException(status_code=500, detail=f"Error analyzing resume: {str(e)}")
 
 @app.post("/api/analyze-job-description")
@@ -237,8 +496,288 @@ async def analyze_job_description(request: JobDescriptionRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analyzing job description: {str(e)}")
 
+MAX_BATCH_JOB_DESCRIPTIONS = int(os.getenv("MAX_BATCH_JOB_DESCRIPTIONS", "100"))
+
+def _analyze_job_description_batch(job_descriptions: List[JobDescriptionRequest]) -> Dict:
+    """Extract all descriptions in one batched pass and aggregate their demand"""
+    skill_lists = skill_extractor.extract_from_texts([jd.job_description for jd in job_descriptions])
+    
+    state = skill_extractor.new_demand_state()
+    results = []
+    for index, (jd, skills) in enumerate(zip(job_descriptions, skill_lists)):
+        skill_extractor.record_job_skills(state, skills, source='job_description')
+        results.append({
+            "index": index,
+            "job_title": jd.job_title,
+            "required_skills": skills,
+            "total_skills": len(skills)
+        })
+    
+    return {
+        "total_job_descriptions": len(results),
+        "job_descriptions": results,
+        "market_demand": skill_extractor.build_demand(state)
+    }
+
+@app.post("/api/analyze-job-descriptions")
+async def analyze_job_descriptions(
+    request: JobDescriptionBatchRequest,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
+):
+    """
+    Extract required skills from many job descriptions at once
+    
+    Returns the skills of each job description plus market_demand, the
+    aggregated skill frequencies in the same shape as
+    SkillExtractor.analyze_jobs (market_demand.skills can be used directly
+    as market skills for gap analysis).
+    """
+    if not request.job_descriptions:
+        raise HTTPException(status_code=400, detail="Please provide at least one job description.")
+    if len(request.job_descriptions) > MAX_BATCH_JOB_DESCRIPTIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_JOB_DESCRIPTIONS} job descriptions per request."
+        )
+    
+    try:
+        logger.info("Analyzing %d job descriptions", len(request.job_descriptions), extra=sampled())
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, _analyze_job_description_batch, request.job_descriptions)
+        
+        return project_fields(result, fields, exclude)
+        
+    except Exception as e:
+        logger.exception("Error analyzing job descriptions: %s", e)
+        raise HTTPException(status_code=500, detail=f"Error analyzing job descriptions: {str(e)}")
+
+def _job_description_market_skills(job_description: str) -> List[Dict]:
+    """Convert skills extracted from a job description to market skills format"""
+    return _required_skills_market(skill_extractor.extract_from_text(job_description))
+
+def _required_skills_market(required_skills_set: List[str]) -> List[Dict]:
+    """Market skills format for the required skills of one job"""
+    return [
+        {
+            "skill": skill,
+            "percentage": 100.0,  # Job description = 100% required
+            "count": 1,
+            "demand_level": "Critical"
+        }
+        for skill in required_skills_set
+    ]
+
+def _persist_jobs(jobs: List[Dict]):
+    """Upsert live-collected jobs into the job store in the background"""
+    if not jobs:
+        return
+    def log_failure(future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning("Could not store collected jobs: %s", future.exception())
+    
+    asyncio.get_running_loop().run_in_executor(None, job_store.upsert, jobs).add_done_callback(log_failure)
+
+def _stored_market_skills(target_role: str) -> Optional[List[Dict]]:
+    """Market skills from the role's recent jobs in the job store, if any"""
+    if job_store.count(role=target_role, days=MARKET_FALLBACK_DAYS) == 0:
+        return None
+    analysis = skill_extractor.analyze_stored_jobs(
+        job_store, role=target_role, days=MARKET_FALLBACK_DAYS, limit=MARKET_FALLBACK_MAX_JOBS
+    )
+    return analysis['skills']
+
+async def _fallback_market_skills(target_role: str) -> List[Dict]:
+    """
+    Market skills for a role when no live jobs could be collected
+    
+    Uses the last live profile for the role, then the role's stored jobs
+    from the last MARKET_FALLBACK_DAYS days, then a saved market profile
+    file. Raises 503 if Adzuna is unavailable and none exists, else 404.
+    """
+    role_key = role_canonicalizer.key(target_role)
+    market_skills = market_profile_cache.get(role_key)
+    if market_skills is None:
+        # One analysis per role at a time; concurrent requests share it
+        future = _stored_profile_inflight.get(role_key)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(
+                None, _stored_market_skills, role_canonicalizer.canonicalize(target_role)
+            )
+            _stored_profile_inflight[role_key] = future
+            future.add_done_callback(lambda _: _stored_profile_inflight.pop(role_key, None))
+        try:
+            market_skills = await asyncio.shield(future)
+        except Exception as e:
+            logger.warning("Could not analyze stored jobs for %s: %s", target_role, e)
+        if market_skills is not None:
+            market_profile_cache.set(role_key, market_skills, ttl_seconds=MARKET_FALLBACK_CACHE_TTL)
+    if market_skills is None:
+        profile_path = role_catalog.profile_path(target_role)
+        if profile_path is not None:
+            try:
+                market_skills = load_market_analysis(str(profile_path))
+            except Exception as e:
+                logger.warning("Could not load saved profile %s: %s", profile_path, e)
+    
+    if market_skills is not None:
+        logger.warning("No live jobs for %s (Adzuna circuit %s); using cached market profile",
+                       target_role, async_job_collector.adzuna_breaker.state)
+        return market_skills
+    
+    breaker = async_job_collector.adzuna_breaker
+    if breaker.state == OPEN:
+        raise HTTPException(
+            status_code=503,
+            detail="Job market data is temporarily unavailable. Please try again shortly.",
+            headers={"Retry-After": str(max(1, int(breaker.retry_after())))}
+        )
+    raise HTTPException(
+        status_code=404,
+        detail=f"No jobs found for role: {target_role}. Try a different role name."
+    )
+
+async def _resolve_market_skills(
+    job_description: Optional[str],
+    target_role: Optional[str],
+    use_saved: bool
+):
+    """
+    Determine the market skills to compare against
+    
+    Returns:
+        Tuple of (market_skills, role_name)
+    """
+    loop = asyncio.get_running_loop()
+    if job_description:
+        logger.debug("Using job description for market skills", extra=sampled())
+        # Extract skills from provided job description
+        market_skills = await loop.run_in_executor(None, _job_description_market_skills, job_description)
+        return market_skills, target_role or "Target Job"
+    
+    elif target_role and not use_saved:
+        # Collect real-time jobs for the target role
+        logger.info("Collecting real-time jobs for: %s", target_role, extra=sampled())
+        jobs = await async_job_collector.collect_from_adzuna_async(
+            role_canonicalizer.canonicalize(target_role),
+            pages=2,  # 2 pages = ~100 jobs
+            deadline=Deadline(MARKET_COLLECTION_DEADLINE_SECONDS)
+        )
+        
+        if not jobs or len(jobs) == 0:
+            return await _fallback_market_skills(target_role), target_role
+        
+        logger.debug("Collected %d jobs, analyzing skills", len(jobs), extra=sampled())
+        
+        # Analyze jobs to extract skills
+        analysis_result = await loop.run_in_executor(None, skill_extractor.analyze_jobs, jobs)
+        market_skills = analysis_result['skills']  # Get the skills list from the analysis result
+        
+        logger.info("Market profile for %s: %d jobs, %d skills", target_role, len(jobs), len(market_skills), extra=sampled())
+        role_catalog.record_collection(target_role, len(jobs))
+        _persist_jobs(jobs)
+        market_profile_cache.set(role_canonicalizer.key(target_role), market_skills)
+        return market_skills, target_role
+        
+    elif use_saved:
+        raise HTTPException(
+            status_code=400,
+            detail="Saved market data feature not yet implemented. Please use real-time analysis."
+        )
+        
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail="Please provide either a target_role or job_description for analysis."
+        )
+
+def _format_gap_response(analysis: Dict) -> Dict:
+    """Restructure gap analysis results to match frontend expectations"""
+    readiness_data = analysis.get('readiness_score', {})
+    
+    def format_gaps(priority: str, default_level: str) -> List[Dict]:
+        return [
+            {
+                'skill': s['skill'],
+                'percentage': s.get('demand_percentage', 0),
+                'demand_level': s.get('priority', default_level)
+            }
+            for s in analysis.get('skill_gaps', {}).get(priority, [])
+        ]
+    
+    return {
+        'target_role': analysis.get('target_role'),
+        'match_percentage': analysis.get('match_percentage', 0),
+        'readiness_score': readiness_data.get('score', 0),
+        'overall_readiness': readiness_data.get('level', 'Unknown'),
+        'readiness_message': readiness_data.get('message', ''),
+        'total_required_skills': analysis.get('total_required_skills', 0),
+        'user_skills_count': analysis.get('user_skills_count', 0),
+        'matched_skills_count': analysis.get('matched_skills_count', 0),
+        'missing_skills_count': analysis.get('missing_skills_count', 0),
+        'matched_skills': analysis.get('matched_skills', []),
+        'matched_skills_detailed': [
+            {
+                'skill': s['skill'],
+                'percentage': s.get('demand_percentage', 0),
+                'market_demand': s.get('demand_level', 'Unknown'),
+                'user_level': 'Present'
+            }
+            for s in analysis.get('matched_skills_detailed', [])
+        ],
+        'skill_gaps': {
+            'critical': format_gaps('critical', 'Critical'),
+            'high': format_gaps('high', 'High'),
+            'medium': format_gaps('medium', 'Medium'),
+            'low': format_gaps('low', 'Low')
+        },
+        'total_gaps_by_priority': analysis.get('total_gaps_by_priority', {}),
+        'recommendations': analysis.get('recommendations', []),
+        'extra_skills': analysis.get('extra_skills', [])
+    }
+
+def _request_user_skills(request: GapAnalysisRequest) -> List[str]:
+    """User skills of a gap analysis request (from its resume_id if given)"""
+    if request.resume_id:
+        return _get_stored_resume(request.resume_id).get('skills', [])
+    return request.user_skills if isinstance(request.user_skills, list) else []
+
+async def _run_gap_analysis(request: GapAnalysisRequest) -> Dict:
+    """Run a gap analysis request and return the formatted response"""
+    parsed_skills = _request_user_skills(request)
+    target_role = request.target_role
+    
+    logger.info("Gap analysis request - target role: %s, user skills: %d",
+                target_role, len(parsed_skills) if isinstance(parsed_skills, list) else 0, extra=sampled())
+    
+    user_skills_list = parsed_skills if isinstance(parsed_skills, list) else []
+    
+    # Determine market skills source
+    market_skills, role_name = await _resolve_market_skills(
+        request.job_description,
+        target_role,
+        request.use_saved_market_data
+    )
+    
+    # Perform gap analysis using your existing logic (off the event loop)
+    analysis = await asyncio.get_running_loop().run_in_executor(
+        None,
+        lambda: gap_analyzer.analyze_gap(
+            user_skills=user_skills_list,
+            market_skills=market_skills,
+            target_role=role_name
+        )
+    )
+    
+    return _format_gap_response(analysis)
+
 @app.post("/api/gap-analysis")
-async def perform_gap_analysis(request: GapAnalysisRequest):
+async def perform_gap_analysis(
+    request: GapAnalysisRequest,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None,
+    background: bool = False
+):
     """
     Perform skill gap analysis
     Can compare against:
@@ -246,170 +785,242 @@ async def perform_gap_analysis(request: GapAnalysisRequest):
     2. Real-time market data (collect jobs for role)
     3. Saved market analysis data
     
-    Accepts JSON request body
+    Accepts JSON request body. Use fields/exclude (comma-separated, dotted
+    for nested keys) to trim the response, e.g. exclude=skill_gaps.low.
+    With background=true a task is queued and its ID returned (202);
+    poll /api/tasks/{task_id}.
     """
-    import traceback
+    if background:
+        return _submit_task("gap-analysis", request, fields, exclude)
+    
     try:
-        parsed_skills = request.user_skills
-        target_role = request.target_role
-        job_description = request.job_description
-        use_saved = request.use_saved_market_data
-            
-        print(f"🎯 Gap analysis request - Target role: {target_role}")
-        print(f"📊 User skills count: {len(parsed_skills) if isinstance(parsed_skills, list) else 0}")
-        
-        user_skills_list = parsed_skills if isinstance(parsed_skills, list) else []
-        job_desc_text = job_description
-        
-        # Determine market skills source
-        if job_desc_text:
-            print(f"📝 Using job description (text or PDF)")
-            # Extract skills from provided job description
-            required_skills_set = skill_extractor.extract_from_text(job_desc_text)
-            role_name = target_role or "Target Job"
-            
-            # Convert to market skills format expected by gap_analyzer
-            market_skills = [
-                {
-                    "skill": skill,
-                    "percentage": 100.0,  # Job description = 100% required
-                    "count": 1,
-                    "demand_level": "Critical"
-                }
-                for skill in required_skills_set
-            ]
-            
-        elif target_role and not use_saved:
-            # Collect real-time jobs for the target role
-            print(f"🌐 Collecting real-time jobs for: {target_role}")
-            jobs = job_collector.collect_from_adzuna(target_role, pages=2)  # 2 pages = ~100 jobs
-            
-            if not jobs or len(jobs) == 0:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"No jobs found for role: {target_role}. Try a different role name."
-                )
-            
-            print(f"✅ Collected {len(jobs)} jobs. Analyzing skills...")
-            
-            # Analyze jobs to extract skills
-            analysis_result = skill_extractor.analyze_jobs(jobs)
-            market_skills = analysis_result['skills']  # Get the skills list from the analysis result
-            role_name = target_role
-            
-            print(f"✅ Found {len(market_skills)} market skills")
-            
-        elif use_saved:
-            print(f"📂 Using saved market data - feature not yet implemented")
-            raise HTTPException(
-                status_code=400,
-                detail="Saved market data feature not yet implemented. Please use real-time analysis."
-            )
-            
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail="Please provide either a target_role or job_description for analysis."
-            )
+        return project_fields(await _run_gap_analysis(request), fields, exclude)
         
-        # Perform gap analysis using your existing logic
-        print(f"🔍 Performing gap analysis...")
-        analysis = gap_analyzer.analyze_gap(
-            user_skills=user_skills_list,
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error in gap analysis: %s", e)
+        raise HTTPException(status_code=500, detail=f"Error performing gap analysis: {str(e)}")
+
+async def _run_gap_analysis_batch(
+    request: BatchGapAnalysisRequest,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
+) -> Dict:
+    """Run a batch gap analysis request and return the formatted response"""
+    logger.info("Batch gap analysis request - target role: %s, profiles: %d",
+                request.target_role, len(request.profiles), extra=sampled())
+    
+    market_skills, role_name = await _resolve_market_skills(
+        request.job_description,
+        request.target_role,
+        request.use_saved_market_data
+    )
+    
+    analyses = await asyncio.get_running_loop().run_in_executor(
+        None,
+        lambda: gap_analyzer.analyze_gap_batch(
+            user_skill_lists=[profile.user_skills for profile in request.profiles],
             market_skills=market_skills,
             target_role=role_name
         )
-        
-        # Restructure response to match frontend expectations
-        readiness_data = analysis.get('readiness_score', {})
-        
-        response = {
-            'target_role': analysis.get('target_role'),
-            'match_percentage': analysis.get('match_percentage', 0),
-            'readiness_score': readiness_data.get('score', 0),
-            'overall_readiness': readiness_data.get('level', 'Unknown'),
-            'readiness_message': readiness_data.get('message', ''),
-            'total_required_skills': analysis.get('total_required_skills', 0),
-            'user_skills_count': analysis.get('user_skills_count', 0),
-            'matched_skills_count': analysis.get('matched_skills_count', 0),
-            'missing_skills_count': analysis.get('missing_skills_count', 0),
-            'matched_skills': analysis.get('matched_skills', []),
-            'matched_skills_detailed': [
-                {
-                    'skill': s['skill'],
-                    'percentage': s.get('demand_percentage', 0),
-                    'market_demand': s.get('demand_level', 'Unknown'),
-                    'user_level': 'Present'
-                }
-                for s in analysis.get('matched_skills_detailed', [])
-            ],
-            'skill_gaps': {
-                'critical': [
-                    {
-                        'skill': s['skill'],
-                        'percentage': s.get('demand_percentage', 0),
-                        'demand_level': s.get('priority', 'Critical')
-                    }
-                    for s in analysis.get('skill_gaps', {}).get('critical', [])
-                ],
-                'high': [
-                    {
-                        'skill': s['skill'],
-                        'percentage': s.get('demand_percentage', 0),
-                        'demand_level': s.get('priority', 'High')
-                    }
-                    for s in analysis.get('skill_gaps', {}).get('high', [])
-                ],
-                'medium': [
-                    {
-                        'skill': s['skill'],
-                        'percentage': s.get('demand_percentage', 0),
-                        'demand_level': s.get('priority', 'Medium')
-                    }
-                    for s in analysis.get('skill_gaps', {}).get('medium', [])
-                ],
-                'low': [
-                    {
-                        'skill': s['skill'],
-                        'percentage': s.get('demand_percentage', 0),
-                        'demand_level': s.get('priority', 'Low')
-                    }
-                    for s in analysis.get('skill_gaps', {}).get('low', [])
-                ]
-            },
-            'total_gaps_by_priority': analysis.get('total_gaps_by_priority', {}),
-            'recommendations': analysis.get('recommendations', []),
-            'extra_skills': analysis.get('extra_skills', [])
-        }
-        
-        print(f"✅ Gap analysis complete!")
-        return response
+    )
+    
+    results = []
+    for index, (profile, analysis) in enumerate(zip(request.profiles, analyses)):
+        result = project_fields(_format_gap_response(analysis), fields, exclude)
+        result['id'] = profile.id if profile.id is not None else str(index)
+        results.append(result)
+    
+    return {
+        "target_role": role_name,
+        "total_profiles": len(results),
+        "results": results
+    }
+
+@app.post("/api/gap-analysis-batch")
+async def perform_gap_analysis_batch(
+    request: BatchGapAnalysisRequest,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None,
+    background: bool = False
+):
+    """
+    Perform skill gap analysis for many skill profiles against one market profile
+    
+    The market skills are resolved and prepared once (same sources as
+    /api/gap-analysis), then every profile is scored in a single pass.
+    Each result has the same shape as the /api/gap-analysis response;
+    fields/exclude apply to each result. Supports background=true.
+    """
+    if background:
+        return _submit_task("gap-analysis-batch", request, fields, exclude)
+    
+    try:
+        return await _run_gap_analysis_batch(request, fields, exclude)
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ ERROR in gap analysis: {str(e)}")
-        import traceback
-        print(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Error performing gap analysis: {str(e)}")
+        logger.exception("Error in batch gap analysis: %s", e)
+        raise HTTPException(status_code=500, detail=f"Error performing batch gap analysis: {str(e)}")
+
+# ============================================
+# PROGRESS STREAMING
+# ============================================
+
+def _sse_event(event: str, data: Dict) -> str:
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+async def _run_with_progress(func: Callable, *args) -> AsyncIterator[Tuple[str, object]]:
+    """
+    Run func(*args, progress_callback) in the default executor
+    
+    Yields ('progress', event) for every event the function reports while
+    it runs, then ('done', result).
+    """
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+    
+    def report(event: Dict):
+        loop.call_soon_threadsafe(events.put_nowait, event)
+    
+    future = loop.run_in_executor(None, func, *args, report)
+    getter = None
+    try:
+        while True:
+            getter = asyncio.ensure_future(events.get())
+            done, _ = await asyncio.wait({future, getter}, return_when=asyncio.FIRST_COMPLETED)
+            if getter not in done:
+                break
+            yield 'progress', getter.result()
+        
+        # Events reported just before completion are already queued
+        while not events.empty():
+            yield 'progress', events.get_nowait()
+        
+        yield 'done', future.result()
+    finally:
+        if getter is not None:
+            getter.cancel()
+
+async def _gap_analysis_events(
+    request: GapAnalysisRequest,
+    fields: Optional[str],
+    exclude: Optional[str]
+) -> AsyncIterator[str]:
+    """SSE stream for /api/gap-analysis/stream"""
+    try:
+        if request.job_description or request.use_saved_market_data or not request.target_role:
+            # Nothing to collect: the analysis is immediate
+            result = await _run_gap_analysis(request)
+            yield _sse_event('result', project_fields(result, fields, exclude))
+            return
+        
+        target_role = request.target_role
+        user_skills_list = _request_user_skills(request)
+        pages = 2  # 2 pages = ~100 jobs, as in /api/gap-analysis
+        
+        logger.info("Streaming gap analysis for: %s", target_role, extra=sampled())
+        
+        state = skill_extractor.new_demand_state()
+        report = None
+        jobs_collected = 0
+        
+        async for page, page_jobs in async_job_collector.iter_adzuna_pages(
+            role_canonicalizer.canonicalize(target_role), pages=pages, deadline=Deadline(MARKET_COLLECTION_DEADLINE_SECONDS)
+        ):
+            jobs_collected += len(page_jobs)
+            _persist_jobs(page_jobs)
+            yield _sse_event('progress', async_job_collector.page_event(page, pages, len(page_jobs), jobs_collected))
+            
+            # Analyse this page while later pages are still downloading
+            async for kind, event in _run_with_progress(skill_extractor.update_demand, state, page_jobs):
+                if kind == 'progress':
+                    yield _sse_event('progress', {**event, 'page': page})
+            
+            analysis = gap_analyzer.analyze_gap(
+                user_skills=user_skills_list,
+                market_skills=skill_extractor.build_demand(state)['skills'],
+                target_role=target_role
+            )
+            report = {
+                **project_fields(_format_gap_response(analysis), fields, exclude),
+                'jobs_analyzed': state['total_jobs']
+            }
+            yield _sse_event('partial', report)
+        
+        if report is None:
+            # Nothing collected live: report against the cached profile
+            analysis = gap_analyzer.analyze_gap(
+                user_skills=user_skills_list,
+                market_skills=await _fallback_market_skills(target_role),
+                target_role=target_role
+            )
+            report = {
+                **project_fields(_format_gap_response(analysis), fields, exclude),
+                'jobs_analyzed': 0,
+                'market_data': 'cached'
+            }
+        else:
+            role_catalog.record_collection(target_role, state['total_jobs'])
+            market_profile_cache.set(role_canonicalizer.key(target_role), skill_extractor.build_demand(state)['skills'])
+        
+        yield _sse_event('result', report)
+        
+    except HTTPException as e:
+        yield _sse_event('error', {'status_code': e.status_code, 'detail': e.detail})
+    except Exception as e:
+        logger.exception("Error in streaming gap analysis: %s", e)
+        yield _sse_event('error', {'status_code': 500, 'detail': f"Error performing gap analysis: {str(e)}"})
+
+@app.post("/api/gap-analysis/stream")
+async def stream_gap_analysis(
+    request: GapAnalysisRequest,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
+):
+    """
+    Gap analysis with live progress, as Server-Sent Events
+    
+    For real-time market analysis (target_role without job_description)
+    the stream carries:
+    - progress: {"stage": "collect", page, pages, page_jobs, jobs_collected}
+      per collected page and {"stage": "analyze", page, processed, total}
+      per analysed batch
+    - partial: provisional gap report after each analysed page (same shape
+      as /api/gap-analysis, plus jobs_analyzed)
+    - result: the final gap report
+    - error: {status_code, detail}
+    
+    Other sources send the result straight away. fields/exclude apply to
+    partial and final reports.
+    """
+    return StreamingResponse(
+        _gap_analysis_events(request, fields, exclude),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.post("/api/gap-analysis-with-pdf")
 async def perform_gap_analysis_with_pdf(
     user_skills: str = Form(...),
     target_role: Optional[str] = Form(None),
     job_description_file: UploadFile = File(...),
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
 ):
     """
     Perform skill gap analysis with job description from PDF file
+    Supports the same fields/exclude projection as /api/gap-analysis
     """
-    import traceback
     try:
         # Parse user skills from JSON string
         parsed_skills = json.loads(user_skills) if isinstance(user_skills, str) else user_skills
         
-        print(f"🎯 Gap analysis (PDF) - Target role: {target_role}")
-        print(f"📊 User skills count: {len(parsed_skills)}")
-        print(f"📄 Processing job description PDF: {job_description_file.filename}")
+        logger.info("Gap analysis (PDF) - target role: %s, user skills: %d, file: %s",
+                    target_role, len(parsed_skills), job_description_file.filename, extra=sampled())
         
         # Save uploaded file temporarily
         with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
@@ -419,297 +1030,652 @@ async def perform_gap_analysis_with_pdf(
         
         try:
             # Extract text from PDF
-            with open(temp_path, 'rb') as pdf_file:
+            with stage_timer('pdf_extraction'), open(temp_path, 'rb') as pdf_file:
                 pdf_reader = PyPDF2.PdfReader(pdf_file)
                 job_desc_text = ""
                 for page in pdf_reader.pages:
                     job_desc_text += page.extract_text() + "\n"
-            print(f"✅ Extracted {len(job_desc_text)} characters from job description PDF")
+            logger.debug("Extracted %d characters from job description PDF", len(job_desc_text), extra=sampled())
         finally:
             # Clean up temp file
             os.unlink(temp_path)
         
         # Extract skills from job description
-        print(f"📝 Using job description from PDF")
-        required_skills_set = skill_extractor.extract_from_text(job_desc_text)
+        market_skills = _job_description_market_skills(job_desc_text)
         role_name = target_role or "Target Job"
         
-        # Convert to market skills format
-        market_skills = [
-            {
-                "skill": skill,
-                "percentage": 100.0,
-                "count": 1,
-                "demand_level": "Critical"
-            }
-            for skill in required_skills_set
-        ]
-        
         # Perform gap analysis
-        print(f"🔍 Performing gap analysis...")
         analysis = gap_analyzer.analyze_gap(
             user_skills=parsed_skills,
             market_skills=market_skills,
             target_role=role_name
         )
         
-        # Restructure response
-        readiness_data = analysis.get('readiness_score', {})
-        
-        response = {
-            'target_role': analysis.get('target_role'),
-            'match_percentage': analysis.get('match_percentage', 0),
-            'readiness_score': readiness_data.get('score', 0),
-            'overall_readiness': readiness_data.get('level', 'Unknown'),
-            'readiness_message': readiness_data.get('message', ''),
-            'total_required_skills': analysis.get('total_required_skills', 0),
-            'user_skills_count': analysis.get('user_skills_count', 0),
-            'matched_skills_count': analysis.get('matched_skills_count', 0),
-            'missing_skills_count': analysis.get('missing_skills_count', 0),
-            'matched_skills': analysis.get('matched_skills', []),
-            'matched_skills_detailed': [
-                {
-                    'skill': s['skill'],
-                    'percentage': s.get('demand_percentage', 0),
-                    'market_demand': s.get('demand_level', 'Unknown'),
-                    'user_level': 'Present'
-                }
-                for s in analysis.get('matched_skills_detailed', [])
-            ],
-            'skill_gaps': {
-                'critical': [
-                    {
-                        'skill': s['skill'],
-                        'percentage': s.get('demand_percentage', 0),
-                        'demand_level': s.get('priority', 'Critical')
-                    }
-                    for s in analysis.get('skill_gaps', {}).get('critical', [])
-                ],
-                'high': [
-                    {
-                        'skill': s['skill'],
-                        'percentage': s.get('demand_percentage', 0),
-                        'demand_level': s.get('priority', 'High')
-                    }
-                    for s in analysis.get('skill_gaps', {}).get('high', [])
-                ],
-                'medium': [
-                    {
-                        'skill': s['skill'],
-                        'percentage': s.get('demand_percentage', 0),
-                        'demand_level': s.get('priority', 'Medium')
-                    }
-                    for s in analysis.get('skill_gaps', {}).get('medium', [])
-                ],
-                'low': [
-                    {
-                        'skill': s['skill'],
-                        'percentage': s.get('demand_percentage', 0),
-                        'demand_level': s.get('priority', 'Low')
-                    }
-                    for s in analysis.get('skill_gaps', {}).get('low', [])
-                ]
-            },
-            'total_gaps_by_priority': analysis.get('total_gaps_by_priority', {}),
-            'recommendations': analysis.get('recommendations', []),
-            'extra_skills': analysis.get('extra_skills', [])
-        }
+        response = project_fields(_format_gap_response(analysis), fields, exclude)
         
-        print(f"✅ Gap analysis complete!")
         return response
         
     except Exception as e:
-        print(f"❌ ERROR in gap analysis with PDF: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error in gap analysis with PDF: %s", e)
         raise HTTPException(status_code=500, detail=f"Error performing gap analysis: {str(e)}")
 
 from fastapi import Form
 
+def _match_readiness(match_percentage: float) -> Tuple[str, str]:
+    """Readiness label and recommendation for a job match percentage"""
+    if match_percentage >= 80:
+        return "Excellent", "Apply now - You're a great fit!"
+    elif match_percentage >= 60:
+        return "Good", "Strong candidate - Highlight matching skills"
+    elif match_percentage >= 40:
+        return "Fair", "Consider upskilling critical gaps first"
+    else:
+        return "Needs Work", "Significant upskilling required"
+
+def _score_job_match(user_skills: List[str], required_skills: List[str]) -> Dict:
+    """Score a resume against one job's required skills with GapAnalyzer matching"""
+    analysis = gap_analyzer.analyze_gap(
+        user_skills=user_skills,
+        market_skills=_required_skills_market(required_skills)
+    )
+    readiness, recommendation = _match_readiness(analysis['match_percentage'])
+    
+    return {
+        "match_percentage": analysis['match_percentage'],
+        "readiness": readiness,
+        "recommendation": recommendation,
+        "matched_skills": analysis['matched_skills'],
+        "missing_skills": sorted(gap['skill'] for gap in analysis['skill_gaps']['critical']),
+        "total_required": analysis['total_required_skills'],
+        "total_matched": analysis['matched_skills_count']
+    }
+
 @app.post("/api/match-job")
 async def match_specific_job(
-    resume_file: UploadFile = File(...),
-    job_description: str = Form(...)
+    resume_file: Optional[UploadFile] = File(None),
+    job_description: str = Form(...),
+    resume_id: Optional[str] = Form(None)
 ):
     """
     Complete workflow: Upload resume and match against job description
+    
+    Pass resume_id (from /api/upload-resume) instead of resume_file to
+    reuse an already parsed resume.
     """
-    import traceback
+    if resume_file is None and not resume_id:
+        raise HTTPException(status_code=400, detail="Please provide either a resume_file or a resume_id.")
+    
     try:
-        print(f"📄 Match job - Received file: {resume_file.filename}")
-        print(f"📝 Job description length: {len(job_description) if job_description else 0}")
-        
-        # Step 1: Parse resume
-        suffix = Path(resume_file.filename).suffix
-        print(f"💾 Saving temp file...")
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-            content = await resume_file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
+        logger.info("Match job - resume: %s, job description length: %d",
+                    resume_id or resume_file.filename, len(job_description) if job_description else 0, extra=sampled())
         
-        print(f"🔍 Parsing resume from: {tmp_path}")
-        resume_data = resume_parser.parse_file(tmp_path)
-        Path(tmp_path).unlink()
+        # Step 1: Parse resume (or reuse the stored parse)
+        if resume_id:
+            resume_data = _get_stored_resume(resume_id)
+        else:
+            resume_id, resume_data = await _store_resume_upload(resume_file)
         
         user_skills = resume_data.get('skills', [])
-        print(f"✅ Found {len(user_skills)} user skills")
         
         # Step 2: Extract skills from job description
-        print(f"🔍 Extracting skills from job description...")
         required_skills = skill_extractor.extract_from_text(job_description)
-        print(f"✅ Found {len(required_skills)} required skills")
-        
-        # Step 3: Calculate match
-        user_skills_set = set(user_skills)
-        required_skills_set = set(required_skills)
-        
-        matched = user_skills_set.intersection(required_skills_set)
-        missing = required_skills_set - user_skills_set
-        
-        match_percentage = (len(matched) / len(required_skills_set) * 100) if required_skills_set else 0
-        
-        # Determine readiness
-        if match_percentage >= 80:
-            readiness = "Excellent"
-            recommendation = "Apply now - You're a great fit!"
-        elif match_percentage >= 60:
-            readiness = "Good"
-            recommendation = "Strong candidate - Highlight matching skills"
-        elif match_percentage >= 40:
-            readiness = "Fair"
-            recommendation = "Consider upskilling critical gaps first"
+        
+        # Step 3: Calculate match (variation-aware)
+        match = _score_job_match(user_skills, required_skills)
+        
+        logger.info("Match complete: %.1f%% (%d user skills, %d required)",
+                    match['match_percentage'], len(user_skills), match['total_required'], extra=sampled())
+        
+        return {
+            "resume_id": resume_id,
+            **match,
+            "user_name": resume_data.get('name')
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error in match_job: %s", e)
+        raise HTTPException(status_code=500, detail=f"Error matching job: {str(e)}")
+
+def _match_job_batch(user_skills: List[str], job_descriptions: List[JobDescriptionRequest]) -> List[Dict]:
+    """Extract all job descriptions in one pass and rank them by match"""
+    skill_lists = skill_extractor.extract_from_texts([jd.job_description for jd in job_descriptions])
+    
+    matches = [
+        {
+            "index": index,
+            "job_title": jd.job_title,
+            **_score_job_match(user_skills, required_skills)
+        }
+        for index, (jd, required_skills) in enumerate(zip(job_descriptions, skill_lists))
+    ]
+    matches.sort(key=lambda match: match['match_percentage'], reverse=True)
+    return matches
+
+@app.post("/api/match-jobs")
+async def match_multiple_jobs(
+    job_descriptions: str = Form(...),
+    resume_file: Optional[UploadFile] = File(None),
+    resume_id: Optional[str] = Form(None),
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
+):
+    """
+    Match one resume against many job descriptions, ranked by match
+    
+    job_descriptions is a JSON list of strings or of
+    {"job_description": ..., "job_title": ...} objects. The resume is
+    parsed once (or taken from resume_id) and all descriptions are
+    extracted in one batch. Each match has the /api/match-job fields plus
+    the description's index and job_title. fields/exclude apply per match.
+    """
+    if resume_file is None and not resume_id:
+        raise HTTPException(status_code=400, detail="Please provide either a resume_file or a resume_id.")
+    
+    try:
+        parsed = json.loads(job_descriptions)
+        if not isinstance(parsed, list):
+            raise ValueError("expected a JSON list")
+        jd_requests = [
+            JobDescriptionRequest(job_description=item) if isinstance(item, str)
+            else JobDescriptionRequest.model_validate(item)
+            for item in parsed
+        ]
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid job_descriptions: {str(e)}")
+    
+    if not jd_requests:
+        raise HTTPException(status_code=400, detail="Please provide at least one job description.")
+    if len(jd_requests) > MAX_BATCH_JOB_DESCRIPTIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_JOB_DESCRIPTIONS} job descriptions per request."
+        )
+    
+    try:
+        if resume_id:
+            resume_data = _get_stored_resume(resume_id)
         else:
-            readiness = "Needs Work"
-            recommendation = "Significant upskilling required"
+            resume_id, resume_data = await _store_resume_upload(resume_file)
+        
+        user_skills = resume_data.get('skills', [])
+        logger.info("Matching resume against %d job descriptions", len(jd_requests), extra=sampled())
         
-        print(f"✅ Match complete: {match_percentage:.1f}%")
+        loop = asyncio.get_running_loop()
+        matches = await loop.run_in_executor(None, _match_job_batch, user_skills, jd_requests)
         
         return {
-            "match_percentage": round(match_percentage, 2),
-            "readiness": readiness,
-            "recommendation": recommendation,
+            "resume_id": resume_id,
             "user_name": resume_data.get('name'),
-            "matched_skills": sorted(list(matched)),
-            "missing_skills": sorted(list(missing)),
-            "total_required": len(required_skills_set),
-            "total_matched": len(matched)
+            "total_jobs": len(matches),
+            "matches": project_fields(matches, fields, exclude)
         }
         
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error in match_jobs: %s", e)
+        raise HTTPException(status_code=500, detail=f"Error matching jobs: {str(e)}")
+
+@app.post("/api/resume-pipeline")
+async def resume_pipeline(
+    file: Optional[UploadFile] = File(None),
+    resume_id: Optional[str] = Form(None),
+    target_role: Optional[str] = Form(None),
+    job_description: Optional[str] = Form(None),
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
+):
+    """
+    One-shot workflow: parse a resume, then run feedback and gap analysis
+    
+    The resume is parsed once (or taken from resume_id). Feedback and gap
+    analysis run concurrently on that single parse. Gap analysis runs only
+    when a target_role or job_description is given. fields/exclude apply
+    to the whole response, e.g. exclude=resume.raw_text.
+    """
+    if file is None and not resume_id:
+        raise HTTPException(status_code=400, detail="Please provide either a file or a resume_id.")
+    
+    try:
+        if resume_id:
+            resume_data = _get_stored_resume(resume_id)
+        else:
+            logger.info("Resume pipeline upload: %s", file.filename, extra=sampled())
+            resume_id, resume_data = await _store_resume_upload(file)
+        
+        skills = resume_data.get('skills', [])
+        loop = asyncio.get_running_loop()
+        
+        feedback_future = loop.run_in_executor(
+            None,
+            lambda: feedback_analyzer.analyze_resume(
+                resume_text=resume_data.get('raw_text', ''),
+                skills=skills,
+                target_role=target_role
+            )
+        )
+        
+        gap_analysis = None
+        if target_role or job_description:
+            gap_analysis = await _run_gap_analysis(GapAnalysisRequest(
+                user_skills=skills,
+                target_role=target_role,
+                job_description=job_description
+            ))
+        
+        feedback = await feedback_future
+        logger.info("Resume pipeline complete: overall score %s", feedback['overall_score'], extra=sampled())
+        
+        return project_fields({
+            "resume_id": resume_id,
+            "resume": _resume_upload_response(resume_id, resume_data).model_dump(),
+            "feedback": {
+                key: feedback[key] for key in ResumeFeedbackResponse.model_fields
+            },
+            "gap_analysis": gap_analysis
+        }, fields, exclude)
+        
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ ERROR in match_job: {str(e)}")
-        print(traceback.format_exc())
-        if 'tmp_path' in locals():
-            try:
-                Path(tmp_path).unlink()
-            except:
-                pass
-        raise HTTPException(status_code=500, detail=f"Error matching job: {str(e)}")
+        logger.exception("Error in resume pipeline: %s", e)
+        raise HTTPException(status_code=500, detail=f"Error running resume pipeline: {str(e)}")
+
+def _refresh_role_catalog():
+    """Re-scan market data in the background (at most every ROLE_CATALOG_REFRESH_SECONDS)"""
+    loop = asyncio.get_running_loop()
+    task = _role_catalog_refresh["task"]
+    if task is not None and not task.done():
+        return
+    if loop.time() - _role_catalog_refresh["at"] < ROLE_CATALOG_REFRESH_SECONDS and task is not None:
+        return
+    
+    _role_catalog_refresh["at"] = loop.time()
+    _role_catalog_refresh["task"] = loop.run_in_executor(None, role_catalog.refresh)
+
+@app.get("/api/skills/suggest")
+async def suggest_skills(prefix: str = "", limit: int = 10):
+    """
+    Autocomplete skills by prefix, returning canonical names
+    
+    Variations resolve to their canonical skill ("reactj" -> React,
+    "postg" -> PostgreSQL). canonical is set when the whole input is a
+    known skill name or variation, so clients can normalize what the user
+    typed before sending it to gap analysis.
+    """
+    return {
+        "prefix": prefix,
+        "canonical": skill_names.get(normalize_key(prefix)),
+        "suggestions": skill_index.search(prefix, limit=max(1, min(limit, 50)))
+    }
+
+@app.get("/api/roles")
+async def list_roles(prefix: str = "", limit: int = 20):
+    """
+    List known target roles, or autocomplete them by prefix
+    
+    roles holds the role names (best matches first; most collected first
+    without a prefix). catalog holds the same roles with job_count,
+    has_profile, profile_analyzed_at, last_collected_at and age_hours
+    (hours since the newest collection or profile).
+    """
+    _refresh_role_catalog()
+    
+    entries = role_catalog.search(prefix, limit=max(1, min(limit, 100)))
+    return {
+        "roles": [entry['role'] for entry in entries],
+        "catalog": entries
+    }
+
+def _file_version(path: Path) -> Tuple[str, int, int]:
+    """Version of a file for ETags: name, modification time and size"""
+    stat = path.stat()
+    return (path.name, stat.st_mtime_ns, stat.st_size)
+
+def _list_market_data_files(analysis_files: List[Path]) -> Dict:
+    files = []
+    for f in analysis_files:
+        with open(f, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+            files.append({
+                "filename": f.name,
+                "role": data.get('analyzed_role', 'Unknown'),
+                "total_jobs": data.get('total_jobs', 0),
+                "unique_skills": data.get('unique_skills', 0)
+            })
+    return {"files": files}
 
 @app.get("/api/market-data-files")
-async def list_market_data_files():
+async def list_market_data_files(request: Request):
     """
     List available market analysis files
+    
+    The ETag is derived from the files' names, sizes and modification
+    times, so an unchanged listing is answered with 304 without reading
+    any file.
     """
     try:
-        analysis_files = list(Path('.').glob('skill_analysis*.json'))
-        
-        files = []
-        for f in analysis_files:
-            with open(f, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                files.append({
-                    "filename": f.name,
-                    "role": data.get('analyzed_role', 'Unknown'),
-                    "total_jobs": data.get('total_jobs', 0),
-                    "unique_skills": data.get('unique_skills', 0)
-                })
+        analysis_files = sorted(Path('.').glob('skill_analysis*.json'))
+        etag = make_etag(*(_file_version(f) for f in analysis_files))
         
-        return {"files": files}
+        return conditional_response(request, etag, lambda: _list_market_data_files(analysis_files))
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing files: {str(e)}")
 
+@app.get("/api/market-data-files/{filename}")
+async def get_market_data_file(
+    request: Request,
+    filename: str,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
+):
+    """
+    Get a saved market profile (a file listed by /api/market-data-files)
+    
+    Honours If-None-Match with 304 while the file is unchanged.
+    fields/exclude project the profile, e.g. fields=analyzed_role,skills
+    """
+    path = Path(filename)
+    if path.name != filename or not fnmatch.fnmatch(filename, 'skill_analysis*.json') or not path.is_file():
+        raise HTTPException(status_code=404, detail=f"Market data file not found: {filename}")
+    
+    def load_profile() -> Dict:
+        with open(path, 'r', encoding='utf-8') as f:
+            return project_fields(json.load(f), fields, exclude)
+    
+    try:
+        return conditional_response(request, make_etag(*_file_version(path), fields, exclude), load_profile)
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=500, detail=f"Error reading {filename}: {str(e)}")
+
 # ============================================
 # LEARNING ROADMAP ENDPOINTS
 # ============================================
 
-@app.post("/api/generate-roadmap")
-async def generate_roadmap(request: RoadmapRequest):
-    """
-    Generate a personalized learning roadmap for a single skill
-    """
+def _require_roadmap_builder():
     if not ROADMAP_AVAILABLE or not roadmap_builder:
         raise HTTPException(
             status_code=503,
             detail="Roadmap generation service is not available. Please ensure GEMINI_API_KEY is configured."
         )
+
+async def _run_generate_roadmap(request: RoadmapRequest) -> Dict:
+    """Generate one roadmap on the roadmap executor"""
+    _require_roadmap_builder()
+    logger.info("Generating roadmap for: %s (level: %s)", request.skill, request.level, extra=sampled())
+    
+    deadline = Deadline(ROADMAP_DEADLINE_SECONDS)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            roadmap_executor,
+            lambda: roadmap_builder.build_complete_roadmap(
+                skill=request.skill, level=request.level, deadline=deadline
+            )
+        )
+    except CircuitOpenError as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Roadmap generation is temporarily unavailable. Please try again shortly.",
+            headers={"Retry-After": str(max(1, int(e.retry_after)))}
+        )
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=str(e))
+
+@app.post("/api/generate-roadmap")
+async def generate_roadmap(
+    request: RoadmapRequest,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None,
+    background: bool = False
+):
+    """
+    Generate a personalized learning roadmap for a single skill
+    
+    Use fields/exclude to trim the roadmap, e.g.
+    exclude=graph_data,mermaid_diagram. Supports background=true.
+    """
+    _require_roadmap_builder()
+    
+    if background:
+        return _submit_task("generate-roadmap", request, fields, exclude)
     
     try:
-        print(f"🎯 Generating roadmap for: {request.skill} (Level: {request.level})")
-        
         # Generate complete roadmap
-        roadmap = roadmap_builder.build_complete_roadmap(
-            skill=request.skill,
-            level=request.level
-        )
+        roadmap = await _run_generate_roadmap(request)
         
-        print(f"✅ Roadmap generated successfully")
-        return roadmap
+        return project_fields(roadmap, fields, exclude)
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ ERROR generating roadmap: {str(e)}")
-        import traceback
-        print(traceback.format_exc())
+        logger.exception("Error generating roadmap: %s", e)
         raise HTTPException(status_code=500, detail=f"Error generating roadmap: {str(e)}")
 
+async def _build_roadmap_result(
+    skill: str,
+    level: str,
+    deadline: Deadline,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
+) -> Dict:
+    """
+    Build one roadmap on the bounded roadmap executor
+    
+    deadline is the request's, so time spent queued for the executor
+    counts against it.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        logger.debug("Generating roadmap for: %s", skill, extra=sampled())
+        roadmap = await loop.run_in_executor(
+            roadmap_executor,
+            lambda: roadmap_builder.build_complete_roadmap(skill=skill, level=level, deadline=deadline)
+        )
+        return {
+            "skill": skill,
+            "success": True,
+            "roadmap": project_fields(roadmap, fields, exclude)
+        }
+    except Exception as e:
+        logger.warning("Failed to generate roadmap for %s: %s", skill, e)
+        return {
+            "skill": skill,
+            "success": False,
+            "error": str(e)
+        }
+
+async def _run_roadmaps_bulk(
+    request: RoadmapSkillsRequest,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
+) -> Dict:
+    """Generate all requested roadmaps concurrently and return them together"""
+    _require_roadmap_builder()
+    skills = request.skills[:10]  # Limit to 10 skills per request
+    deadline = Deadline(ROADMAP_DEADLINE_SECONDS)
+    
+    roadmaps = await asyncio.gather(
+        *[_build_roadmap_result(skill, request.level, deadline, fields, exclude) for skill in skills]
+    )
+    total_generated = len([r for r in roadmaps if r['success']])
+    logger.info("Generated %d/%d roadmaps", total_generated, len(skills), extra=sampled())
+    
+    return {
+        "total_requested": len(request.skills),
+        "total_generated": total_generated,
+        "roadmaps": roadmaps
+    }
+
 @app.post("/api/generate-roadmaps-bulk")
-async def generate_roadmaps_bulk(request: RoadmapSkillsRequest):
+async def generate_roadmaps_bulk(
+    request: RoadmapSkillsRequest,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None,
+    background: bool = False
+):
     """
     Generate learning roadmaps for multiple skills (e.g., from skill gap analysis)
-    Returns simplified roadmaps for each skill
+    
+    Roadmaps are generated concurrently (bounded by ROADMAP_BULK_CONCURRENCY).
+    By default each roadmap is streamed as an NDJSON line as soon as it
+    finishes, followed by a final summary line; with stream=false the
+    complete result is returned as one JSON object. fields/exclude apply
+    to each roadmap. background=true queues the non-streamed variant.
     """
-    if not ROADMAP_AVAILABLE or not roadmap_builder:
+    _require_roadmap_builder()
+    
+    if background:
+        return _submit_task("generate-roadmaps-bulk", request, fields, exclude)
+    
+    skills = request.skills[:10]  # Limit to 10 skills per request
+    logger.info("Generating roadmaps for %d skills", len(skills), extra=sampled())
+    
+    if not request.stream:
+        try:
+            return await _run_roadmaps_bulk(request, fields, exclude)
+            
+        except Exception as e:
+            logger.exception("Error generating bulk roadmaps: %s", e)
+            raise HTTPException(status_code=500, detail=f"Error generating roadmaps: {str(e)}")
+    
+    deadline = Deadline(ROADMAP_DEADLINE_SECONDS)
+    
+    async def roadmap_stream():
+        tasks = [
+            asyncio.ensure_future(_build_roadmap_result(skill, request.level, deadline, fields, exclude))
+            for skill in skills
+        ]
+        total_generated = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                total_generated += 1 if result['success'] else 0
+                yield json.dumps({"type": "roadmap", **result}) + "\n"
+            
+            logger.info("Generated %d/%d roadmaps", total_generated, len(skills), extra=sampled())
+            yield json.dumps({
+                "type": "summary",
+                "total_requested": len(request.skills),
+                "total_generated": total_generated
+            }) + "\n"
+        finally:
+            # Client went away: drop roadmaps that have not started yet
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(roadmap_stream(), media_type="application/x-ndjson")
+
+# ============================================
+# BACKGROUND TASK ENDPOINTS
+# ============================================
+
+# Task kind -> (request model, runner)
+TASK_RUNNERS = {
+    "gap-analysis": (GapAnalysisRequest, _run_gap_analysis),
+    "gap-analysis-batch": (BatchGapAnalysisRequest, _run_gap_analysis_batch),
+    "generate-roadmap": (RoadmapRequest, _run_generate_roadmap),
+    "generate-roadmaps-bulk": (RoadmapSkillsRequest, _run_roadmaps_bulk),
+}
+
+# Kinds whose runner applies fields/exclude to each item itself
+ITEM_PROJECTED_TASKS = {"gap-analysis-batch", "generate-roadmaps-bulk"}
+
+async def _run_task(kind: str, request: BaseModel, fields: Optional[str], exclude: Optional[str]) -> Dict:
+    """Run a task kind's runner with the same fields/exclude projection as its endpoint"""
+    _, runner = TASK_RUNNERS[kind]
+    if kind in ITEM_PROJECTED_TASKS:
+        return await runner(request, fields, exclude)
+    return project_fields(await runner(request), fields, exclude)
+
+def _submit_task(kind: str, request: BaseModel, fields: Optional[str] = None, exclude: Optional[str] = None):
+    """Queue a heavy request; equivalent in-flight submissions share one task"""
+    payload = request.model_dump()
+    if payload.get("target_role"):
+        payload["target_role"] = role_canonicalizer.key(payload["target_role"])
+    task = task_queue.submit(
+        kind,
+        _run_task,
+        kind,
+        request,
+        fields,
+        exclude,
+        key=task_key(kind, {"payload": payload, "fields": fields, "exclude": exclude})
+    )
+    return FastJSONResponse(status_code=202, content=task)
+
+@app.post("/api/tasks")
+async def submit_task(
+    request: TaskSubmitRequest,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
+):
+    """
+    Submit a long-running analysis as a background task
+    
+    kind is one of: gap-analysis, gap-analysis-batch, generate-roadmap,
+    generate-roadmaps-bulk; payload is that endpoint's request body and
+    fields/exclude are applied as that endpoint would.
+    """
+    if request.kind not in TASK_RUNNERS:
         raise HTTPException(
-            status_code=503,
-            detail="Roadmap generation service is not available. Please ensure GEMINI_API_KEY is configured."
+            status_code=400,
+            detail=f"Unknown task kind: {request.kind}. Expected one of: {', '.join(TASK_RUNNERS)}"
         )
     
+    model, _ = TASK_RUNNERS[request.kind]
     try:
-        print(f"🎯 Generating roadmaps for {len(request.skills)} skills")
-        
-        roadmaps = []
-        for skill in request.skills[:10]:  # Limit to 10 skills to avoid timeout
-            try:
-                print(f"   • Generating roadmap for: {skill}")
-                roadmap = roadmap_builder.build_complete_roadmap(
-                    skill=skill,
-                    level=request.level
-                )
-                roadmaps.append({
-                    "skill": skill,
-                    "success": True,
-                    "roadmap": roadmap
-                })
-            except Exception as e:
-                print(f"   ⚠️ Failed to generate roadmap for {skill}: {e}")
-                roadmaps.append({
-                    "skill": skill,
-                    "success": False,
-                    "error": str(e)
-                })
-        
-        print(f"✅ Generated {len([r for r in roadmaps if r['success']])} roadmaps successfully")
-        
-        return {
-            "total_requested": len(request.skills),
-            "total_generated": len([r for r in roadmaps if r['success']]),
-            "roadmaps": roadmaps
-        }
-        
+        payload = model.model_validate(request.payload)
     except Exception as e:
-        print(f"❌ ERROR generating bulk roadmaps: {str(e)}")
-        import traceback
-        print(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Error generating roadmaps: {str(e)}")
+        raise HTTPException(status_code=422, detail=f"Invalid payload for {request.kind}: {str(e)}")
+    
+    if request.kind.startswith("generate-roadmap"):
+        _require_roadmap_builder()
+    
+    return _submit_task(request.kind, payload, fields, exclude)
+
+@app.get("/api/tasks/{task_id}")
+async def get_task_status(task_id: str):
+    """Get the status of a background task"""
+    task = task_queue.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Task not found or expired: {task_id}")
+    return task
+
+@app.get("/api/tasks/{task_id}/result")
+async def get_task_result(
+    request: Request,
+    task_id: str,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
+):
+    """
+    Get the result of a background task
+    
+    Returns 202 with the task status while it is queued or running, the
+    task's original error status if it failed and 503 if it was cancelled.
+    Finished results never change, so they carry an ETag and repeat polls
+    get 304.
+    """
+    task = task_queue.result(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Task not found or expired: {task_id}")
+    
+    if task["status"] in (QUEUED, RUNNING):
+        task.pop("result")
+        return FastJSONResponse(status_code=202, content=task)
+    
+    if task["status"] in (FAILED, CANCELLED):
+        raise HTTPException(status_code=task["status_code"] or 500, detail=task["error"])
+    
+    return conditional_response(
+        request,
+        make_etag(task_id, task["finished_at"], fields, exclude),
+        lambda: project_fields(task["result"], fields, exclude)
+    )
 
 @app.get("/api/roadmap/check-availability")
 async def check_roadmap_availability():
@@ -722,21 +1688,108 @@ async def check_roadmap_availability():
         "message": "Roadmap generation is ready" if (ROADMAP_AVAILABLE and roadmap_builder) else "Configure GEMINI_API_KEY to enable roadmap generation"
     }
 
+def _search_key(role: str, location: str, page: int) -> tuple:
+    return (role_canonicalizer.key(role), location.strip().lower(), page)
+
+def _search_page_task(role: str, location: str, page: int) -> asyncio.Task:
+    """
+    Fetch one search page into the shared cache
+    
+    Concurrent requests (and prefetches) for the same page share one task.
+    """
+    key = _search_key(role, location, page)
+    task = _search_inflight.get(key)
+    if task is not None:
+        return task
+    
+    async def load_page() -> List[Dict]:
+        jobs = await async_job_collector.fetch_adzuna_page(
+            role_canonicalizer.canonicalize(role), location, page
+        )
+        if jobs is None:
+            return []  # Failed (rate limited, upstream error, circuit open): don't cache
+        search_cache.set(key, jobs)
+        return jobs
+    
+    task = asyncio.ensure_future(load_page())
+    _search_inflight[key] = task
+    task.add_done_callback(lambda _: _search_inflight.pop(key, None))
+    return task
+
+async def _get_search_page(role: str, location: str, page: int) -> List[Dict]:
+    """Serve a search page from the shared cache, fetching it on a miss"""
+    jobs = search_cache.get(_search_key(role, location, page))
+    if jobs is not None:
+        return jobs
+    # Shield so a disconnecting client doesn't cancel a fetch others wait on
+    return await asyncio.shield(_search_page_task(role, location, page))
+
+def _prefetch_search_page(role: str, location: str, page: int):
+    """Start fetching a page in the background unless cached or in flight"""
+    key = _search_key(role, location, page)
+    if key in search_cache or key in _search_inflight:
+        return
+    
+    task = _search_page_task(role, location, page)
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())  # Don't warn on unretrieved errors
+
+def _job_skills(jobs: List[Dict]) -> List[List[str]]:
+    """
+    Skills of each job posting, extracting only the uncached ones
+    
+    Uncached postings are extracted together in one batch and cached per
+    job ID, so repeat views of a page skip extraction entirely.
+    """
+    keys = [(job.get('source'), str(job.get('id'))) for job in jobs]
+    skill_lists = [job_skills_cache.get(key) for key in keys]
+    
+    missing = [i for i, skills in enumerate(skill_lists) if skills is None]
+    if missing:
+        extracted = skill_extractor.extract_from_texts([
+            f"{jobs[i].get('title', '')}\n{jobs[i].get('description', '')}" for i in missing
+        ])
+        for i, skills in zip(missing, extracted):
+            job_skills_cache.set(keys[i], skills)
+            skill_lists[i] = skills
+    
+    return skill_lists
+
+def _rank_jobs_by_skills(formatted_jobs: List[Dict], jobs: List[Dict], user_skills: List[str]) -> List[Dict]:
+    """Annotate each job with its skill match and order by match percentage"""
+    for formatted_job, required_skills in zip(formatted_jobs, _job_skills(jobs)):
+        match = _score_job_match(user_skills, required_skills)
+        formatted_job["skill_match"] = {
+            "match_percentage": match["match_percentage"],
+            "matched_skills": match["matched_skills"],
+            "missing_skills": match["missing_skills"],
+            "total_required": match["total_required"]
+        }
+    
+    # Stable sort: equal matches keep Adzuna's date order
+    return sorted(formatted_jobs, key=lambda job: job["skill_match"]["match_percentage"], reverse=True)
+
 @app.post("/api/search-jobs")
 async def search_jobs(request: JobSearchRequest):
     """
     Search for real-time job opportunities using Adzuna API
+    
+    Pages are served from a shared short-TTL cache; serving page N
+    prefetches page N+1 in the background.
+    
+    With user_skills (or resume_id) each job gets a skill_match
+    (match_percentage, matched_skills, missing_skills, total_required)
+    and the page is ranked by match instead of date.
     """
+    user_skills = request.user_skills
+    if request.resume_id:
+        user_skills = _get_stored_resume(request.resume_id).get('skills', [])
+    
     try:
-        print(f"🔍 Searching jobs for: {request.role} in {request.location} (Page {request.page})")
-        
-        # Use the job collector to fetch real-time jobs
-        jobs = job_collector.collect_from_adzuna(
-            role=request.role,
-            location=request.location,
-            pages=1,  # Fetch one page at a time for better performance
-            page_offset=request.page - 1  # Convert to 0-based indexing
-        )
+        # Use the job collector to fetch real-time jobs (cached per page)
+        jobs = await _get_search_page(request.role, request.location, request.page)
+        
+        if jobs:
+            _prefetch_search_page(request.role, request.location, request.page + 1)
         
         if not jobs:
             return {
@@ -769,20 +1822,26 @@ async def search_jobs(request: JobSearchRequest):
             }
             formatted_jobs.append(formatted_job)
         
-        print(f"✅ Found {len(formatted_jobs)} jobs")
+        if user_skills is not None:
+            loop = asyncio.get_running_loop()
+            formatted_jobs = await loop.run_in_executor(
+                None, _rank_jobs_by_skills, formatted_jobs, jobs, user_skills
+            )
+        
+        logger.info("Job search: %s in %s (page %d): %d jobs",
+                    request.role, request.location, request.page, len(formatted_jobs), extra=sampled())
         
         return {
             "results": formatted_jobs,
             "count": len(formatted_jobs) * 10,  # Estimate total (Adzuna doesn't provide exact count)
             "page": request.page,
             "role": request.role,
-            "location": request.location
+            "location": request.location,
+            "ranked_by": "skill_match" if user_skills is not None else "date"
         }
         
     except Exception as e:
-        print(f"❌ ERROR searching jobs: {str(e)}")
-        import traceback
-        print(traceback.format_exc())
+        logger.exception("Error searching jobs: %s", e)
         raise HTTPException(status_code=500, detail=f"Error searching jobs: {str(e)}")
 
 if __name__ == "__main__":
@@ -0,0 +1,75 @@
+"""
+Cache Module
+Thread-safe in-process TTL/LRU cache with hit-ratio metrics
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from metrics import record_cache_lookup
+
+
+class TTLCache:
+    """
+    Bounded cache whose entries expire after a fixed time-to-live
+
+    Least recently used entries are evicted once max_entries is reached.
+    Every get() is reported to /metrics under the cache's name.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float, max_entries: int = 1024):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        record_cache_lookup(self.name, hit=entry is not None)
+        return entry[1] if entry is not None else default
+
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        """Store a value, evicting the least recently used entry if full"""
+        expires_at = time.monotonic() + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Membership test without counting as a lookup"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return entry[1] if entry is not None else default
+
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,213 @@
+"""
+Collection Scheduler Module
+Concurrent, prioritized multi-role market refreshes into the job store
+"""
+
+import asyncio
+import math
+import os
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from job_store import JobStore
+from multi_source_collector import AsyncJobCollector
+from logging_setup import get_logger
+
+logger = get_logger("collection_scheduler")
+
+
+class CollectionScheduler:
+    """
+    Refresh many roles concurrently under the shared Adzuna rate limit
+
+    Roles are ordered by priority (stalest and most popular first) and
+    refreshed incrementally, max_concurrent_roles at a time: each role
+    pages only until it reaches postings already in the store, and new
+    postings are written to the store as each page arrives. All roles
+    draw from the process-wide Adzuna token bucket, so a run is bounded
+    by the quota rather than by per-role latency.
+    """
+
+    def __init__(
+        self,
+        collector: AsyncJobCollector,
+        store: JobStore,
+        max_concurrent_roles: int = 4,
+        max_pages: int = 5,
+        location: str = "India"
+    ):
+        self.collector = collector
+        self.store = store
+        self.max_concurrent_roles = max_concurrent_roles
+        self.max_pages = max_pages
+        self.location = location
+
+
+    def load_watermarks(self, roles: List[Dict]) -> Dict[str, Optional[Dict]]:
+        """Store watermarks of the roles, keyed by role name (blocking: store I/O)"""
+        return {role['role']: self.store.get_watermark(role['role'], self.location) for role in roles}
+
+
+    def staleness_hours(
+        self,
+        role: Dict,
+        watermark: Optional[Dict],
+        now: Optional[datetime] = None
+    ) -> Optional[float]:
+        """
+        Hours since a role was last refreshed (None if never)
+
+        Uses the role's watermark in the store, else the catalog's
+        age_hours (last collection or saved profile).
+        """
+        if watermark is not None:
+            try:
+                refreshed_at = datetime.fromisoformat(watermark['refreshed_at'])
+                return ((now or datetime.now()) - refreshed_at).total_seconds() / 3600
+            except ValueError:
+                pass
+        return role.get('age_hours')
+
+
+    def prioritize(self, roles: List[Dict], watermarks: Optional[Dict[str, Optional[Dict]]] = None) -> List[Dict]:
+        """
+        Order roles for refreshing, most urgent first
+
+        Args:
+            roles: Role entries as listed by RoleCatalog.search()
+                ({'role', 'job_count', 'age_hours', ...})
+            watermarks: The roles' watermarks from load_watermarks()
+                (read from the store when omitted)
+
+        Returns:
+            Copies of the entries with 'staleness_hours' and 'priority'.
+            Never-refreshed roles come first; the rest are ranked by
+            staleness weighted by popularity (log of the role's job count).
+        """
+        if watermarks is None:
+            watermarks = self.load_watermarks(roles)
+        now = datetime.now()
+        ranked = []
+        for role in roles:
+            staleness = self.staleness_hours(role, watermarks.get(role['role']), now)
+            priority = math.inf if staleness is None else staleness * (1 + math.log1p(role.get('job_count') or 0))
+            ranked.append({**role, 'staleness_hours': staleness, 'priority': priority})
+        ranked.sort(key=lambda role: (-role['priority'], role['role']))
+        return ranked
+
+
+    async def run(
+        self,
+        roles: List[Dict],
+        min_age_hours: float = 0.0,
+        max_requests: Optional[int] = None,
+        progress_callback: Optional[Callable[[Dict], None]] = None
+    ) -> Dict:
+        """
+        Refresh roles concurrently in priority order
+
+        Args:
+            roles: Role entries (see prioritize)
+            min_age_hours: Skip roles refreshed more recently than this
+            max_requests: Stop starting new roles once this many Adzuna
+                requests have been made in this run (the quota budget)
+            progress_callback: Optional callable receiving an event
+                ({'stage': 'refresh', 'role', 'new_jobs', 'completed', 'total'})
+                after every role
+
+        Returns:
+            Summary: per-role results, total new jobs, requests and seconds
+        """
+        # One trip to the store, off the event loop
+        watermarks = await asyncio.get_running_loop().run_in_executor(None, self.load_watermarks, roles)
+        ordered = [
+            role for role in self.prioritize(roles, watermarks)
+            if role['staleness_hours'] is None or role['staleness_hours'] >= min_age_hours
+        ]
+        logger.info("Refreshing %d of %d roles (%d at a time)", len(ordered), len(roles), self.max_concurrent_roles)
+
+        stats = self.collector.stats['adzuna']
+        attempted_at_start = stats['attempted']
+        start = time.monotonic()
+        semaphore = asyncio.Semaphore(self.max_concurrent_roles)
+        results: Dict[str, Dict] = {}
+
+        def requests_used() -> int:
+            return stats['attempted'] - attempted_at_start
+
+        async def refresh(role: str):
+            # Semaphore waiters are served in order, so roles start by priority
+            async with semaphore:
+                if max_requests is not None and requests_used() >= max_requests:
+                    results[role] = {'skipped': 'request budget used'}
+                    return
+                try:
+                    new_jobs = await self.collector.collect_new_from_adzuna_async(
+                        role, self.store, location=self.location, max_pages=self.max_pages
+                    )
+                    results[role] = {'new_jobs': len(new_jobs)}
+                except Exception as e:
+                    logger.warning("Refresh failed for %r: %s", role, e)
+                    results[role] = {'error': str(e)}
+
+            if progress_callback:
+                progress_callback({
+                    'stage': 'refresh',
+                    'role': role,
+                    'new_jobs': results[role].get('new_jobs', 0),
+                    'completed': len(results),
+                    'total': len(ordered)
+                })
+
+        await asyncio.gather(*(refresh(role['role']) for role in ordered))
+
+        summary = {
+            'roles': results,
+            'new_jobs': sum(result.get('new_jobs', 0) for result in results.values()),
+            'requests': requests_used(),
+            'seconds': round(time.monotonic() - start, 1)
+        }
+        logger.info("Refresh done: %d new postings for %d roles, %d requests in %.1fs",
+                    summary['new_jobs'], len(results), summary['requests'], summary['seconds'])
+        return summary
+
+
+# ============================================
+# MAIN EXECUTION
+# ============================================
+
+async def refresh_catalog_roles() -> Dict:
+    """Nightly refresh of every role in the catalog (run from cron)"""
+    from role_catalog import RoleCatalog
+
+    store = JobStore()
+    catalog = RoleCatalog(os.getenv("MARKET_DATA_DIR", "."), job_store=store)
+    catalog.refresh()
+
+    collector = AsyncJobCollector(max_concurrency=int(os.getenv("ADZUNA_MAX_CONCURRENCY", "5")))
+    scheduler = CollectionScheduler(
+        collector,
+        store,
+        max_concurrent_roles=int(os.getenv("COLLECTION_CONCURRENT_ROLES", "4")),
+        max_pages=int(os.getenv("COLLECTION_MAX_PAGES", "5"))
+    )
+    max_requests = os.getenv("COLLECTION_MAX_REQUESTS")
+    try:
+        return await scheduler.run(
+            catalog.search('', limit=len(catalog)),
+            min_age_hours=float(os.getenv("COLLECTION_MIN_AGE_HOURS", "12")),
+            max_requests=int(max_requests) if max_requests else None
+        )
+    finally:
+        await collector.aclose()
+
+
+if __name__ == "__main__":
+    summary = asyncio.run(refresh_catalog_roles())
+
+    print(f"\n🔄 Refreshed {len(summary['roles'])} roles in {summary['seconds']}s "
+          f"({summary['requests']} requests, {summary['new_jobs']} new postings)")
+    for role, result in summary['roles'].items():
+        outcome = result.get('error') or result.get('skipped') or f"{result['new_jobs']} new"
+        print(f"  • {role}: {outcome}")
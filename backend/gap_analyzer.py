@@ -5,9 +5,16 @@ Enhanced with weighted matching and smart skill comparison
 """
 
 import json
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 from pathlib import Path
 
+import numpy as np
+
+from metrics import timed_stage
+from logging_setup import get_logger
+
+logger = get_logger("gap_analyzer")
+
 # Import skill database functions for smart matching
 try:
     from skill_database import get_skill_variations, normalize_skill
@@ -16,6 +23,99 @@ except ImportError:
     SKILL_MATCHING_AVAILABLE = False
 
 
+# Demand levels in priority order; anything unknown is scored as 'Low'
+DEMAND_LEVELS = ['Critical', 'High', 'Medium', 'Low']
+
+DEMAND_WEIGHTS = {
+    'Critical': 1.0,
+    'High': 0.8,
+    'Medium': 0.5,
+    'Low': 0.3
+}
+
+
+class MarketProfile:
+    """
+    Market skill demand prepared once for scoring many users
+    
+    Holds skill-ID arrays (weights, demand tiers, sort orders) and the
+    variation lookups so each user only needs a dictionary probe per skill.
+    """
+    
+    def __init__(self, market_skills: List[Dict], use_smart_matching: bool = True):
+        self.market_skills = market_skills
+        self.use_smart_matching = use_smart_matching
+        self.skills_dict = {s['skill']: s for s in market_skills}
+        self.skill_names = list(self.skills_dict.keys())
+        self.skill_ids = {name: i for i, name in enumerate(self.skill_names)}
+        
+        self.total_weight = sum(s['percentage'] for s in market_skills)
+        self.weights = np.array(
+            [self.skills_dict[name]['percentage'] for name in self.skill_names],
+            dtype=float
+        )
+        self.tiers = np.array(
+            [self._tier_of(self.skills_dict[name]['demand_level']) for name in self.skill_names],
+            dtype=np.intp
+        )
+        self.tier_totals = np.bincount(self.tiers, minlength=len(DEMAND_LEVELS))
+        
+        # Skill IDs sorted by demand, overall and within each tier
+        self.matched_order = sorted(
+            range(len(self.skill_names)),
+            key=lambda i: self.weights[i],
+            reverse=True
+        )
+        self.tier_order = [
+            [i for i in self.matched_order if self.tiers[i] == tier]
+            for tier in range(len(DEMAND_LEVELS))
+        ]
+        
+        # Reverse lookup: any variation of a market skill -> market skill ID
+        self._reverse_variations = {}
+        if use_smart_matching:
+            for i, name in enumerate(self.skill_names):
+                for variation in get_skill_variations(name):
+                    self._reverse_variations.setdefault(variation, i)
+        
+        self._resolved = {}
+    
+    
+    @staticmethod
+    def _tier_of(demand_level: str) -> int:
+        if demand_level in DEMAND_LEVELS:
+            return DEMAND_LEVELS.index(demand_level)
+        return len(DEMAND_LEVELS) - 1
+    
+    
+    def __len__(self) -> int:
+        return len(self.skill_names)
+    
+    
+    def resolve(self, user_skill: str) -> Optional[int]:
+        """
+        Map a user skill to a market skill ID
+        
+        Tries a direct match, then the user skill's variations, then the
+        market skills' variations. Results are memoized per profile.
+        """
+        if user_skill in self._resolved:
+            return self._resolved[user_skill]
+        
+        skill_id = self.skill_ids.get(user_skill)
+        
+        if skill_id is None and self.use_smart_matching:
+            for variation in get_skill_variations(user_skill):
+                skill_id = self.skill_ids.get(variation)
+                if skill_id is not None:
+                    break
+            else:
+                skill_id = self._reverse_variations.get(user_skill)
+        
+        self._resolved[user_skill] = skill_id
+        return skill_id
+
+
 class GapAnalyzer:
     """Analyze skill gaps between user and market demand"""
     
@@ -23,10 +123,15 @@ class GapAnalyzer:
         self.use_smart_matching = SKILL_MATCHING_AVAILABLE
     
     
+    def prepare_market_profile(self, market_skills: List[Dict]) -> MarketProfile:
+        """Build the reusable matching structures for one market profile"""
+        return MarketProfile(market_skills, use_smart_matching=self.use_smart_matching)
+    
+    
     def analyze_gap(
         self, 
         user_skills: List[str], 
-        market_skills: List[Dict],
+        market_skills: Union[List[Dict], MarketProfile],
         target_role: str = None
     ) -> Dict:
         """
@@ -35,176 +140,197 @@ class GapAnalyzer:
         Args:
             user_skills: List of skills from user's resume
             market_skills: List of skill demand data from market analysis
+                (or a profile from prepare_market_profile)
             target_role: Name of target role
             
         Returns:
             Enhanced gap analysis results with weighted matching
         """
         
-        print("\n" + "="*60)
-        print("🎯 SKILL GAP ANALYSIS (Enhanced)")
-        if target_role:
-            print(f"Target Role: {target_role}")
-        print("="*60)
+        result = self.analyze_gap_batch([user_skills], market_skills, target_role)[0]
         
-        # Prepare skill matching
-        market_skills_dict = {s['skill']: s for s in market_skills}
-        required_skills_set = set(market_skills_dict.keys())
+        logger.debug(
+            "Gap analysis (%s): weighted match %.1f%% | simple match %.1f%%",
+            target_role, result['match_percentage'], result['simple_match_percentage']
+        )
         
-        # Smart skill matching with variations
-        matched_skills = set()
-        matched_skills_info = []
-        user_skills_normalized = {}  # Track which user skill matched which market skill
+        return result
+    
+    
+    @timed_stage('gap_scoring')
+    def analyze_gap_batch(
+        self,
+        user_skill_lists: List[List[str]],
+        market_skills: Union[List[Dict], MarketProfile],
+        target_role: str = None
+    ) -> List[Dict]:
+        """
+        Score many users against one market profile in a single pass
         
-        for user_skill in user_skills:
-            match_found = False
+        The market profile is prepared once; matches are collected as
+        skill-ID arrays and the weighted/tier statistics for all users are
+        computed together on a (users x skills) match matrix.
+        
+        Args:
+            user_skill_lists: One skill list per user
+            market_skills: List of skill demand data from market analysis
+                (or a profile from prepare_market_profile)
+            target_role: Name of target role
             
-            # Direct match
-            if user_skill in required_skills_set:
-                matched_skills.add(user_skill)
-                match_found = True
-                user_skills_normalized[user_skill] = user_skill
+        Returns:
+            One gap analysis result per user, in input order, each in the
+            same shape as analyze_gap
+        """
+        if isinstance(market_skills, MarketProfile):
+            profile = market_skills
+        else:
+            profile = self.prepare_market_profile(market_skills)
+        
+        n_users = len(user_skill_lists)
+        n_skills = len(profile)
+        
+        # Resolve every user skill to a market skill ID
+        normalized_per_user = []
+        row_ids = []
+        col_ids = []
+        for row, user_skills in enumerate(user_skill_lists):
+            user_skills_normalized = {}  # user skill -> matched market skill ID
+            for user_skill in user_skills:
+                skill_id = profile.resolve(user_skill)
+                if skill_id is not None:
+                    user_skills_normalized[user_skill] = skill_id
+            normalized_per_user.append(user_skills_normalized)
             
-            # Smart matching with variations (if available)
-            elif self.use_smart_matching:
-                user_variations = get_skill_variations(user_skill)
-                for variation in user_variations:
-                    if variation in required_skills_set:
-                        matched_skills.add(variation)
-                        match_found = True
-                        user_skills_normalized[user_skill] = variation
-                        break
-                
-                # Try reverse: check if any market skill matches user skill variations
-                if not match_found:
-                    for market_skill in required_skills_set:
-                        market_variations = get_skill_variations(market_skill)
-                        if user_skill in market_variations:
-                            matched_skills.add(market_skill)
-                            match_found = True
-                            user_skills_normalized[user_skill] = market_skill
-                            break
+            matched_ids = set(user_skills_normalized.values())
+            row_ids.extend([row] * len(matched_ids))
+            col_ids.extend(matched_ids)
         
-        # Calculate gaps
-        user_skills_set = set(user_skills)
-        missing_skills = required_skills_set - matched_skills
-        extra_skills = user_skills_set - set(user_skills_normalized.keys())
+        match_matrix = np.zeros((n_users, n_skills), dtype=bool)
+        if col_ids:
+            match_matrix[np.array(row_ids, dtype=np.intp), np.array(col_ids, dtype=np.intp)] = True
         
         # WEIGHTED MATCH PERCENTAGE (Improvement #1)
         # Instead of simple count, weight by demand percentage
-        total_weight = sum(s['percentage'] for s in market_skills)
-        matched_weight = sum(
-            market_skills_dict[skill]['percentage'] 
-            for skill in matched_skills 
-            if skill in market_skills_dict
-        )
-        
-        weighted_match_percentage = (matched_weight / total_weight * 100) if total_weight > 0 else 0
-        
-        # Simple match for comparison
-        simple_match_percentage = (len(matched_skills) / len(required_skills_set) * 100) if required_skills_set else 0
-        
-        print(f"📊 Weighted Match: {weighted_match_percentage:.1f}% | Simple Match: {simple_match_percentage:.1f}%")
+        matched_weight = match_matrix @ profile.weights
+        matched_counts = match_matrix.sum(axis=1)
+        if profile.total_weight > 0:
+            weighted_match = matched_weight / profile.total_weight * 100
+        else:
+            weighted_match = np.zeros(n_users)
+        if n_skills:
+            simple_match = matched_counts / n_skills * 100
+        else:
+            simple_match = np.zeros(n_users)
         
         # SKILL LEVEL WEIGHTING (Improvement #3)
-        # Categorize by demand level with weights
-        demand_weights = {
-            'Critical': 1.0,
-            'High': 0.8,
-            'Medium': 0.5,
-            'Low': 0.3
-        }
-        
-        # Categorize missing skills by priority
-        critical_gaps = []
-        high_priority_gaps = []
-        medium_priority_gaps = []
-        low_priority_gaps = []
-        
-        for skill in missing_skills:
-            skill_data = market_skills_dict[skill]
+        # Matched skill counts per demand tier
+        tier_matched = np.stack(
+            [(match_matrix & (profile.tiers == tier)).sum(axis=1) for tier in range(len(DEMAND_LEVELS))],
+            axis=1
+        ) if n_users else np.zeros((0, len(DEMAND_LEVELS)), dtype=int)
+        
+        results = []
+        for row, user_skills in enumerate(user_skill_lists):
+            results.append(self._build_result(
+                profile=profile,
+                matched_row=match_matrix[row],
+                user_skills=user_skills,
+                user_skills_normalized=normalized_per_user[row],
+                weighted_match_percentage=float(weighted_match[row]),
+                simple_match_percentage=float(simple_match[row]),
+                tier_matched=tier_matched[row],
+                target_role=target_role
+            ))
+        
+        return results
+    
+    
+    def _build_result(
+        self,
+        profile: MarketProfile,
+        matched_row: np.ndarray,
+        user_skills: List[str],
+        user_skills_normalized: Dict[str, int],
+        weighted_match_percentage: float,
+        simple_match_percentage: float,
+        tier_matched: np.ndarray,
+        target_role: str
+    ) -> Dict:
+        """Assemble the analyze_gap result for one user's match row"""
+        
+        names = profile.skill_names
+        skills_dict = profile.skills_dict
+        
+        # Categorize missing skills by priority (already sorted by demand)
+        gaps_by_tier = []
+        for tier_ids in profile.tier_order:
+            tier_gaps = []
+            for i in tier_ids:
+                if matched_row[i]:
+                    continue
+                skill_data = skills_dict[names[i]]
+                demand_level = skill_data['demand_level']
+                tier_gaps.append({
+                    'skill': names[i],
+                    'demand_percentage': skill_data['percentage'],
+                    'job_count': skill_data['count'],
+                    'priority': demand_level,
+                    'weight': DEMAND_WEIGHTS.get(demand_level, 0.5)
+                })
+            gaps_by_tier.append(tier_gaps)
+        critical_gaps, high_priority_gaps, medium_priority_gaps, low_priority_gaps = gaps_by_tier
+        
+        # Matched skills with demand info, sorted by demand
+        matched_skills_info = []
+        matched_by_tier = [[] for _ in DEMAND_LEVELS]
+        for i in profile.matched_order:
+            if not matched_row[i]:
+                continue
+            skill_data = skills_dict[names[i]]
             demand_level = skill_data['demand_level']
-            
-            gap_info = {
-                'skill': skill,
+            skill_info = {
+                'skill': names[i],
                 'demand_percentage': skill_data['percentage'],
-                'job_count': skill_data['count'],
-                'priority': demand_level,
-                'weight': demand_weights.get(demand_level, 0.5)
+                'demand_level': demand_level,
+                'weight': DEMAND_WEIGHTS.get(demand_level, 0.5)
             }
-            
-            if demand_level == 'Critical':
-                critical_gaps.append(gap_info)
-            elif demand_level == 'High':
-                high_priority_gaps.append(gap_info)
-            elif demand_level == 'Medium':
-                medium_priority_gaps.append(gap_info)
-            else:
-                low_priority_gaps.append(gap_info)
-        
-        # Sort each category by demand percentage
-        critical_gaps.sort(key=lambda x: x['demand_percentage'], reverse=True)
-        high_priority_gaps.sort(key=lambda x: x['demand_percentage'], reverse=True)
-        medium_priority_gaps.sort(key=lambda x: x['demand_percentage'], reverse=True)
-        low_priority_gaps.sort(key=lambda x: x['demand_percentage'], reverse=True)
-        
-        # Categorize matched skills by demand level
-        critical_matched = []
-        high_matched = []
-        medium_matched = []
-        low_matched = []
-        
-        for skill in matched_skills:
-            if skill in market_skills_dict:
-                skill_data = market_skills_dict[skill]
-                demand_level = skill_data['demand_level']
-                
-                skill_info = {
-                    'skill': skill,
-                    'demand_percentage': skill_data['percentage'],
-                    'demand_level': demand_level,
-                    'weight': demand_weights.get(demand_level, 0.5)
-                }
-                
-                matched_skills_info.append(skill_info)
-                
-                if demand_level == 'Critical':
-                    critical_matched.append(skill_info)
-                elif demand_level == 'High':
-                    high_matched.append(skill_info)
-                elif demand_level == 'Medium':
-                    medium_matched.append(skill_info)
-                else:
-                    low_matched.append(skill_info)
-        
-        matched_skills_info.sort(key=lambda x: x['demand_percentage'], reverse=True)
+            matched_skills_info.append(skill_info)
+            matched_by_tier[profile.tiers[i]].append(skill_info)
+        critical_matched, high_matched, medium_matched, low_matched = matched_by_tier
+        
+        matched_skills = [info['skill'] for info in matched_skills_info]
+        missing_count = len(profile) - len(matched_skills)
+        
+        # Calculate gaps
+        user_skills_set = set(user_skills)
+        extra_skills = user_skills_set - set(user_skills_normalized.keys())
         
         # Create result dictionary
         result = {
             'target_role': target_role,
             'match_percentage': round(weighted_match_percentage, 2),  # Use weighted match
             'simple_match_percentage': round(simple_match_percentage, 2),  # Keep simple for reference
-            'total_required_skills': len(required_skills_set),
+            'total_required_skills': len(profile),
             'user_skills_count': len(user_skills_set),
             'matched_skills_count': len(matched_skills),
-            'missing_skills_count': len(missing_skills),
+            'missing_skills_count': missing_count,
             'extra_skills_count': len(extra_skills),
             
             'summary': {
                 'matched_count': len(matched_skills),
-                'missing_count': len(missing_skills),
+                'missing_count': missing_count,
                 'extra_count': len(extra_skills)
             },
             
-            'matched_skills': sorted(list(matched_skills)),
+            'matched_skills': sorted(matched_skills),
             'matched_skills_detailed': matched_skills_info,
             
             # Breakdown by priority
             'matched_by_priority': {
-                'critical': len(critical_matched),
-                'high': len(high_matched),
-                'medium': len(medium_matched),
-                'low': len(low_matched)
+                'critical': int(tier_matched[0]),
+                'high': int(tier_matched[1]),
+                'medium': int(tier_matched[2]),
+                'low': int(tier_matched[3])
             },
             
             'skill_gaps': {
@@ -231,8 +357,8 @@ class GapAnalyzer:
                 high_matched=len(high_matched),
                 high_gaps=len(high_priority_gaps),
                 extra_skills_count=len(extra_skills),
-                total_critical=len(critical_matched) + len(critical_gaps),
-                total_high=len(high_matched) + len(high_priority_gaps)
+                total_critical=int(profile.tier_totals[0]),
+                total_high=int(profile.tier_totals[1])
             ),
             
             'recommendations': self._generate_enhanced_recommendations(
@@ -0,0 +1,228 @@
+"""
+Job Export Module
+Columnar (Parquet) snapshots of collected jobs, with column-selective reloads
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from job_store import JobStore, _location_key, _since
+from role_canonicalizer import clean_role
+from logging_setup import get_logger
+
+logger = get_logger("job_export")
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+# Columns of an export, in the collector's job field order
+JOB_COLUMNS = [
+    'id', 'source', 'title', 'company', 'location', 'description', 'salary_min', 'salary_max',
+    'created', 'redirect_url', 'url', 'contract_type', 'category', 'search_role', 'search_location',
+    'collected_at'
+]
+
+# Low-cardinality columns: stored once per distinct value (dictionary
+# encoded) on disk and kept dictionary-typed when loaded with pyarrow
+DICTIONARY_COLUMNS = [
+    'source', 'company', 'location', 'contract_type', 'category', 'search_role', 'search_location'
+]
+NUMERIC_COLUMNS = ['salary_min', 'salary_max']
+
+# Everything else a job carries is kept, as JSON, in this column
+EXTRA_COLUMN = 'extra'
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow not installed. Run: pip install pyarrow")
+
+
+def _schema() -> "pa.Schema":
+    def column_type(column: str) -> "pa.DataType":
+        if column in DICTIONARY_COLUMNS:
+            return pa.dictionary(pa.int32(), pa.string())
+        if column in NUMERIC_COLUMNS:
+            return pa.float64()
+        return pa.string()
+    return pa.schema([(column, column_type(column)) for column in JOB_COLUMNS] + [(EXTRA_COLUMN, pa.string())])
+
+
+def _row(job: Dict) -> Dict:
+    """Flatten a job to the export schema (unknown fields and odd values go to 'extra')"""
+    row, extra = {}, {}
+    for column in JOB_COLUMNS:
+        value = job.get(column)
+        if value is None:
+            row[column] = None
+        elif column in NUMERIC_COLUMNS:
+            try:
+                row[column] = float(value)
+            except (TypeError, ValueError):
+                row[column] = None
+                extra[column] = value
+        elif isinstance(value, str):
+            row[column] = value
+        else:
+            row[column] = str(value)
+            extra[column] = value  # Keep the original type (e.g. integer IDs)
+    for key, value in job.items():
+        if key not in row:
+            extra[key] = value
+    row[EXTRA_COLUMN] = json.dumps(extra, ensure_ascii=False, separators=(',', ':')) if extra else None
+    return row
+
+
+# ============================================
+# EXPORT
+# ============================================
+
+def export_parquet(
+    jobs: Iterable[Dict],
+    path: str,
+    compression: str = 'zstd',
+    batch_size: int = 5000
+) -> int:
+    """
+    Write jobs to a Parquet file
+
+    Descriptions are kept in full; source, company, location, role and
+    other repetitive columns are dictionary encoded. Jobs are written in
+    batches, so a whole job store can be exported via JobStore.iter_jobs()
+    without holding it in memory.
+
+    Returns:
+        Number of jobs written
+    """
+    _require_pyarrow()
+    schema = _schema()
+    written = 0
+    batch: List[Dict] = []
+
+    with pq.ParquetWriter(path, schema, compression=compression, use_dictionary=DICTIONARY_COLUMNS) as writer:
+        for job in jobs:
+            batch.append(_row(job))
+            if len(batch) >= batch_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                written += len(batch)
+                batch = []
+        if batch or not written:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            written += len(batch)
+
+    logger.info("Exported %d jobs to %s", written, path)
+    return written
+
+
+# ============================================
+# IMPORT
+# ============================================
+
+def _matching_values(path: str, column: str, key, wanted: str) -> "pa.Array":
+    """Distinct values of a dictionary column whose key matches (one pass over the column)"""
+    values = pq.read_table(path, columns=[column]).column(column).unique()
+    if pa.types.is_dictionary(values.type):
+        values = values.dictionary_decode()
+    return pa.array([value for value in values.to_pylist() if value is not None and key(value) == wanted], pa.string())
+
+
+def _filter(path: str, role: Optional[str], location: Optional[str], days: Optional[float]):
+    """Row filter matching job_store.job_matches, pushed down to the Parquet reader"""
+    expression = None
+
+    def both(condition):
+        return condition if expression is None else expression & condition
+
+    if role:
+        expression = both(ds.field('search_role').isin(_matching_values(path, 'search_role', clean_role, clean_role(role))))
+    if location:
+        expression = both(ds.field('search_location').isin(
+            _matching_values(path, 'search_location', _location_key, _location_key(location))
+        ))
+    lower_bound = _since(days)
+    if lower_bound:
+        no_created = ds.field('created').is_null() | (ds.field('created') == '')
+        expression = both(
+            (ds.field('created') >= lower_bound) | (no_created & (ds.field('collected_at') >= lower_bound))
+        )
+    return expression
+
+
+def read_jobs_table(
+    path: str,
+    columns: Optional[List[str]] = None,
+    role: Optional[str] = None,
+    location: Optional[str] = None,
+    days: Optional[float] = None
+) -> "pa.Table":
+    """
+    Exported jobs as a pyarrow Table (call .to_pandas() for a DataFrame)
+
+    Only the requested columns are read from disk; dictionary columns stay
+    dictionary encoded (categoricals in pandas). role, location and days
+    select the same slice as JobStore.iter_jobs.
+    """
+    _require_pyarrow()
+    return pq.read_table(path, columns=columns, filters=_filter(path, role, location, days))
+
+
+def load_jobs(
+    path: str,
+    columns: Optional[List[str]] = None,
+    role: Optional[str] = None,
+    location: Optional[str] = None,
+    days: Optional[float] = None
+) -> List[Dict]:
+    """
+    Load exported jobs as dicts
+
+    Args:
+        path: Parquet file written by export_parquet
+        columns: Only these fields (e.g. ['title', 'description']); all
+            fields, including ones kept in 'extra', when omitted
+        role, location, days: Slice to load (see read_jobs_table)
+
+    Returns:
+        List of jobs. Fields a job did not have are None; with columns,
+        export columns come back as stored (e.g. IDs as strings).
+    """
+    if columns is not None:
+        unknown = [column for column in columns if column not in JOB_COLUMNS]
+        read_columns = [column for column in columns if column in JOB_COLUMNS]
+        if unknown:
+            read_columns.append(EXTRA_COLUMN)
+    else:
+        unknown, read_columns = [], None
+    jobs = read_jobs_table(path, read_columns, role=role, location=location, days=days).to_pylist()
+
+    if columns is not None and not unknown:
+        return jobs
+    for job in jobs:
+        extra = job.pop(EXTRA_COLUMN, None)
+        if extra:
+            extra = json.loads(extra)
+            job.update(extra if columns is None else {column: extra.get(column) for column in unknown})
+        for column in unknown:
+            job.setdefault(column, None)
+    return jobs
+
+
+# ============================================
+# MAIN EXECUTION
+# ============================================
+
+if __name__ == "__main__":
+    import sys
+
+    # Snapshot the job store: python job_export.py [jobs.parquet]
+    store = JobStore()
+    output = sys.argv[1] if len(sys.argv) > 1 else f"jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
+    count = export_parquet(store.iter_jobs(), output)
+    print(f"\n💾 Exported {count} jobs from {store.path} to {output} ({os.path.getsize(output) / 1e6:.1f} MB)")
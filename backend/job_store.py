@@ -0,0 +1,372 @@
+"""
+Job Store Module
+Persistent local store of collected jobs (SQLite), deduplicated by source and job ID
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from role_canonicalizer import clean_role
+from logging_setup import get_logger
+
+logger = get_logger("job_store")
+
+
+DEFAULT_JOB_STORE_PATH = os.getenv("JOB_STORE_PATH", "jobs.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    source TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    search_role TEXT,
+    role_key TEXT,
+    search_location TEXT,
+    location_key TEXT,
+    created TEXT,
+    collected_at TEXT,
+    first_seen_at TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (source, job_id)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_role_created ON jobs (role_key, created);
+CREATE INDEX IF NOT EXISTS idx_jobs_location_created ON jobs (location_key, created);
+CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs (created);
+CREATE TABLE IF NOT EXISTS watermarks (
+    source TEXT NOT NULL,
+    role_key TEXT NOT NULL,
+    location_key TEXT NOT NULL,
+    latest_created TEXT,
+    refreshed_at TEXT NOT NULL,
+    resume_page INTEGER,
+    PRIMARY KEY (source, role_key, location_key)
+);
+"""
+
+# On conflict the posting is refreshed but keeps when it was first seen
+_UPSERT = """
+INSERT INTO jobs (
+    source, job_id, title, company, location, search_role, role_key,
+    search_location, location_key, created, collected_at, first_seen_at, data
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (source, job_id) DO UPDATE SET
+    title = excluded.title,
+    company = excluded.company,
+    location = excluded.location,
+    search_role = excluded.search_role,
+    role_key = excluded.role_key,
+    search_location = excluded.search_location,
+    location_key = excluded.location_key,
+    created = excluded.created,
+    collected_at = excluded.collected_at,
+    data = excluded.data
+"""
+
+
+def _location_key(location: Optional[str]) -> str:
+    return ' '.join((location or '').split()).lower()
+
+
+def _since(days: Optional[float] = None, since: Optional[str] = None) -> Optional[str]:
+    """Lower bound for 'created' as an ISO timestamp (UTC, second precision)"""
+    if since is not None:
+        return since
+    if days is None:
+        return None
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def job_matches(
+    job: Dict,
+    role: Optional[str] = None,
+    location: Optional[str] = None,
+    days: Optional[float] = None
+) -> bool:
+    """Whether an in-memory job falls in the slice JobStore.iter_jobs would select"""
+    if role and clean_role(job.get('search_role', '')) != clean_role(role):
+        return False
+    if location and _location_key(job.get('search_location')) != _location_key(location):
+        return False
+    lower_bound = _since(days)
+    if lower_bound and (job.get('created') or job.get('collected_at') or '') < lower_bound:
+        return False
+    return True
+
+
+class JobStore:
+    """
+    Jobs from every collection run in one local SQLite file
+
+    Postings are keyed by (source, job ID), so re-collecting a posting
+    updates it instead of adding a duplicate. Indexes on role, search
+    location and creation time let callers read slices ("Python Developer
+    jobs from the last 30 days") without loading the whole history.
+    Each call opens its own connection, so the store is safe to share
+    between threads (the API's executors, the collectors).
+    """
+
+    def __init__(self, path: str = DEFAULT_JOB_STORE_PATH):
+        self.path = str(path)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            watermark_columns = {row[1] for row in conn.execute("PRAGMA table_info(watermarks)")}
+            if 'resume_page' not in watermark_columns:  # Stores created before resumable refreshes
+                conn.execute("ALTER TABLE watermarks ADD COLUMN resume_page INTEGER")
+
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:  # Commit on success, roll back on error
+                yield conn
+        finally:
+            conn.close()
+
+
+    # ============================================
+    # WRITING
+    # ============================================
+
+    def upsert(self, jobs: Iterable[Dict]) -> Tuple[int, int]:
+        """
+        Insert new postings and refresh ones already stored
+
+        Returns:
+            Tuple of (new postings, updated postings)
+        """
+        now = datetime.now().isoformat()
+        rows = []
+        for job in jobs:
+            job_id = job.get('id')
+            if job_id is None or job_id == '':
+                continue
+            rows.append((
+                job.get('source', 'unknown'),
+                str(job_id),
+                job.get('title', ''),
+                job.get('company', ''),
+                job.get('location', ''),
+                job.get('search_role', ''),
+                clean_role(job.get('search_role', '')),
+                job.get('search_location', ''),
+                _location_key(job.get('search_location')),
+                job.get('created') or job.get('collected_at') or now,
+                job.get('collected_at') or now,
+                now,
+                json.dumps(job, ensure_ascii=False, separators=(',', ':'))
+            ))
+        if not rows:
+            return 0, 0
+
+        with self._connect() as conn:
+            # Take the write lock before counting, so concurrent upserts can't
+            # land between the two counts
+            conn.execute("BEGIN IMMEDIATE")
+            before = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+            conn.executemany(_UPSERT, rows)
+            added = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] - before
+
+        logger.info("Job store: %d new, %d updated postings (%s)", added, len(rows) - added, self.path)
+        return added, len(rows) - added
+
+
+    def import_json(self, file_path: str) -> Tuple[int, int]:
+        """Upsert a multi_source_jobs_*.json dump (e.g. from older runs)"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return self.upsert(json.load(f))
+
+
+    # ============================================
+    # READING
+    # ============================================
+
+    def _where(
+        self,
+        role: Optional[str],
+        location: Optional[str],
+        source: Optional[str],
+        days: Optional[float],
+        since: Optional[str]
+    ) -> Tuple[str, list]:
+        clauses, params = [], []
+        if role:
+            clauses.append("role_key = ?")
+            params.append(clean_role(role))
+        if location:
+            clauses.append("location_key = ?")
+            params.append(_location_key(location))
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        lower_bound = _since(days, since)
+        if lower_bound:
+            clauses.append("created >= ?")
+            params.append(lower_bound)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+    def iter_jobs(
+        self,
+        role: Optional[str] = None,
+        location: Optional[str] = None,
+        source: Optional[str] = None,
+        days: Optional[float] = None,
+        since: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 500
+    ) -> Iterator[Dict]:
+        """
+        Stream stored jobs matching the filters, newest first
+
+        Args:
+            role: Search role (matched after role-name cleaning, so
+                'python devs' finds 'Python Developer' jobs)
+            location: Search location (case-insensitive)
+            source: Job source, e.g. 'adzuna'
+            days: Only jobs created in the last N days
+            since: Only jobs created at or after this ISO timestamp
+            limit: Maximum number of jobs
+            batch_size: Rows fetched from SQLite at a time
+        """
+        where, params = self._where(role, location, source, days, since)
+        query = f"SELECT data FROM jobs{where} ORDER BY created DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+
+        with self._connect() as conn:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for (data,) in rows:
+                    yield json.loads(data)
+
+
+    def query(self, **filters) -> List[Dict]:
+        """Stored jobs matching the filters (see iter_jobs)"""
+        return list(self.iter_jobs(**filters))
+
+
+    def count(
+        self,
+        role: Optional[str] = None,
+        location: Optional[str] = None,
+        source: Optional[str] = None,
+        days: Optional[float] = None,
+        since: Optional[str] = None
+    ) -> int:
+        where, params = self._where(role, location, source, days, since)
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM jobs{where}", params).fetchone()[0]
+
+
+    def role_summary(self) -> Dict[str, Dict]:
+        """Job count and latest collection time per search role"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT search_role, COUNT(*), MAX(collected_at) FROM jobs "
+                "WHERE search_role != '' GROUP BY role_key"
+            ).fetchall()
+        return {role: {'job_count': count, 'collected_at': collected_at} for role, count, collected_at in rows}
+
+
+    def known_ids(self, source: str, job_ids: Iterable) -> Set[str]:
+        """Which of the given job IDs are already stored for a source"""
+        job_ids = [str(job_id) for job_id in job_ids]
+        known: Set[str] = set()
+        with self._connect() as conn:
+            for start in range(0, len(job_ids), 500):  # Stay under SQLite's variable limit
+                chunk = job_ids[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT job_id FROM jobs WHERE source = ? AND job_id IN ({','.join('?' * len(chunk))})",
+                    [source, *chunk]
+                ).fetchall()
+                known.update(job_id for (job_id,) in rows)
+        return known
+
+
+    # ============================================
+    # WATERMARKS
+    # ============================================
+
+    def get_watermark(self, role: str, location: str, source: str = 'adzuna') -> Optional[Dict]:
+        """
+        High-water mark of the last incremental refresh of a (role, location)
+
+        Returns:
+            {'latest_created', 'refreshed_at', 'resume_page'} or None if
+            never refreshed. latest_created is the newest posting date
+            through which every posting has been stored; resume_page is
+            set when the last refresh stopped before reaching it.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT latest_created, refreshed_at, resume_page FROM watermarks "
+                "WHERE source = ? AND role_key = ? AND location_key = ?",
+                (source, clean_role(role), _location_key(location))
+            ).fetchone()
+        if row is None:
+            return None
+        return {'latest_created': row[0], 'refreshed_at': row[1], 'resume_page': row[2]}
+
+
+    def set_watermark(
+        self,
+        role: str,
+        location: str,
+        latest_created: Optional[str],
+        source: str = 'adzuna',
+        resume_page: Optional[int] = None
+    ):
+        """
+        Record a refresh of a (role, location)
+
+        latest_created advances the high-water mark (it never moves back;
+        pass None to keep it). resume_page is where an interrupted refresh
+        stopped (None once a refresh completes).
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO watermarks (source, role_key, location_key, latest_created, refreshed_at, resume_page) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (source, role_key, location_key) DO UPDATE SET "
+                "latest_created = NULLIF(MAX(COALESCE(excluded.latest_created, ''), COALESCE(latest_created, '')), ''), "
+                "refreshed_at = excluded.refreshed_at, "
+                "resume_page = excluded.resume_page",
+                (source, clean_role(role), _location_key(location), latest_created,
+                 datetime.now().isoformat(), resume_page)
+            )
+
+
+    def __len__(self) -> int:
+        return self.count()
+
+
+# ============================================
+# MAIN EXECUTION
+# ============================================
+
+if __name__ == "__main__":
+    import sys
+
+    store = JobStore()
+
+    # Import older timestamped dumps: python job_store.py multi_source_jobs_*.json
+    for file_path in sys.argv[1:] or sorted(str(p) for p in Path('.').glob('multi_source_jobs_*.json')):
+        added, updated = store.import_json(file_path)
+        print(f"📥 {file_path}: {added} new, {updated} already stored")
+
+    print(f"\n💾 {store.path}: {len(store)} jobs")
+    for role, summary in sorted(store.role_summary().items()):
+        print(f"  • {role}: {summary['job_count']} jobs (last collected {summary['collected_at']})")
@@ -0,0 +1,102 @@
+"""
+Logging Setup
+Leveled, queue-backed logging so hot paths never block on stdout
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from typing import Dict, Optional, Tuple
+
+
+LOGGER_NAMESPACE = "skillsphere"
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_configure_lock = threading.Lock()
+
+
+# 1 of every N per-page / per-request log lines is kept (LOG_SAMPLE_EVERY=1 keeps all)
+SAMPLE_EVERY = max(1, int(os.getenv("LOG_SAMPLE_EVERY", "10")))
+
+
+def sampled(every: Optional[int] = None) -> Dict:
+    """extra= for a hot-path log line: keep 1 of every `every` (default SAMPLE_EVERY)"""
+    return {'sample_every': every or SAMPLE_EVERY}
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Pass only 1 of every N records for high-frequency messages
+
+    A record opts in with `extra={'sample_every': N}`; records are counted
+    per (logger, message template), so differently formatted arguments of
+    the same progress line share one counter. Records without sample_every
+    always pass.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._counts: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        every = getattr(record, 'sample_every', 1)
+        if every <= 1:
+            return True
+
+        key = (record.name, str(record.msg))
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        return count % every == 0
+
+
+def configure_logging(level: Optional[str] = None) -> None:
+    """
+    Route all skillsphere loggers through a queue to a background writer
+
+    The calling thread only enqueues the record; formatting and the write
+    to stdout happen on the QueueListener thread. The level defaults to
+    the LOG_LEVEL environment variable (INFO if unset). Safe to call more
+    than once; later calls only change the level.
+    """
+    global _listener
+
+    root = logging.getLogger(LOGGER_NAMESPACE)
+    root.setLevel((level or os.getenv("LOG_LEVEL", "INFO")).upper())
+
+    with _configure_lock:
+        if _listener is not None:
+            return
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.addFilter(SamplingFilter())
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+        root.addHandler(queue_handler)
+        root.propagate = False
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get a module logger under the skillsphere namespace"""
+    configure_logging_once()
+    return logging.getLogger(f"{LOGGER_NAMESPACE}.{name}")
+
+
+def configure_logging_once() -> None:
+    """Configure with defaults unless already configured"""
+    if _listener is None:
+        configure_logging()
@@ -0,0 +1,389 @@
+"""
+Metrics Module
+In-process Prometheus-style metrics: counters, gauges, histograms and stage timers
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# ============================================
+# METRIC TYPES
+# ============================================
+
+class _Metric:
+    """Base class: a named metric family with fixed label names"""
+
+    metric_type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.metric_type}'
+        ]
+        lines.extend(self.samples())
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    metric_type = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be read from a callback at scrape time"""
+
+    metric_type = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._functions: Dict[Tuple[str, ...], Callable[[], float]] = {}
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float], **labels):
+        """Report function() at scrape time for these labels"""
+        with self._lock:
+            self._functions[self._key(labels)] = function
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+        for key, function in functions.items():
+            try:
+                values[key] = float(function())
+            except Exception:
+                continue
+        return [
+            f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+            for key, value in sorted(values.items())
+        ]
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observed values (e.g. latencies in seconds)"""
+
+    metric_type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self._series: Dict[Tuple[str, ...], List[float]] = {}  # bucket counts + [sum, count]
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        lines = []
+        for key, series in items:
+            for bound, count in zip(self.buckets, series):
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f'{self.name}_bucket{_format_labels(self.labelnames, key, le)} {_format_value(count)}')
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f'{self.name}_sum{labels} {_format_value(series[-2])}')
+            lines.append(f'{self.name}_count{labels} {_format_value(series[-1])}')
+        return lines
+
+
+# ============================================
+# REGISTRY
+# ============================================
+
+class MetricsRegistry:
+    """Collection of metrics rendered together in the text exposition format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, documentation, labelnames))
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, documentation, labelnames))
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS
+) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))
+
+
+# ============================================
+# APPLICATION METRICS
+# ============================================
+
+HTTP_REQUESTS = counter(
+    'skillsphere_http_requests_total',
+    'HTTP requests by route and status',
+    ['method', 'route', 'status']
+)
+
+HTTP_LATENCY = histogram(
+    'skillsphere_http_request_duration_seconds',
+    'HTTP request latency by route',
+    ['method', 'route']
+)
+
+STAGE_LATENCY = histogram(
+    'skillsphere_stage_duration_seconds',
+    'Pipeline stage duration (extraction, matching, upstream calls, scoring)',
+    ['stage']
+)
+
+CACHE_REQUESTS = counter(
+    'skillsphere_cache_requests_total',
+    'Cache lookups by cache and result (hit/miss)',
+    ['cache', 'result']
+)
+
+CACHE_HIT_RATIO = gauge(
+    'skillsphere_cache_hit_ratio',
+    'Cache hits / lookups since start',
+    ['cache']
+)
+
+EXECUTOR_QUEUE_DEPTH = gauge(
+    'skillsphere_executor_queue_depth',
+    'Work items submitted to an executor and not yet finished',
+    ['executor']
+)
+
+ADMISSION_REJECTED = counter(
+    'skillsphere_admission_rejected_total',
+    'Requests shed by admission control, by class and reason',
+    ['admission_class', 'reason']
+)
+
+ADMISSION_IN_FLIGHT = gauge(
+    'skillsphere_admission_in_flight',
+    'Requests currently admitted per admission class',
+    ['admission_class']
+)
+
+ADMISSION_WAITING = gauge(
+    'skillsphere_admission_waiting',
+    'Requests waiting for a slot per admission class',
+    ['admission_class']
+)
+
+CIRCUIT_STATE = gauge(
+    'skillsphere_circuit_state',
+    'Upstream circuit breaker state (0 closed, 1 half-open, 2 open)',
+    ['upstream']
+)
+
+CIRCUIT_SHORT_CIRCUITED = counter(
+    'skillsphere_circuit_short_circuited_total',
+    'Upstream calls refused because the circuit was open',
+    ['upstream']
+)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Time a pipeline stage, e.g. `with stage_timer('gap_scoring'):`"""
+    with STAGE_LATENCY.time(stage=stage):
+        yield
+
+
+def timed_stage(stage: str):
+    """Decorator form of stage_timer"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with STAGE_LATENCY.time(stage=stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    """Count a cache lookup and keep its hit ratio gauge current"""
+    CACHE_REQUESTS.inc(cache=cache, result='hit' if hit else 'miss')
+
+    hits = CACHE_REQUESTS.get(cache=cache, result='hit')
+    total = hits + CACHE_REQUESTS.get(cache=cache, result='miss')
+    CACHE_HIT_RATIO.set(hits / total if total else 0.0, cache=cache)
+
+
+def track_executor(name: str, executor) -> None:
+    """
+    Report an executor's outstanding work (queued or running) at scrape time
+
+    Wraps the executor's submit() to count work items until their futures
+    finish, so it also covers loop.run_in_executor() calls.
+    """
+    lock = threading.Lock()
+    pending = [0]
+    submit = executor.submit
+
+    def finished(_future):
+        with lock:
+            pending[0] -= 1
+
+    @wraps(submit)
+    def counted_submit(*args, **kwargs):
+        with lock:
+            pending[0] += 1
+        try:
+            future = submit(*args, **kwargs)
+        except BaseException:
+            finished(None)
+            raise
+        future.add_done_callback(finished)
+        return future
+
+    executor.submit = counted_submit
+    EXECUTOR_QUEUE_DEPTH.set_function(lambda: pending[0], executor=name)
+
+
+# ============================================
+# ASGI MIDDLEWARE
+# ============================================
+
+class MetricsMiddleware:
+    """Record request count and latency per route template"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = {'code': 500}
+
+        async def send_with_status(message):
+            if message['type'] == 'http.response.start':
+                status['code'] = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get('route')
+            # Use the route template, not the raw path, to bound label cardinality
+            route_path = getattr(route, 'path', None) or 'unmatched'
+            method = scope.get('method', '')
+            HTTP_REQUESTS.inc(method=method, route=route_path, status=str(status['code']))
+            HTTP_LATENCY.observe(time.perf_counter() - start, method=method, route=route_path)
@@ -3,24 +3,168 @@ Job Collector - Adzuna API
 Collects jobs from Adzuna API (India's largest job aggregator)
 """
 
+import asyncio
+import os
 import requests
 import json
 import time
-from datetime import datetime
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Callable, List, Dict, Optional, Set, Tuple
 from pathlib import Path
 
+from metrics import stage_timer
+from resilience import CircuitOpenError, Deadline, call_timeout, get_breaker
+from job_store import JobStore
+from job_export import export_parquet
+from rate_limiter import backoff_delay, get_bucket, parse_retry_after
+from logging_setup import get_logger, sampled
+
+logger = get_logger("collector")
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def standin_enabled() -> bool:
+    """Whether collectors answer from the offline stand-in, adzuna_standin.py (ADZUNA_STANDIN=1)"""
+    return os.getenv("ADZUNA_STANDIN", "").lower() in ('1', 'true', 'yes')
+
+
+# The stand-in is a test double: only loaded when selected
+USE_STANDIN = standin_enabled()
+if USE_STANDIN:
+    from adzuna_standin import StandinAdapter, StandinAsyncTransport
+
+
+# Responses retried with backoff (429s also pause the shared rate limiter)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+ADZUNA_PAGE_SIZE = 50
+
+# How far back the first incremental refresh of a role collects
+REFRESH_HORIZON_DAYS = float(os.getenv("ADZUNA_REFRESH_HORIZON_DAYS", "30"))
+
+
+class _RefreshRun:
+    """
+    Paging state of one incremental refresh
+    
+    Results are sorted newest first, so a refresh is complete at the first
+    page made entirely of stored postings, at a posting from before the
+    watermark (or, on the first refresh, the horizon) or at the last page
+    of results; only then does the watermark advance. A refresh cut short
+    (failed page, deadline, max_pages) keeps the watermark and records the
+    page it got to. Stored pages don't end the next refresh, which may
+    have gaps behind them: it skips to that page at the first one and
+    then runs down to the watermark.
+    """
+    
+    def __init__(self, watermark: Optional[Dict]):
+        watermark = watermark or {}
+        horizon = datetime.now(timezone.utc) - timedelta(days=REFRESH_HORIZON_DAYS)
+        self.since = watermark.get('latest_created') or horizon.strftime('%Y-%m-%dT%H:%M:%SZ')
+        self.resume_page = watermark.get('resume_page')
+        self.stop_at_stored = self.resume_page is None  # The last refresh was complete
+        self.page = 1  # Next page to fetch
+        self.pages_fetched = 0
+        self.latest: Optional[str] = None
+        self.new_jobs: List[Dict] = []
+        self.complete = False
+    
+    
+    def fresh_postings(self, page_jobs: List[Dict], known: Set[str]) -> List[Dict]:
+        """Postings of a page that are neither stored nor older than the watermark"""
+        return [
+            job for job in page_jobs
+            if str(job['id']) not in known and not (job.get('created') and job['created'] < self.since)
+        ]
+    
+    
+    def advance(self, page_jobs: List[Dict], fresh: List[Dict]) -> bool:
+        """Record a fetched page; returns False once the refresh is complete"""
+        self.pages_fetched += 1
+        self.new_jobs.extend(fresh)
+        self.latest = max(filter(None, [self.latest, *(job.get('created') for job in page_jobs)]), default=None)
+        
+        reached_watermark = any(job.get('created') and job['created'] <= self.since for job in page_jobs)
+        if reached_watermark or len(page_jobs) < ADZUNA_PAGE_SIZE:
+            self.complete = True
+            return False
+        
+        if not fresh and self.resume_page:
+            # Stored by the interrupted refresh: skip to where it stopped
+            # (postings added since only push its pages later)
+            self.page = max(self.page + 1, self.resume_page)
+            self.resume_page = None
+        elif not fresh and self.stop_at_stored:
+            self.complete = True  # Caught up with the store
+            return False
+        else:
+            self.page += 1
+        return True
+    
+    
+    def save(self, store: JobStore, role: str, location: str):
+        """Record the refresh in the store (nothing if no page was fetched)"""
+        if not self.pages_fetched:
+            return
+        if self.complete:
+            store.set_watermark(role, location, self.latest)
+        else:
+            store.set_watermark(role, location, None, resume_page=self.page)
+        logger.info("Adzuna refresh for %r in %s: %d new postings from %d pages (%s)",
+                    role, location, len(self.new_jobs), self.pages_fetched,
+                    f"watermark {self.latest}" if self.complete else f"incomplete, resume at page {self.page}")
+
 
 class JobCollector:
-    """Collect jobs from Adzuna API"""
+    """
+    Collect jobs from Adzuna API
     
-    def __init__(self):
+    Requests go through one keep-alive session and the process-wide Adzuna
+    token bucket (shared with the API's async collector), so collection
+    runs at the configured quota instead of sleeping after every page.
+    429 and 5xx responses are retried with jittered exponential backoff,
+    honouring Retry-After.
+    """
+    
+    def __init__(self, requests_per_second: Optional[float] = None, max_retries: Optional[int] = None):
         # Adzuna API Credentials
         self.adzuna_app_id = "28172709"
         self.adzuna_app_key = "66743682dbb92536948653f3da9b05c9"
         
-        # API Base URL
-        self.adzuna_base_url = "https://api.adzuna.com/v1/api/jobs/in/search"
+        # API Base URL (point at adzuna_standin.py's server for offline runs)
+        self.adzuna_base_url = os.getenv("ADZUNA_BASE_URL", "https://api.adzuna.com/v1/api/jobs/in/search")
+        
+        # Offline runs: answer from adzuna_standin instead of the network
+        self.use_standin = USE_STANDIN
+        
+        # Save live responses here so the stand-in can replay them
+        self.record_dir = os.getenv("ADZUNA_RECORD_DIR") or None
+        
+        # Per-page request timeout (capped by the caller's deadline, if any)
+        self.timeout = 10.0
+        
+        # Shared by every collector in the process: Adzuna's request quota
+        self.rate_limiter = get_bucket(
+            'adzuna',
+            rate=requests_per_second or float(os.getenv("ADZUNA_REQUESTS_PER_SECOND", "5")),
+            capacity=float(os.getenv("ADZUNA_BURST", "5"))
+        )
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("ADZUNA_MAX_RETRIES", "3"))
+        self.session = self._build_session()
+        
+        # Shared by every collector: stop calling Adzuna while it is failing
+        self.adzuna_breaker = get_breaker(
+            'adzuna',
+            failure_threshold=int(os.getenv("ADZUNA_BREAKER_FAILURES", "5")),
+            slow_call_seconds=float(os.getenv("ADZUNA_BREAKER_SLOW_SECONDS", "8")),
+            reset_timeout=float(os.getenv("ADZUNA_BREAKER_RESET_SECONDS", "30"))
+        )
         
         # Statistics
         self.stats = {
@@ -32,7 +176,174 @@ class JobCollector:
     # ADZUNA API
     # ============================================
     
-    def collect_from_adzuna(self, role: str, pages: int = 5, location: str = "India", page_offset: int = 0) -> List[Dict]:
+    def _build_session(self) -> requests.Session:
+        """Keep-alive session that also retries connection errors with backoff"""
+        retry_settings = dict(
+            total=2,
+            connect=2,
+            read=2,
+            status=0,  # Retried by _get_adzuna_page, which shares the rate limiter
+            backoff_factor=0.5,
+            allowed_methods=frozenset(['GET'])
+        )
+        try:
+            retry = Retry(**retry_settings, backoff_jitter=0.5)
+        except TypeError:  # urllib3 < 2 has no jitter
+            retry = Retry(**retry_settings)
+        
+        session = requests.Session()
+        if self.use_standin:
+            adapter = StandinAdapter()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        else:
+            session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=10, max_retries=retry))
+        return session
+    
+    
+    def _record_page(self, role: str, location: str, page: int, data: Dict):
+        """Save a live results page under ADZUNA_RECORD_DIR (if set) for the stand-in"""
+        if self.record_dir is None or self.use_standin:
+            return
+        from adzuna_standin import record_page  # Only needed when recording
+        try:
+            record_page(self.record_dir, role, location, page, data)
+        except OSError as e:
+            logger.warning("Could not record Adzuna page %d: %s", page, e)
+    
+    
+    def _retry_delay(self, page: int, status_code: int, retry_after: Optional[str], attempt: int) -> float:
+        """Backoff before retrying a page; a 429 also pauses every Adzuna caller"""
+        delay = backoff_delay(attempt, retry_after=parse_retry_after(retry_after))
+        logger.warning("Adzuna page %d: HTTP %d, retry %d/%d in %.1fs",
+                       page, status_code, attempt + 1, self.max_retries, delay)
+        if status_code == 429:
+            self.rate_limiter.pause(delay)
+        return delay
+    
+    
+    def _rate_limited(self, page: int, response) -> None:
+        """
+        A page still rate limited after every retry
+        
+        Pauses every Adzuna caller instead of counting against the circuit
+        breaker: a 429 means Adzuna is up, just busy.
+        """
+        logger.warning("Adzuna page %d: still rate limited after %d retries", page, self.max_retries)
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        self.rate_limiter.pause(backoff_delay(self.max_retries, retry_after=retry_after))
+        self.adzuna_breaker.release()
+        self.stats['adzuna']['failed'] += 1
+    
+    
+    def _get_adzuna_page(
+        self,
+        url: str,
+        params: Dict,
+        page: int,
+        deadline: Optional[Deadline] = None
+    ) -> Tuple[Optional[requests.Response], float]:
+        """
+        GET one results page within the rate limit, retrying 429 and 5xx
+        
+        Returns:
+            Tuple of (last response, duration of the last attempt); the
+            response is None if the deadline ran out while waiting
+        """
+        response, duration = None, 0.0
+        for attempt in range(self.max_retries + 1):
+            if not self.rate_limiter.acquire(timeout=deadline.remaining() if deadline is not None else None):
+                break
+            
+            self.stats['adzuna']['attempted'] += 1
+            start = time.monotonic()
+            with stage_timer('adzuna_fetch'):
+                response = self.session.get(url, params=params, timeout=call_timeout(deadline, self.timeout))
+            duration = time.monotonic() - start
+            
+            if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                break
+            
+            delay = self._retry_delay(page, response.status_code, response.headers.get('Retry-After'), attempt)
+            if deadline is not None and delay > deadline.remaining():
+                break
+            if response.status_code != 429:
+                time.sleep(delay)  # A 429 waits in rate_limiter.acquire instead
+        
+        return response, duration
+    
+    
+    def _collect_adzuna_page(
+        self,
+        role: str,
+        location: str,
+        page: int,
+        deadline: Optional[Deadline] = None
+    ) -> Optional[List[Dict]]:
+        """
+        Fetch and normalize one Adzuna results page
+        
+        Returns:
+            List of jobs, an empty list when there are no more results,
+            or None if the request failed or was skipped (deadline
+            reached, circuit open)
+        """
+        if deadline is not None and deadline.expired:
+            logger.warning("Adzuna: deadline reached at page %d", page)
+            return None
+        
+        try:
+            self.adzuna_breaker.allow()
+        except CircuitOpenError:
+            logger.warning("Adzuna: circuit open, skipping page %d", page)
+            return None
+        
+        url = f"{self.adzuna_base_url}/{page}"
+        params = self._adzuna_params(role, location)
+        
+        try:
+            response, duration = self._get_adzuna_page(url, params, page, deadline)
+            if response is None:
+                logger.warning("Adzuna: deadline reached at page %d", page)
+                self.adzuna_breaker.release()
+                return None
+            data = response.json() if response.status_code == 200 else None
+            page_jobs = data.get('results', []) if data is not None else None
+        except Exception as e:
+            logger.warning("Adzuna page %d: %s", page, e)
+            self.adzuna_breaker.record_failure(type(e).__name__)
+            self.stats['adzuna']['failed'] += 1
+            return None
+        
+        if page_jobs is None:
+            if response.status_code == 429:
+                self._rate_limited(page, response)
+                return None
+            logger.warning("Adzuna page %d: HTTP %d", page, response.status_code)
+            self.adzuna_breaker.record_failure(f"HTTP {response.status_code}")
+            self.stats['adzuna']['failed'] += 1
+            return None
+        
+        self.adzuna_breaker.record_success(duration)
+        self._record_page(role, location, page, data)
+        self.stats['adzuna']['collected'] += len(page_jobs)
+        
+        # Normalize Adzuna data format
+        return [
+            self._normalize_adzuna_job(job, role, location, f"adzuna_{page}_{i}")
+            for i, job in enumerate(page_jobs)
+        ]
+    
+    
+    def collect_from_adzuna(
+        self,
+        role: str,
+        pages: int = 5,
+        location: str = "India",
+        page_offset: int = 0,
+        progress_callback: Optional[Callable[[Dict], None]] = None,
+        deadline: Optional[Deadline] = None
+    ) -> List[Dict]:
         """
         Collect jobs from Adzuna API
         
@@ -41,103 +352,93 @@ class JobCollector:
             pages: Number of pages (50 jobs per page)
             location: Location to search in (default: India)
             page_offset: Starting page offset (for pagination)
+            progress_callback: Optional callable receiving a progress event
+                ({'stage': 'collect', ...}) after every collected page
+            deadline: Optional overall time budget; collection stops with
+                the jobs gathered so far once it runs out
             
         Returns:
             List of job dictionaries
         """
         
-        print(f"\n{'='*60}")
-        print(f"📥 ADZUNA: Collecting jobs for '{role}' in {location}")
-        print(f"{'='*60}")
+        logger.debug("Adzuna: collecting jobs for %r in %s", role, location, extra=sampled())
         
         jobs = []
         
-        # Determine location parameter for Adzuna API
-        location_param = None
-        if location.lower() != "india":
-            location_param = location
-        
         for page in range(1 + page_offset, pages + 1 + page_offset):
-            self.stats['adzuna']['attempted'] += 1
-            
-            url = f"{self.adzuna_base_url}/{page}"
-            
-            params = {
-                "app_id": self.adzuna_app_id,
-                "app_key": self.adzuna_app_key,
-                "what": role,
-                "results_per_page": 50,
-                "sort_by": "date"
-            }
+            page_jobs = self._collect_adzuna_page(role, location, page, deadline)
+            if page_jobs is None:
+                if (deadline is not None and deadline.expired) or self.adzuna_breaker.retry_after() > 0:
+                    break  # Out of time, or the circuit is open
+                continue  # Skip a failed page
+            if not page_jobs:
+                break  # No more results
             
-            # Add location parameter if specified
-            if location_param:
-                params["where"] = location_param
+            jobs.extend(page_jobs)
+            logger.debug("Adzuna page %d/%d: %d jobs (total: %d)", page, pages + page_offset, len(page_jobs), len(jobs),
+                         extra=sampled())
             
-            try:
-                print(f"  Page {page}/{pages + page_offset}...", end=" ")
-                response = requests.get(url, params=params, timeout=10)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    page_jobs = data.get('results', [])
-                    
-                    if not page_jobs:
-                        print("❌ No more jobs")
-                        break
-                    
-                    # Normalize Adzuna data format
-                    for job in page_jobs:
-                        normalized = {
-                            'source': 'adzuna',
-                            'id': job.get('id', f"adzuna_{len(jobs)}"),
-                            'title': job.get('title', ''),
-                            'company': job.get('company', {}).get('display_name', ''),
-                            'location': job.get('location', {}).get('display_name', location),
-                            'description': job.get('description', ''),
-                            'salary_min': job.get('salary_min'),
-                            'salary_max': job.get('salary_max'),
-                            'created': job.get('created', ''),
-                            'redirect_url': job.get('redirect_url', ''),
-                            'contract_type': job.get('contract_type', 'Full-time'),
-                            'category': job.get('category', {}).get('label', 'Technology'),
-                            'search_role': role,
-                            'search_location': location,
-                            'collected_at': datetime.now().isoformat()
-                        }
-                        jobs.append(normalized)
-                    
-                    self.stats['adzuna']['collected'] += len(page_jobs)
-                    print(f"✅ {len(page_jobs)} jobs (Total: {len(jobs)})")
-                    
-                elif response.status_code == 429:
-                    print("⚠️  Rate limit reached")
-                    self.stats['adzuna']['failed'] += 1
-                    break
-                else:
-                    print(f"❌ Error {response.status_code}")
-                    self.stats['adzuna']['failed'] += 1
-                
-                # Respect rate limits
-                time.sleep(1)
-                
-            except Exception as e:
-                print(f"❌ Error: {e}")
-                self.stats['adzuna']['failed'] += 1
-                continue
+            if progress_callback:
+                progress_callback(self.page_event(page, pages, len(page_jobs), len(jobs)))
         
-        print(f"✅ Adzuna: Collected {len(jobs)} jobs")
+        logger.info("Adzuna: collected %d jobs for %r in %s", len(jobs), role, location, extra=sampled())
         return jobs
     
     
-        return jobs
+    def page_event(self, page: int, pages: int, page_jobs: int, jobs_collected: int) -> Dict:
+        """Progress event for a collected results page"""
+        return {
+            'stage': 'collect',
+            'page': page,
+            'pages': pages,
+            'page_jobs': page_jobs,
+            'jobs_collected': jobs_collected
+        }
+    
+    
+    def _adzuna_params(self, role: str, location: str) -> Dict:
+        """Build Adzuna query parameters for a role/location search"""
+        params = {
+            "app_id": self.adzuna_app_id,
+            "app_key": self.adzuna_app_key,
+            "what": role,
+            "results_per_page": ADZUNA_PAGE_SIZE,
+            "sort_by": "date"
+        }
+        
+        # Add location parameter if specified (Adzuna searches all of India by default)
+        if location.lower() != "india":
+            params["where"] = location
+        
+        return params
+    
+    
+    def _normalize_adzuna_job(self, job: Dict, role: str, location: str, fallback_id: str) -> Dict:
+        """Normalize an Adzuna result to the collector's job format"""
+        return {
+            'source': 'adzuna',
+            'id': job.get('id', fallback_id),
+            'title': job.get('title', ''),
+            'company': job.get('company', {}).get('display_name', ''),
+            'location': job.get('location', {}).get('display_name', location),
+            'description': job.get('description', ''),
+            'salary_min': job.get('salary_min'),
+            'salary_max': job.get('salary_max'),
+            'created': job.get('created', ''),
+            'redirect_url': job.get('redirect_url', ''),
+            'contract_type': job.get('contract_type', 'Full-time'),
+            'category': job.get('category', {}).get('label', 'Technology'),
+            'search_role': role,
+            'search_location': location,
+            'collected_at': datetime.now().isoformat()
+        }
     
     
     # ============================================
     # MULTI-ROLE COLLECTION
     # ============================================
     
-    def collect_multiple_roles(self, roles: List[str], pages_per_role: int = 2) -> List[Dict]:
+    def print_statistics(self):
         """Print collection statistics"""
         
         print("\n" + "="*60)
@@ -171,7 +472,10 @@ class JobCollector:
     
     def collect_multiple_roles(self, roles: List[str], pages_per_role: int = 2) -> List[Dict]:
         """
-        Collect jobs for multiple roles from Adzuna
+        Collect jobs for multiple roles from Adzuna, one role at a time
+        
+        For many roles use collection_scheduler.CollectionScheduler, which
+        refreshes them concurrently under the same rate limit.
         
         Args:
             roles: List of job roles
@@ -180,12 +484,10 @@ class JobCollector:
         Returns:
             Combined list of jobs
         """
-        print("\n" + "🚀"*30)
-        print("MULTI-ROLE JOB COLLECTION")
-        print("🚀"*30)
-        print(f"\nRoles: {', '.join(roles)}")
-        print(f"Pages per role: {pages_per_role}")
-        print(f"Expected jobs: ~{len(roles) * pages_per_role * 50}")
+        logger.info(
+            "Multi-role collection: %d roles x %d pages (~%d jobs expected)",
+            len(roles), pages_per_role, len(roles) * pages_per_role * 50
+        )
         
         all_jobs = []
         
@@ -194,27 +496,345 @@ class JobCollector:
                 jobs = self.collect_from_adzuna(role, pages=pages_per_role)
                 all_jobs.extend(jobs)
             except Exception as e:
-                print(f"\n⚠️  Failed to collect for '{role}': {e}")
+                logger.warning("Failed to collect for %r: %s", role, e)
                 continue
         
         return all_jobs
 
 
+# ============================================
+# ASYNC COLLECTOR
+# ============================================
+
+class AsyncJobCollector(JobCollector):
+    """
+    Collect jobs from Adzuna with concurrent page fetches
+    
+    Uses one pooled keep-alive HTTP client for all requests, fetches the
+    pages of a search concurrently (bounded by max_concurrency) and spaces
+    request starts through the shared Adzuna token bucket.
+    """
+    
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        requests_per_second: Optional[float] = None,
+        timeout: float = 10.0,
+        max_retries: Optional[int] = None
+    ):
+        super().__init__(requests_per_second=requests_per_second, max_retries=max_retries)
+        
+        if httpx is None:
+            raise ImportError("httpx not installed. Run: pip install httpx")
+        
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client = None
+    
+    
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Shared pooled client, created on first use inside the event loop"""
+        if self._client is None or self._client.is_closed:
+            if self.use_standin:
+                transport = StandinAsyncTransport()
+            else:
+                transport = httpx.AsyncHTTPTransport(
+                    retries=2,  # Connection errors; responses are retried in fetch_adzuna_page
+                    limits=httpx.Limits(
+                        max_connections=self.max_concurrency,
+                        max_keepalive_connections=self.max_concurrency
+                    )
+                )
+            self._client = httpx.AsyncClient(timeout=self.timeout, transport=transport)
+        return self._client
+    
+    
+    async def aclose(self):
+        """Close the pooled HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    
+    async def fetch_adzuna_page(
+        self,
+        role: str,
+        location: str,
+        page: int,
+        deadline: Optional[Deadline] = None
+    ) -> Optional[List[Dict]]:
+        """
+        Fetch and normalize one Adzuna results page
+        
+        Returns:
+            List of jobs, an empty list when there are no more results,
+            or None if the request failed or was skipped (deadline
+            reached, circuit open)
+        """
+        url = f"{self.adzuna_base_url}/{page}"
+        params = self._adzuna_params(role, location)
+        
+        async with self._semaphore:
+            if deadline is not None and deadline.expired:
+                return None
+            try:
+                self.adzuna_breaker.allow()
+            except CircuitOpenError:
+                logger.debug("Adzuna page %d: circuit open", page, extra=sampled())
+                return None
+            
+            for attempt in range(self.max_retries + 1):
+                if not await self.rate_limiter.acquire_async(
+                    timeout=deadline.remaining() if deadline is not None else None
+                ) or (deadline is not None and deadline.expired):
+                    if attempt == 0:
+                        self.adzuna_breaker.release()  # Out of time before the first request
+                        return None
+                    break  # Out of time for a retry: report the last response
+                
+                self.stats['adzuna']['attempted'] += 1
+                
+                start = time.monotonic()
+                try:
+                    with stage_timer('adzuna_fetch'):
+                        response = await self._get_client().get(
+                            url, params=params, timeout=call_timeout(deadline, self.timeout)
+                        )
+                except Exception as e:
+                    logger.warning("Adzuna page %d: %s", page, e)
+                    self.adzuna_breaker.record_failure(type(e).__name__)
+                    self.stats['adzuna']['failed'] += 1
+                    return None
+                duration = time.monotonic() - start
+                
+                if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                    break
+                
+                delay = self._retry_delay(page, response.status_code, response.headers.get('Retry-After'), attempt)
+                if deadline is not None and delay > deadline.remaining():
+                    break
+                if response.status_code != 429:
+                    await asyncio.sleep(delay)  # A 429 waits in rate_limiter.acquire_async instead
+        
+        if response.status_code == 200:
+            try:
+                data = response.json()
+                page_jobs = data.get('results', [])
+            except Exception as e:  # 200 with a body that isn't Adzuna JSON
+                logger.warning("Adzuna page %d: invalid response body: %s", page, e)
+                self.adzuna_breaker.record_failure(type(e).__name__)
+                self.stats['adzuna']['failed'] += 1
+                return None
+            self.adzuna_breaker.record_success(duration)
+            if self.record_dir is not None and not self.use_standin:
+                # File writes stay off the event loop
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._record_page, role, location, page, data
+                )
+            self.stats['adzuna']['collected'] += len(page_jobs)
+            logger.debug("Adzuna page %d: %d jobs", page, len(page_jobs), extra=sampled())
+            return [
+                self._normalize_adzuna_job(job, role, location, f"adzuna_{page}_{i}")
+                for i, job in enumerate(page_jobs)
+            ]
+        
+        if response.status_code == 429:
+            self._rate_limited(page, response)
+            return None
+        logger.warning("Adzuna page %d: HTTP %d", page, response.status_code)
+        self.adzuna_breaker.record_failure(f"HTTP {response.status_code}")
+        self.stats['adzuna']['failed'] += 1
+        return None
+    
+    
+    async def iter_adzuna_pages(
+        self,
+        role: str,
+        pages: int = 5,
+        location: str = "India",
+        page_offset: int = 0,
+        deadline: Optional[Deadline] = None
+    ) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """
+        Fetch Adzuna pages concurrently and yield them as they arrive
+        
+        Args:
+            role: Job role to search
+            pages: Number of pages (50 jobs per page)
+            location: Location to search in (default: India)
+            page_offset: Starting page offset (for pagination)
+            deadline: Optional overall time budget; pages still pending
+                when it runs out are cancelled
+            
+        Yields:
+            (page number, normalized jobs) in completion order
+        """
+        tasks = {
+            asyncio.ensure_future(self.fetch_adzuna_page(role, location, page, deadline)): page
+            for page in range(1 + page_offset, pages + 1 + page_offset)
+        }
+        
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(
+                    tasks,
+                    timeout=deadline.remaining() if deadline is not None else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                if not done:
+                    logger.warning("Adzuna: deadline reached with %d pages pending", len(tasks))
+                    break
+                
+                for task in done:
+                    page = tasks.pop(task)
+                    page_jobs = task.result()
+                    
+                    if page_jobs is None:
+                        continue
+                    
+                    if not page_jobs:
+                        # No more results: later pages will be empty too
+                        for other in [t for t, p in tasks.items() if p > page]:
+                            other.cancel()
+                            tasks.pop(other)
+                        continue
+                    
+                    yield page, page_jobs
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    
+    async def collect_from_adzuna_async(
+        self,
+        role: str,
+        pages: int = 5,
+        location: str = "India",
+        page_offset: int = 0,
+        progress_callback: Optional[Callable[[Dict], None]] = None,
+        deadline: Optional[Deadline] = None
+    ) -> List[Dict]:
+        """
+        Collect jobs from Adzuna API, fetching pages concurrently
+        
+        Same arguments and result as collect_from_adzuna; jobs are returned
+        in page order. Progress events are emitted in completion order.
+        """
+        logger.debug("Adzuna (async): collecting jobs for %r in %s", role, location, extra=sampled())
+        
+        jobs_by_page = {}
+        jobs_collected = 0
+        async for page, page_jobs in self.iter_adzuna_pages(role, pages, location, page_offset, deadline):
+            jobs_by_page[page] = page_jobs
+            jobs_collected += len(page_jobs)
+            if progress_callback:
+                progress_callback(self.page_event(page, pages, len(page_jobs), jobs_collected))
+        
+        jobs = [job for page in sorted(jobs_by_page) for job in jobs_by_page[page]]
+        
+        logger.info("Adzuna: collected %d jobs for %r in %s", len(jobs), role, location, extra=sampled())
+        return jobs
+    
+    
+    async def collect_new_from_adzuna_async(
+        self,
+        role: str,
+        store: JobStore,
+        location: str = "India",
+        max_pages: int = 5,
+        deadline: Optional[Deadline] = None
+    ) -> List[Dict]:
+        """
+        Collect only postings newer than the last refresh of a (role, location)
+        
+        Pages are fetched one after another, since each decides whether the
+        next is needed (see _RefreshRun); run several roles at once for
+        concurrency. Store reads and writes run in the default executor, so
+        new postings reach the store as each page arrives. A refresh cut
+        short by a failed page, the deadline or max_pages keeps the
+        watermark and resumes next time.
+        
+        Args:
+            role: Job role to search
+            store: Job store holding the postings seen so far
+            location: Location to search in (default: India)
+            max_pages: Upper bound on pages per refresh
+            deadline: Optional overall time budget
+            
+        Returns:
+            The new postings
+        """
+        loop = asyncio.get_running_loop()
+        watermark = await loop.run_in_executor(None, store.get_watermark, role, location)
+        run = _RefreshRun(watermark)
+        
+        while run.pages_fetched < max_pages:
+            page_jobs = await self.fetch_adzuna_page(role, location, run.page, deadline)
+            if page_jobs is None:
+                break  # Failed: resume from this page next time
+            
+            known = await loop.run_in_executor(
+                None, store.known_ids, 'adzuna', [job['id'] for job in page_jobs]
+            )
+            fresh = run.fresh_postings(page_jobs, known)
+            if fresh:
+                await loop.run_in_executor(None, store.upsert, fresh)
+            if not run.advance(page_jobs, fresh):
+                break
+        
+        await loop.run_in_executor(None, run.save, store, role, location)
+        return run.new_jobs
+
+
 # ============================================
 # HELPER FUNCTIONS
 # ============================================
 
-def save_jobs(jobs: List[Dict], prefix: str = "multi_source_jobs") -> str:
-    """Save jobs to JSON and CSV files"""
+def save_jobs(
+    jobs: List[Dict],
+    prefix: str = "multi_source_jobs",
+    store: Optional[JobStore] = None,
+    export: bool = False
+) -> str:
+    """
+    Save jobs to the local job store, deduplicated by source and job ID
+    
+    Args:
+        jobs: Collected jobs
+        prefix: File name prefix for exported snapshots
+        store: Job store to write to (default: JOB_STORE_PATH)
+        export: Also write a timestamped snapshot of these jobs (Parquet
+            if pyarrow is installed, else JSON and CSV)
+        
+    Returns:
+        Path of the job store
+    """
+    store = store if store is not None else JobStore()
+    added, updated = store.upsert(jobs)
+    print(f"\n💾 Saved to job store: {store.path} ({added} new, {updated} updated)")
+    
+    if not export:
+        return store.path
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
+    # Columnar snapshot: full descriptions, column-selective reloads (job_export.load_jobs)
+    try:
+        parquet_filename = f"{prefix}_{timestamp}.parquet"
+        export_parquet(jobs, parquet_filename)
+        print(f"💾 Exported Parquet: {parquet_filename}")
+        return store.path
+    except ImportError:
+        print("ℹ️  Install pyarrow for Parquet export: pip install pyarrow")
+    
     # Save as JSON
     json_filename = f"{prefix}_{timestamp}.json"
     with open(json_filename, 'w', encoding='utf-8') as f:
-        json.dump(jobs, f, indent=2, ensure_ascii=False)
+        json.dump(jobs, f, ensure_ascii=False)
     
-    print(f"\n💾 Saved JSON: {json_filename}")
+    print(f"💾 Exported JSON: {json_filename}")
     
     # Try to save as CSV (if pandas available)
     try:
@@ -238,12 +858,12 @@ def save_jobs(jobs: List[Dict], prefix: str = "multi_source_jobs") -> str:
         csv_filename = f"{prefix}_{timestamp}.csv"
         df.to_csv(csv_filename, index=False, encoding='utf-8')
         
-        print(f"💾 Saved CSV: {csv_filename}")
+        print(f"💾 Exported CSV: {csv_filename}")
         
     except ImportError:
         print("ℹ️  Install pandas for CSV export: pip install pandas")
     
-    return json_filename
+    return store.path
 
 
 def display_sample_jobs(jobs: List[Dict], count: int = 5):
@@ -338,16 +958,15 @@ def main():
         display_sample_jobs(jobs)
         
         # Save jobs
-        filename = save_jobs(jobs)
+        store_path = save_jobs(jobs)
         
         print("\n" + "="*60)
         print("✅ SUCCESS!")
         print("="*60)
-        print(f"\n📁 Files created:")
-        print(f"  • {filename}")
+        print(f"\n📁 Job store: {store_path}")
         print(f"\n🎯 Next steps:")
-        print(f"  1. Run skill_extractor.py to analyze skills")
-        print(f"  2. Use {filename} as input")
+        print(f"  1. Run skill_extractor_updated.py to analyze skills")
+        print(f"  2. It reads {store_path} (filter by role and age there)")
         
     else:
         print("\n❌ No jobs collected")
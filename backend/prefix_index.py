@@ -0,0 +1,101 @@
+"""
+Prefix Index Module
+Sorted in-memory index for fast prefix autocomplete
+"""
+
+import bisect
+import itertools
+import re
+import threading
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+def normalize_key(text: str) -> str:
+    """Lowercase and collapse whitespace, e.g. ' Data  Scientist' -> 'data scientist'"""
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+
+class PrefixIndex:
+    """
+    Prefix lookup over a sorted list of normalized keys
+
+    Every entry is indexed under its full name and under each later word
+    ("machine learning engineer" also answers "engineer"). A lookup is a
+    binary search plus a short scan, so autocomplete stays well under a
+    millisecond for thousands of entries. Entries whose full name starts
+    with the prefix rank before entries matched on a later word.
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple[str, int, Hashable]] = []  # (indexed text, rank, entry id)
+        self._entries: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+
+    def add(self, name: str, entry_id: Hashable, value: Any = None):
+        """
+        Index a name for an entry
+
+        Args:
+            name: Text to match prefixes against (variants may be added
+                for the same entry_id)
+            entry_id: Identity of the entry; duplicates are returned once
+            value: Value returned by search (defaults to entry_id)
+        """
+        normalized = normalize_key(name)
+        if not normalized:
+            return
+
+        words = normalized.split(' ')
+        with self._lock:
+            self._entries[entry_id] = entry_id if value is None else value
+            for position in range(len(words)):
+                key = (' '.join(words[position:]), 0 if position == 0 else 1, entry_id)
+                index = bisect.bisect_left(self._keys, key)
+                if index == len(self._keys) or self._keys[index] != key:
+                    self._keys.insert(index, key)
+
+
+    def set_value(self, entry_id: Hashable, value: Any):
+        """Replace the value returned for an indexed entry"""
+        with self._lock:
+            if entry_id in self._entries:
+                self._entries[entry_id] = value
+
+
+    def search(self, prefix: str, limit: int = 10) -> List[Any]:
+        """
+        Values of entries matching a prefix, best matches first
+
+        An empty prefix returns no results; use values() to list everything.
+        """
+        prefix = normalize_key(prefix)
+        if not prefix:
+            return []
+
+        keys = self._keys
+        start = bisect.bisect_left(keys, (prefix,))
+
+        best_rank: Dict[Hashable, int] = {}  # entry id -> best rank, in key order
+        for text, rank, entry_id in itertools.islice(keys, start, None):
+            if not text.startswith(prefix):
+                break
+            if rank < best_rank.get(entry_id, 2):
+                best_rank[entry_id] = rank
+
+        ordered = [entry_id for entry_id, rank in best_rank.items() if rank == 0]
+        ordered += [entry_id for entry_id, rank in best_rank.items() if rank == 1]
+        return [self._entries[entry_id] for entry_id in ordered[:limit]]
+
+
+    def values(self) -> List[Any]:
+        with self._lock:
+            return list(self._entries.values())
+
+
+    def __contains__(self, entry_id: Hashable) -> bool:
+        return entry_id in self._entries
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
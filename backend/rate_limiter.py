@@ -0,0 +1,160 @@
+"""
+Rate Limiter Module
+Process-wide token buckets and retry backoff for upstream APIs (Adzuna)
+"""
+
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from logging_setup import get_logger
+
+logger = get_logger("rate_limiter")
+
+
+class TokenBucket:
+    """
+    Token bucket shared by every caller of an upstream, sync or async
+
+    Tokens refill at `rate` per second up to `capacity` (the allowed
+    burst). Each request reserves a token and waits until it is due, so
+    concurrent callers are spaced out in arrival order and the quota is
+    used at full rate. pause() holds every caller back, e.g. for a 429's
+    Retry-After.
+    """
+
+    def __init__(self, name: str, rate: float, capacity: Optional[float] = None):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()  # Refill resumes from here (later while paused)
+        self._lock = threading.Lock()
+
+
+    def _refill(self, now: float):
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens (possibly going into debt) and return the wait until they are due"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            debt = -self._tokens / self.rate if self._tokens < 0 and self.rate > 0 else 0.0
+            return (self._updated - now) + debt
+
+
+    def _refund(self, tokens: float):
+        with self._lock:
+            self._tokens += tokens
+
+
+    def acquire(self, timeout: Optional[float] = None, tokens: float = 1.0) -> bool:
+        """
+        Block until a request may start
+
+        Returns:
+            False (without taking a token) if that would take longer than
+            timeout seconds
+        """
+        wait = self._reserve(tokens)
+        if timeout is not None and wait > timeout:
+            self._refund(tokens)
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+
+    async def acquire_async(self, timeout: Optional[float] = None, tokens: float = 1.0) -> bool:
+        """acquire() for coroutines: waits without blocking the event loop"""
+        wait = self._reserve(tokens)
+        if timeout is not None and wait > timeout:
+            self._refund(tokens)
+            return False
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._refund(tokens)
+                raise
+        return True
+
+
+    def pause(self, seconds: float):
+        """Hold back every caller for the next `seconds` (e.g. after a 429)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            resume_at = now + seconds
+            if resume_at > self._updated:
+                self._updated = resume_at
+                # One request at resume, then the steady rate (requests already
+                # scheduled past the pause keep their turn)
+                if self.rate <= 0 or -self._tokens / self.rate <= seconds:
+                    self._tokens = min(self.capacity, 1.0)
+        logger.info("Rate limit %s: pausing requests for %.1fs", self.name, seconds)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(name: str, rate: float, capacity: Optional[float] = None) -> TokenBucket:
+    """
+    Process-wide token bucket for an upstream, shared by all its collectors
+
+    rate and capacity only apply on first use.
+    """
+    with _buckets_lock:
+        bucket = _buckets.get(name)
+        if bucket is None:
+            bucket = _buckets[name] = TokenBucket(name, rate, capacity)
+        return bucket
+
+
+# ============================================
+# RETRY BACKOFF
+# ============================================
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = 1.0,
+    cap: float = 30.0,
+    retry_after: Optional[float] = None
+) -> float:
+    """
+    Delay before retry number attempt + 1
+
+    Exponential backoff with full jitter (uniform in [0, base * 2^attempt],
+    capped), but never shorter than the server's Retry-After.
+    """
+    delay = random.uniform(0, min(cap, base * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
@@ -0,0 +1,230 @@
+"""
+Resilience Module
+Circuit breakers and per-request deadlines for upstream calls (Adzuna, Gemini)
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from metrics import CIRCUIT_SHORT_CIRCUITED, CIRCUIT_STATE
+from logging_setup import get_logger
+
+logger = get_logger("resilience")
+
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose breaker is open"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} is temporarily unavailable (circuit open)")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a request's latency budget is used up"""
+
+
+# ============================================
+# DEADLINES
+# ============================================
+
+class Deadline:
+    """
+    Latency budget for one request, passed down to every upstream call
+
+    Each call uses timeout(per_call_timeout) so it never outlives the
+    request, and loops stop early once expired.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self, per_call_timeout: Optional[float] = None) -> float:
+        """Timeout for the next call: the per-call timeout capped by the remaining budget"""
+        remaining = self.remaining()
+        if per_call_timeout is None:
+            return remaining
+        return min(per_call_timeout, remaining)
+
+    def check(self, what: str = "request"):
+        """Raise DeadlineExceeded if the budget is used up"""
+        if self.expired:
+            raise DeadlineExceeded(f"{what} exceeded its {self.seconds:g}s deadline")
+
+
+def call_timeout(deadline: Optional[Deadline], per_call_timeout: float) -> float:
+    """Per-call timeout honouring an optional deadline"""
+    return deadline.timeout(per_call_timeout) if deadline is not None else per_call_timeout
+
+
+# ============================================
+# CIRCUIT BREAKERS
+# ============================================
+
+class CircuitBreaker:
+    """
+    Stop calling an upstream that keeps failing or responding slowly
+
+    CLOSED: calls pass; failure_threshold consecutive failures (calls
+    slower than slow_call_seconds count as failures) open the circuit.
+    OPEN: calls are refused with CircuitOpenError for reset_timeout seconds.
+    HALF_OPEN: up to half_open_max_calls probe calls pass; a success
+    closes the circuit, a failure opens it again. Probes that never report
+    back (e.g. cancelled) are replaced after another reset_timeout.
+
+    Use allow()/record_success()/record_failure() around async calls, or
+    call() for plain functions. Responses that say nothing about the
+    upstream's health (a 429) release() their slot instead.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        slow_call_seconds: Optional[float] = None,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._half_open_at = 0.0
+        self._lock = threading.Lock()
+
+        CIRCUIT_STATE.set_function(lambda: _STATE_VALUES[self.state], upstream=name)
+
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+
+    def _current_state(self) -> str:
+        now = time.monotonic()
+        if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._half_open_calls = 0
+            self._half_open_at = now
+        elif self._state == HALF_OPEN and now - self._half_open_at >= self.reset_timeout:
+            # Probes never reported back; let new ones through
+            self._half_open_calls = 0
+            self._half_open_at = now
+        return self._state
+
+
+    def _retry_after(self, state: str) -> float:
+        """Seconds until a call may go through (caller holds the lock)"""
+        if state == OPEN:
+            waiting_since = self._opened_at
+        elif state == HALF_OPEN and self._half_open_calls >= self.half_open_max_calls:
+            waiting_since = self._half_open_at  # Until the probe reports back or is replaced
+        else:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - waiting_since))
+
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker will let a probe call through"""
+        with self._lock:
+            return self._retry_after(self._current_state())
+
+
+    def allow(self):
+        """Raise CircuitOpenError unless a call may go ahead now"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return
+            retry_after = self._retry_after(state)
+
+        CIRCUIT_SHORT_CIRCUITED.inc(upstream=self.name)
+        raise CircuitOpenError(self.name, retry_after)
+
+
+    def record_success(self, duration: Optional[float] = None):
+        """Record a completed call; slow calls count as failures"""
+        if self.slow_call_seconds is not None and duration is not None and duration > self.slow_call_seconds:
+            self.record_failure(reason=f"slow call ({duration:.1f}s)")
+            return
+
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info("Circuit %s closed", self.name)
+            self._state = CLOSED
+            self._failures = 0
+
+
+    def record_failure(self, reason: str = "failure"):
+        with self._lock:
+            state = self._current_state()
+            self._failures += 1
+            if state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if state != OPEN:
+                    logger.warning("Circuit %s opened after %s (%d failures)", self.name, reason, self._failures)
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+
+    def release(self):
+        """Give back a probe slot taken by allow() for a call that had no verdict (e.g. rate limited)"""
+        with self._lock:
+            if self._state == HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+
+    def call(self, func: Callable, *args, **kwargs):
+        """Call func through the breaker"""
+        self.allow()
+        start = time.monotonic()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(reason=type(e).__name__)
+            raise
+        self.record_success(time.monotonic() - start)
+        return result
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str, **settings) -> CircuitBreaker:
+    """
+    Process-wide breaker for an upstream, shared by all its callers
+
+    settings (CircuitBreaker arguments) only apply on first use.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name, **settings)
+        return breaker
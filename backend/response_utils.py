@@ -0,0 +1,296 @@
+"""
+Response Utilities
+Field projection, fast JSON rendering, conditional GETs and negotiated compression for API responses
+"""
+
+import gzip
+import hashlib
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# ============================================
+# FIELD PROJECTION
+# ============================================
+
+def _parse_paths(spec: Optional[str]) -> List[List[str]]:
+    """Split 'a,b.c' into [['a'], ['b', 'c']]"""
+    if not spec:
+        return []
+    return [path.strip().split('.') for path in spec.split(',') if path.strip()]
+
+
+def _include(data: Any, paths: List[List[str]]) -> Any:
+    """Keep only the given paths (lists are projected element-wise)"""
+    if isinstance(data, list):
+        return [_include(item, paths) for item in data]
+    if not isinstance(data, dict):
+        return data
+
+    nested: Dict[str, List[List[str]]] = {}
+    whole: Set[str] = set()
+    for path in paths:
+        if len(path) == 1:
+            whole.add(path[0])
+        else:
+            nested.setdefault(path[0], []).append(path[1:])
+
+    projected = {}
+    for key, value in data.items():
+        if key in whole:
+            projected[key] = value
+        elif key in nested:
+            projected[key] = _include(value, nested[key])
+    return projected
+
+
+def _exclude(data: Any, paths: List[List[str]]) -> Any:
+    """Drop the given paths (lists are projected element-wise)"""
+    if isinstance(data, list):
+        return [_exclude(item, paths) for item in data]
+    if not isinstance(data, dict):
+        return data
+
+    nested: Dict[str, List[List[str]]] = {}
+    dropped: Set[str] = set()
+    for path in paths:
+        if len(path) == 1:
+            dropped.add(path[0])
+        else:
+            nested.setdefault(path[0], []).append(path[1:])
+
+    return {
+        key: _exclude(value, nested[key]) if key in nested else value
+        for key, value in data.items()
+        if key not in dropped
+    }
+
+
+def project_fields(data: Any, fields: Optional[str] = None, exclude: Optional[str] = None) -> Any:
+    """
+    Project a response payload
+
+    Args:
+        data: Response payload (dict or list of dicts)
+        fields: Comma-separated paths to keep, dotted for nested keys
+            (e.g. "match_percentage,skill_gaps.critical")
+        exclude: Comma-separated paths to drop (applied after fields)
+
+    Returns:
+        Projected copy of the payload
+    """
+    include_paths = _parse_paths(fields)
+    exclude_paths = _parse_paths(exclude)
+
+    if include_paths:
+        data = _include(data, include_paths)
+    if exclude_paths:
+        data = _exclude(data, exclude_paths)
+    return data
+
+
+# ============================================
+# FAST JSON RESPONSES
+# ============================================
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def projected_response(data: Any, fields: Optional[str] = None, exclude: Optional[str] = None) -> Any:
+    """
+    Apply a fields/exclude projection to an endpoint result
+
+    Without a projection the data is returned unchanged (so response models
+    still apply); with one, a rendered response is returned directly.
+    """
+    if not fields and not exclude:
+        return data
+    if hasattr(data, 'model_dump'):
+        data = data.model_dump()
+    return FastJSONResponse(content=project_fields(data, fields, exclude))
+
+
+# ============================================
+# CONDITIONAL REQUESTS
+# ============================================
+
+def make_etag(*parts: Any) -> str:
+    """
+    Weak ETag derived from the given version parts (content hash, file
+    mtime, projection, ...)
+
+    Weak because the same payload may be sent brotli, gzip or identity
+    encoded.
+    """
+    digest = hashlib.sha256('\x1f'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def conditional_response(
+    request: Request,
+    etag: str,
+    build: Callable[[], Any],
+    cache_control: str = 'private, no-cache'
+) -> Response:
+    """
+    Answer a GET with 304 Not Modified when the client's copy is current
+
+    build() is only called when the client has no matching ETag, so a
+    repeat view skips both recomputing and re-sending the payload.
+    no-cache makes browsers revalidate on every view instead of guessing
+    a freshness lifetime.
+    """
+    headers = {'ETag': etag, 'Cache-Control': cache_control}
+    if etag_matches(request.headers.get('if-none-match'), etag):
+        return Response(status_code=304, headers=headers)
+
+    content = build()
+    if isinstance(content, Response):
+        content.headers.update(headers)
+        return content
+    if hasattr(content, 'model_dump'):
+        content = content.model_dump()
+    return FastJSONResponse(content=content, headers=headers)
+
+
+# ============================================
+# COMPRESSION
+# ============================================
+
+# Streaming responses are flushed per chunk and never buffered for compression
+STREAMING_MEDIA_TYPES = ('text/event-stream', 'application/x-ndjson')
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick 'br' or 'gzip' from an Accept-Encoding header"""
+    accepted = {}
+    for part in accept_encoding.split(','):
+        if not part.strip():
+            continue
+        token, _, params = part.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token.strip().lower()] = quality
+
+    wildcard = accepted.get('*', 0.0)
+    if brotli is not None and accepted.get('br', wildcard) > 0:
+        return 'br'
+    if accepted.get('gzip', wildcard) > 0:
+        return 'gzip'
+    return None
+
+
+class CompressionMiddleware:
+    """
+    Compress complete responses with brotli or gzip, as the client accepts
+
+    Only single-chunk bodies above minimum_size are compressed; streamed
+    responses pass through untouched so their chunks are not held back.
+    """
+
+    def __init__(self, app, minimum_size: int = 500, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == 'br':
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get('accept-encoding', ''))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+
+            if message['type'] == 'http.response.start':
+                start_message = message
+                return
+
+            if passthrough or message['type'] != 'http.response.body':
+                if start_message is not None:
+                    await send(start_message)
+                    start_message = None
+                passthrough = True
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start_message['headers'])
+            body = message.get('body', b'')
+
+            if (
+                message.get('more_body', False)
+                or len(body) < self.minimum_size
+                or 'content-encoding' in headers
+                or headers.get('content-type', '').startswith(STREAMING_MEDIA_TYPES)
+            ):
+                passthrough = True
+                await send(start_message)
+                start_message = None
+                await send(message)
+                return
+
+            compressed = self._compress(body, encoding)
+            headers['Content-Encoding'] = encoding
+            headers['Content-Length'] = str(len(compressed))
+            headers.add_vary_header('Accept-Encoding')
+
+            await send(start_message)
+            start_message = None
+            await send({'type': 'http.response.body', 'body': compressed})
+
+        await self.app(scope, receive, send_compressed)
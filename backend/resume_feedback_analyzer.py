@@ -8,10 +8,31 @@ from typing import Dict, List, Set, Tuple
 from collections import Counter
 from pathlib import Path
 
+from role_canonicalizer import RoleCanonicalizer, clean_role
+
+# Role categories and their related skills
+ROLE_SKILLS = {
+    'software engineer': ['python', 'java', 'javascript', 'c++', 'sql', 'git', 'api', 'rest', 'microservices'],
+    'data scientist': ['python', 'machine learning', 'sql', 'tableau', 'pandas', 'numpy', 'scikit-learn', 'statistics'],
+    'product manager': ['product management', 'agile', 'user research', 'analytics', 'strategy', 'roadmap', 'jira'],
+    'devops engineer': ['docker', 'kubernetes', 'jenkins', 'terraform', 'aws', 'azure', 'ci/cd', 'linux'],
+    'frontend developer': ['javascript', 'react', 'vue', 'css', 'html', 'typescript', 'webpack', 'responsive design'],
+    'backend developer': ['python', 'java', 'nodejs', 'sql', 'database', 'api', 'microservices', 'docker'],
+    'qa engineer': ['testing', 'selenium', 'automation', 'jira', 'bug tracking', 'performance testing'],
+    'cloud architect': ['aws', 'azure', 'gcp', 'terraform', 'kubernetes', 'microservices', 'security'],
+    'security engineer': ['security', 'firewall', 'encryption', 'penetration testing', 'compliance', 'authentication'],
+    'python developer': ['python', 'django', 'flask', 'fastapi', 'sql', 'rest', 'git', 'docker'],
+    'full stack developer': ['javascript', 'react', 'nodejs', 'html', 'css', 'sql', 'api', 'git'],
+    'machine learning engineer': ['python', 'machine learning', 'tensorflow', 'pytorch', 'scikit-learn', 'docker', 'sql', 'mlops'],
+}
+
 class ResumeFeedbackAnalyzer:
     """Analyze resume and provide improvement suggestions"""
     
     def __init__(self):
+        # Maps target roles ("Sr. Backend Dev") onto ROLE_SKILLS categories
+        self.role_canonicalizer = RoleCanonicalizer(ROLE_SKILLS)
+        
         # Impact words that strengthen resume
         self.impact_words = {
             'action': ['built', 'created', 'developed', 'designed', 'implemented', 'launched'],
@@ -238,35 +259,26 @@ class ResumeFeedbackAnalyzer:
         if not target_role or not skills:
             return {'score': 0, 'feedback': 'Insufficient data for relevance analysis'}
         
-        # Define role categories and their related skills
-        role_skill_mapping = {
-            'software engineer': ['python', 'java', 'javascript', 'c++', 'sql', 'git', 'api', 'rest', 'microservices'],
-            'data scientist': ['python', 'machine learning', 'sql', 'tableau', 'pandas', 'numpy', 'scikit-learn', 'statistics'],
-            'product manager': ['product management', 'agile', 'user research', 'analytics', 'strategy', 'roadmap', 'jira'],
-            'devops engineer': ['docker', 'kubernetes', 'jenkins', 'terraform', 'aws', 'azure', 'ci/cd', 'linux'],
-            'frontend developer': ['javascript', 'react', 'vue', 'css', 'html', 'typescript', 'webpack', 'responsive design'],
-            'backend developer': ['python', 'java', 'nodejs', 'sql', 'database', 'api', 'microservices', 'docker'],
-            'qa engineer': ['testing', 'selenium', 'automation', 'jira', 'bug tracking', 'performance testing'],
-            'cloud architect': ['aws', 'azure', 'gcp', 'terraform', 'kubernetes', 'microservices', 'security'],
-            'security engineer': ['security', 'firewall', 'encryption', 'penetration testing', 'compliance', 'authentication'],
-        }
-        
-        target_lower = target_role.lower()
         skills_lower = [s.lower() for s in skills]
         
-        # Find matching role category
-        matching_roles = [role for role in role_skill_mapping.keys() if role in target_lower or target_lower in role]
+        # Find matching role category ("Sr. Backend Dev" -> backend developer)
+        matched_role = self.role_canonicalizer.match(target_role)
+        matching_roles = [matched_role] if matched_role else []
         
         if not matching_roles:
-            # Try partial matching
-            for role in role_skill_mapping.keys():
-                if any(word in role for word in target_lower.split()):
-                    matching_roles.append(role)
+            # Related categories: containment, then any shared word
+            # ("Java Developer" -> the developer roles)
+            target_clean = clean_role(target_role)
+            matching_roles = [role for role in ROLE_SKILLS if role in target_clean or target_clean in role]
+            if not matching_roles:
+                for role in ROLE_SKILLS:
+                    if any(word in role for word in target_clean.split()):
+                        matching_roles.append(role)
         
         if matching_roles:
             expected_skills = set()
             for role in matching_roles:
-                expected_skills.update(role_skill_mapping[role])
+                expected_skills.update(ROLE_SKILLS[role])
             
             matched_count = sum(1 for skill in skills_lower if skill in expected_skills)
             relevance_score = int((matched_count / len(expected_skills)) * 100) if expected_skills else 0
@@ -32,6 +32,7 @@ from skill_database import (
     normalize_skill,
     SKILL_DATABASE
 )
+from metrics import stage_timer, timed_stage
 
 
 class ResumeParser:
@@ -79,6 +80,7 @@ class ResumeParser:
         return result
     
     
+    @timed_stage('pdf_extraction')
     def _extract_text_from_pdf(self, file_path: Path) -> str:
         """Extract text from PDF file"""
         if PyPDF2 is None:
@@ -96,6 +98,7 @@ class ResumeParser:
         return text.strip()
     
     
+    @timed_stage('docx_extraction')
     def _extract_text_from_docx(self, file_path: Path) -> str:
         """Extract text from DOCX file"""
         if Document is None:
@@ -123,34 +126,36 @@ class ResumeParser:
         text_lower = text.lower()
         
         # Method 1: Direct pattern matching
-        for skill in self.all_skills:
-            # Create pattern that matches whole words
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.add(skill)
-            
-            # Check variations
-            for variation in get_skill_variations(skill):
-                pattern = r'\b' + re.escape(variation.lower()) + r'\b'
+        with stage_timer('gazetteer_matching'):
+            for skill in self.all_skills:
+                # Create pattern that matches whole words
+                pattern = r'\b' + re.escape(skill.lower()) + r'\b'
                 if re.search(pattern, text_lower):
                     found_skills.add(skill)
+                
+                # Check variations
+                for variation in get_skill_variations(skill):
+                    pattern = r'\b' + re.escape(variation.lower()) + r'\b'
+                    if re.search(pattern, text_lower):
+                        found_skills.add(skill)
         
         # Method 2: NLP-based extraction (if spaCy available)
         if nlp:
-            doc = nlp(text)
-            
-            # Extract noun phrases and check against skills
-            for chunk in doc.noun_chunks:
-                normalized = normalize_skill(chunk.text)
-                if normalized:
-                    found_skills.add(normalized)
-            
-            # Extract named entities (ORG, PRODUCT could be technologies)
-            for ent in doc.ents:
-                if ent.label_ in ['ORG', 'PRODUCT', 'GPE']:
-                    normalized = normalize_skill(ent.text)
+            with stage_timer('spacy_processing'):
+                doc = nlp(text)
+                
+                # Extract noun phrases and check against skills
+                for chunk in doc.noun_chunks:
+                    normalized = normalize_skill(chunk.text)
                     if normalized:
                         found_skills.add(normalized)
+                
+                # Extract named entities (ORG, PRODUCT could be technologies)
+                for ent in doc.ents:
+                    if ent.label_ in ['ORG', 'PRODUCT', 'GPE']:
+                        normalized = normalize_skill(ent.text)
+                        if normalized:
+                            found_skills.add(normalized)
         
         return sorted(list(found_skills))
     
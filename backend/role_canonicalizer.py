@@ -0,0 +1,208 @@
+"""
+Role Canonicalizer Module
+Map equivalent role names ("python dev", "Python Developer ") to one canonical role
+"""
+
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Optional, Set
+
+from prefix_index import normalize_key
+
+
+# Abbreviations and plurals expanded word by word ("sr python devs" -> "senior python developer")
+WORD_ALIASES = {
+    'dev': 'developer',
+    'devs': 'developer',
+    'developers': 'developer',
+    'eng': 'engineer',
+    'engr': 'engineer',
+    'engineers': 'engineer',
+    'sr': 'senior',
+    'snr': 'senior',
+    'jr': 'junior',
+    'mgr': 'manager',
+    'managers': 'manager',
+    'ml': 'machine learning',
+    'js': 'javascript',
+    'fullstack': 'full stack',
+    'scientists': 'scientist',
+    'analysts': 'analyst',
+    'architects': 'architect',
+}
+
+# Multi-word spellings joined after word expansion ("front end" -> "frontend")
+PHRASE_ALIASES = {
+    'front end': 'frontend',
+    'back end': 'backend',
+}
+
+# Whole-title aliases, applied last
+ROLE_ALIASES = {
+    'swe': 'software engineer',
+    'sde': 'software engineer',
+    'mle': 'machine learning engineer',
+    'sre': 'site reliability engineer',
+    'qa': 'qa engineer',
+    'frontend engineer': 'frontend developer',
+    'backend engineer': 'backend developer',
+    'full stack engineer': 'full stack developer',
+}
+
+# Level qualifiers ignored when matching a role to a role family (match())
+SENIORITY_WORDS = {
+    'senior', 'junior', 'lead', 'principal', 'staff', 'mid', 'level',
+    'entry', 'intern', 'graduate', 'trainee', 'i', 'ii', 'iii', 'iv'
+}
+
+_SEPARATORS = re.compile(r'[-_/,;:()|]+')
+_PHRASE_PATTERNS = [(re.compile(rf'\b{phrase}\b'), joined) for phrase, joined in PHRASE_ALIASES.items()]
+
+
+def clean_role(role: str) -> str:
+    """
+    Normalize a role name without matching it against known roles
+
+    Lowercases, strips punctuation separators and expands WORD_ALIASES,
+    PHRASE_ALIASES and ROLE_ALIASES, e.g. 'Sr. Python Dev' -> 'senior
+    python developer'.
+    """
+    text = normalize_key(_SEPARATORS.sub(' ', role or ''))
+    words = []
+    for word in text.split(' '):
+        word = word.rstrip('.')  # 'Sr.' -> 'sr'
+        if word:
+            words.append(WORD_ALIASES.get(word, word))
+    text = ' '.join(words)
+    for pattern, joined in _PHRASE_PATTERNS:
+        text = pattern.sub(joined, text)
+    return ROLE_ALIASES.get(text, text)
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class RoleCanonicalizer:
+    """
+    Canonical names for target roles, built once from the known roles
+
+    Roles are cleaned (clean_role), then matched against the known roles
+    through a character trigram index: a known role whose trigram overlap
+    (Dice coefficient) with the input is at least min_similarity wins, so
+    "python developers" and "Python Developer" share a key while
+    "java developer" and "javascript developer" do not. Roles matching
+    nothing keep their cleaned form and become known once add()ed.
+
+    Use key() for cache keys and canonicalize() for the name sent upstream.
+    """
+
+    def __init__(self, roles: Iterable[str] = (), min_similarity: float = 0.85):
+        self.min_similarity = min_similarity
+        self._roles: Dict[str, str] = {}  # canonical key -> display name
+        self._gram_index: Dict[str, Set[str]] = {}  # trigram -> canonical keys
+        self._gram_counts: Dict[str, int] = {}  # canonical key -> number of trigrams
+        self._memo: Dict[str, str] = {}  # cleaned role -> canonical key
+        self._lock = threading.Lock()
+
+        for role in roles:
+            self.add(role)
+
+
+    def add(self, role: str) -> str:
+        """
+        Register a known role, unless it matches one already
+
+        Returns:
+            The role's canonical key ('' for a blank role)
+        """
+        key = self.key(role)
+        if not key or key in self._roles:
+            return key
+
+        with self._lock:
+            if key in self._roles:
+                return key
+            grams = _trigrams(key)
+            for gram in grams:
+                self._gram_index.setdefault(gram, set()).add(key)
+            self._gram_counts[key] = len(grams)
+            self._roles[key] = self._display_name(role, key)
+            self._memo.clear()  # Earlier misses may match the new role
+        return key
+
+
+    def key(self, role: str) -> str:
+        """Canonical key for a role (cache keys, catalog lookups)"""
+        cleaned = clean_role(role)
+        if not cleaned or cleaned in self._roles:
+            return cleaned
+
+        key = self._memo.get(cleaned)
+        if key is None:
+            # Under the lock: add() mutates the index and clears the memo
+            with self._lock:
+                key = self._best_match(cleaned) or cleaned
+                if len(self._memo) >= 10000:
+                    self._memo.clear()
+                self._memo[cleaned] = key
+        return key
+
+
+    def canonicalize(self, role: str) -> str:
+        """Canonical display name for a role, e.g. 'python dev' -> 'Python Developer'"""
+        key = self.key(role)
+        return self._roles.get(key) or self._display_name(role, key)
+
+
+    def match(self, role: str) -> Optional[str]:
+        """
+        Known role key for a role, ignoring level qualifiers
+
+        'Senior Software Engineer' -> 'software engineer'. Returns None if
+        the role matches no known role.
+        """
+        key = self.key(role)
+        if key in self._roles:
+            return key
+
+        base = ' '.join(word for word in key.split(' ') if word not in SENIORITY_WORDS)
+        if base and base != key:
+            base_key = self.key(base)
+            if base_key in self._roles:
+                return base_key
+        return None
+
+
+    def _best_match(self, cleaned: str) -> Optional[str]:
+        """Best known role for a cleaned role (caller holds the lock)"""
+        grams = _trigrams(cleaned)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._gram_index.get(gram, ()))
+
+        best_key, best_score = None, self.min_similarity
+        for key, count in shared.items():
+            score = 2 * count / (len(grams) + self._gram_counts[key])
+            if score >= best_score:
+                best_key, best_score = key, score
+        return best_key
+
+
+    @staticmethod
+    def _display_name(role: str, key: str) -> str:
+        """The role as written if it spells the key, else the key capitalized"""
+        written = re.sub(r'\s+', ' ', role or '').strip()
+        if normalize_key(written) == key and written != written.lower():
+            return written
+        return ' '.join(word[:1].upper() + word[1:] for word in key.split(' '))
+
+
+    def __contains__(self, role: str) -> bool:
+        return self.key(role) in self._roles
+
+
+    def __len__(self) -> int:
+        return len(self._roles)
@@ -0,0 +1,270 @@
+"""
+Role Catalog Module
+Known target roles (from collected jobs and saved market profiles) with prefix autocomplete
+"""
+
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from job_store import JobStore
+from prefix_index import PrefixIndex
+from role_canonicalizer import RoleCanonicalizer
+from logging_setup import get_logger
+
+logger = get_logger("role_catalog")
+
+
+# Offered even before any jobs have been collected for them
+DEFAULT_ROLES = [
+    'Software Engineer',
+    'Data Scientist',
+    'Python Developer',
+    'Full Stack Developer',
+    'Frontend Developer',
+    'Backend Developer',
+    'Machine Learning Engineer',
+    'DevOps Engineer'
+]
+
+# skill_analysis_*.json files that are not per-role market profiles
+NON_ROLE_PROFILES = {'all', 'by_source', 'full_report'}
+
+
+class RoleCatalog:
+    """
+    Catalog of target roles with job counts and profile freshness
+
+    Built from the job store and the search_role of older job files
+    (multi_source_jobs*.json), from saved market profiles
+    (skill_analysis_<role>.json), plus roles collected live by the API.
+    Files are re-read only when they change, and outside the catalog
+    lock: readers and record_collection() only wait for the new
+    summaries to be swapped in.
+    Equivalent role names ("python dev", "Python Developers") share one
+    entry through the canonicalizer, which learns every cataloged role.
+    """
+
+    def __init__(
+        self,
+        data_dir: str = '.',
+        default_roles: Optional[List[str]] = None,
+        canonicalizer: Optional[RoleCanonicalizer] = None,
+        job_store: Optional[JobStore] = None
+    ):
+        self.data_dir = Path(data_dir)
+        self.job_store = job_store
+        self.canonicalizer = canonicalizer if canonicalizer is not None else RoleCanonicalizer()
+        self._roles: Dict[str, Dict] = {}  # canonical role key -> entry
+        self._file_stats: Dict[str, tuple] = {}  # path -> (mtime, {role key: summary})
+        self._index = PrefixIndex()
+        self._lock = threading.Lock()  # Guards _roles, _index and _file_stats
+        self._refresh_lock = threading.Lock()  # One refresh at a time
+
+        for role in (DEFAULT_ROLES if default_roles is None else default_roles):
+            self._entry(role)
+
+
+    def _entry(self, role: str) -> Dict:
+        """Get or create the catalog entry for a role"""
+        key = self.canonicalizer.add(role)
+        entry = self._roles.get(key)
+        if entry is None:
+            role = self.canonicalizer.canonicalize(role)
+            entry = {
+                'role': role,
+                'job_count': 0,
+                'last_collected_at': None,
+                'profile_file': None,
+                'profile_analyzed_at': None,
+                '_files': {}  # path -> job count from that file
+            }
+            self._roles[key] = entry
+            self._index.add(role, key)
+        return entry
+
+
+    # ============================================
+    # LOADING
+    # ============================================
+
+    def refresh(self):
+        """Re-scan the data directory for new or changed job and profile files"""
+        with self._refresh_lock:
+            # Read and parse without the catalog lock (this is the slow part)
+            loaded = []
+            for path in sorted(self.data_dir.glob('multi_source_jobs*.json')):
+                loaded.append(self._read_file(path, self._summarize_jobs_file))
+            for path in sorted(self.data_dir.glob('skill_analysis*.json')):
+                loaded.append(self._read_file(path, self._summarize_profile_file))
+            store_summary = self._read_store() if self.job_store is not None else None
+
+            with self._lock:
+                for result in loaded:
+                    if result is not None:
+                        self._apply_file(*result)
+                if store_summary is not None:
+                    self._apply_store(store_summary)
+
+
+    def _read_file(self, path: Path, summarize) -> Optional[tuple]:
+        """(path, mtime, summary) of a new or changed file, else None"""
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._file_stats.get(str(path))
+        if cached is not None and cached[0] == mtime:
+            return None
+
+        try:
+            return path, mtime, summarize(path)
+        except Exception as e:
+            logger.warning("Could not read %s: %s", path, e)
+            return None
+
+
+    def _apply_file(self, path: Path, mtime: float, summary: Dict[str, Dict]):
+        self._file_stats[str(path)] = (mtime, summary)
+        for role, data in summary.items():
+            entry = self._entry(role)
+            if 'job_count' in data:
+                entry['_files'][str(path)] = data['job_count']
+                entry['job_count'] = sum(entry['_files'].values())
+                entry['last_collected_at'] = max(
+                    filter(None, [entry['last_collected_at'], data.get('collected_at')]),
+                    default=None
+                )
+            if 'analyzed_at' in data:
+                if entry['profile_analyzed_at'] is None or (data['analyzed_at'] or '') >= entry['profile_analyzed_at']:
+                    entry['profile_file'] = path.name
+                    entry['profile_analyzed_at'] = data['analyzed_at']
+
+
+    def _read_store(self) -> Optional[Dict[str, Dict]]:
+        """Job counts per role from the job store (one indexed GROUP BY)"""
+        try:
+            return self.job_store.role_summary()
+        except Exception as e:
+            logger.warning("Could not read job store %s: %s", self.job_store.path, e)
+            return None
+
+
+    def _apply_store(self, summary: Dict[str, Dict]):
+        for role, data in summary.items():
+            entry = self._entry(role)
+            entry['_files']['store'] = data['job_count']
+            entry['job_count'] = sum(entry['_files'].values())
+            entry['last_collected_at'] = max(
+                filter(None, [entry['last_collected_at'], data['collected_at']]),
+                default=None
+            )
+
+
+    def _summarize_jobs_file(self, path: Path) -> Dict[str, Dict]:
+        """Job count and latest collection time per search_role"""
+        with open(path, 'r', encoding='utf-8') as f:
+            jobs = json.load(f)
+
+        summary: Dict[str, Dict] = {}
+        for job in jobs:
+            role = job.get('search_role')
+            if not role:
+                continue
+            data = summary.setdefault(role, {'job_count': 0, 'collected_at': None})
+            data['job_count'] += 1
+            collected_at = job.get('collected_at')
+            if collected_at and (data['collected_at'] is None or collected_at > data['collected_at']):
+                data['collected_at'] = collected_at
+        return summary
+
+
+    def _summarize_profile_file(self, path: Path) -> Dict[str, Dict]:
+        """Role and analysis time of a saved market profile"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        role = data.get('analyzed_role')
+        if not role:
+            suffix = path.stem.replace('skill_analysis', '').strip('_')
+            if not suffix or suffix in NON_ROLE_PROFILES:
+                return {}
+            role = suffix.replace('_', ' ').title()
+
+        analyzed_at = data.get('analyzed_at') or datetime.fromtimestamp(path.stat().st_mtime).isoformat()
+        return {role: {'analyzed_at': analyzed_at}}
+
+
+    def record_collection(self, role: str, job_count: int, collected_at: Optional[str] = None):
+        """Register a live collection (e.g. real-time gap analysis) for a role"""
+        if not role or not role.strip():
+            return
+        with self._lock:
+            entry = self._entry(role)
+            if self.job_store is None:
+                entry['_files']['live'] = job_count  # latest live collection
+                entry['job_count'] = sum(entry['_files'].values())
+            # else the job store counts them from the next refresh
+            entry['last_collected_at'] = collected_at or datetime.now().isoformat()
+
+
+    # ============================================
+    # LOOKUP
+    # ============================================
+
+    def _public(self, key: str, now: datetime) -> Dict:
+        entry = self._roles[key]
+        timestamps = [ts for ts in (entry['last_collected_at'], entry['profile_analyzed_at']) if ts]
+        age_hours = None
+        if timestamps:
+            try:
+                latest = datetime.fromisoformat(max(timestamps))
+                if latest.tzinfo is not None:
+                    latest = latest.astimezone().replace(tzinfo=None)  # now is naive local time
+                age_hours = round((now - latest).total_seconds() / 3600, 1)
+            except (ValueError, TypeError):
+                pass
+
+        return {
+            'role': entry['role'],
+            'job_count': entry['job_count'],
+            'has_profile': entry['profile_file'] is not None,
+            'profile_analyzed_at': entry['profile_analyzed_at'],
+            'last_collected_at': entry['last_collected_at'],
+            'age_hours': age_hours
+        }
+
+
+    def search(self, prefix: str = '', limit: int = 10) -> List[Dict]:
+        """
+        Roles matching a prefix (all roles, most collected first, if empty)
+
+        Roles whose name starts with the prefix come before roles matched
+        on a later word ("eng" -> "Engineering Manager", then "DevOps Engineer").
+        """
+        now = datetime.now()
+        with self._lock:
+            if prefix.strip():
+                keys = self._index.search(prefix, limit=limit)
+            else:
+                keys = sorted(self._roles, key=lambda key: (-self._roles[key]['job_count'], key))[:limit]
+            return [self._public(key, now) for key in keys]
+
+
+    def profile_path(self, role: str) -> Optional[Path]:
+        """Path of the newest saved market profile for a role, if any"""
+        key = self.canonicalizer.key(role)
+        with self._lock:
+            entry = self._roles.get(key)
+            profile_file = entry['profile_file'] if entry is not None else None
+        if profile_file is None:
+            return None
+        return self.data_dir / profile_file
+
+
+    def __len__(self) -> int:
+        return len(self._roles)
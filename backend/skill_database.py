@@ -259,6 +259,25 @@ def normalize_skill(skill_text):
     return None
 
 
+def build_normalization_table():
+    """Map every lowercased skill name and variation to its standard form (as normalize_skill)"""
+    table = {}
+    for standard_name, variations in SKILL_VARIATIONS.items():
+        for name in variations + [standard_name]:
+            table.setdefault(name.lower(), standard_name)
+    for skill in get_all_skills():
+        table.setdefault(skill.lower(), skill)
+    return table
+
+
+def get_skill_category(skill):
+    """Get the (first) category of a skill, or None if it has none"""
+    for category, skills in SKILL_DATABASE.items():
+        if skill in skills:
+            return category
+    return None
+
+
 def get_skills_by_category(category):
     """Get skills for a specific category"""
     return SKILL_DATABASE.get(category, [])
@@ -7,7 +7,7 @@ Compatible with Multi-Source Job Collector (Adzuna, The Muse, Remotive)
 import json
 import re
 from collections import Counter
-from typing import Dict, List, Set
+from typing import Callable, Dict, List, Optional, Set
 from pathlib import Path
 from datetime import datetime
 
@@ -18,10 +18,20 @@ except:
     nlp = None
 
 from skill_database import (
+    build_normalization_table,
     get_all_skills, 
-    get_skill_variations, 
-    normalize_skill
+    get_skill_variations
 )
+from job_store import DEFAULT_JOB_STORE_PATH, JobStore, job_matches
+from job_export import load_jobs
+from metrics import stage_timer
+from logging_setup import get_logger
+
+logger = get_logger("skill_extractor")
+
+
+# Job fields the analyses read (columnar exports load only these)
+ANALYSIS_COLUMNS = ['source', 'search_role', 'title', 'description']
 
 
 class SkillExtractor:
@@ -30,6 +40,17 @@ class SkillExtractor:
     def __init__(self):
         self.all_skills = get_all_skills()
         self.skills_lower = [s.lower() for s in self.all_skills]
+        
+        # One precompiled word-boundary pattern per skill (name + variations)
+        self._skill_patterns = [
+            (skill, re.compile(
+                r'\b(?:' + '|'.join(re.escape(v.lower()) for v in get_skill_variations(skill)) + r')\b'
+            ))
+            for skill in self.all_skills
+        ]
+        
+        # Lowercased name/variation -> standard skill (same precedence as normalize_skill)
+        self._normalized_names = build_normalization_table()
     
     
     def extract_from_text(self, text: str) -> List[str]:
@@ -42,97 +63,198 @@ class SkillExtractor:
         Returns:
             List of found skills
         """
-        found_skills = set()
-        text_lower = text.lower()
-        
-        # Method 1: Pattern matching with word boundaries
-        for skill in self.all_skills:
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.add(skill)
-            
-            # Check variations
-            for variation in get_skill_variations(skill):
-                pattern = r'\b' + re.escape(variation.lower()) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_skills.add(skill)
+        found_skills = self._match_gazetteer(text)
         
         # Method 2: NLP-based extraction (if available)
         if nlp and len(text) < 1000000:  # Limit text size for NLP
             try:
-                doc = nlp(text[:100000])  # Process first 100k chars
-                
-                # Extract noun phrases
-                for chunk in doc.noun_chunks:
-                    normalized = normalize_skill(chunk.text)
-                    if normalized:
-                        found_skills.add(normalized)
+                with stage_timer('spacy_processing'):
+                    doc = nlp(text[:100000])  # Process first 100k chars
+                    found_skills.update(self._noun_chunk_skills(doc))
             except:
                 pass  # Continue with pattern matching only
         
         return sorted(list(found_skills))
     
     
-    def analyze_jobs(self, jobs: List[Dict]) -> Dict:
+    def extract_from_texts(self, texts: List[str], batch_size: int = 32) -> List[List[str]]:
+        """
+        Extract skills from many texts in one batched pass
+        
+        Gives the same result per text as extract_from_text, but spaCy
+        processes the texts together via nlp.pipe.
+        
+        Args:
+            texts: Job description texts
+            batch_size: spaCy pipe batch size
+            
+        Returns:
+            List of found skills for each text, in input order
+        """
+        found = [self._match_gazetteer(text) for text in texts]
+        
+        if nlp:
+            nlp_indices = [i for i, text in enumerate(texts) if len(text) < 1000000]
+            try:
+                with stage_timer('spacy_processing'):
+                    docs = nlp.pipe((texts[i][:100000] for i in nlp_indices), batch_size=batch_size)
+                    for i, doc in zip(nlp_indices, docs):
+                        found[i].update(self._noun_chunk_skills(doc))
+            except:
+                pass  # Continue with pattern matching only
+        
+        return [sorted(list(skills)) for skills in found]
+    
+    
+    def _match_gazetteer(self, text: str) -> Set[str]:
+        """Method 1: Pattern matching with word boundaries"""
+        text_lower = text.lower()
+        with stage_timer('gazetteer_matching'):
+            return {skill for skill, pattern in self._skill_patterns if pattern.search(text_lower)}
+    
+    
+    def _noun_chunk_skills(self, doc) -> Set[str]:
+        """Skills named by the noun phrases of a spaCy doc"""
+        found_skills = set()
+        for chunk in doc.noun_chunks:
+            normalized = self._normalized_names.get(chunk.text.strip().lower())
+            if normalized:
+                found_skills.add(normalized)
+        return found_skills
+    
+    
+    def analyze_jobs(
+        self,
+        jobs: List[Dict],
+        progress_callback: Optional[Callable[[Dict], None]] = None,
+        batch_size: int = 25
+    ) -> Dict:
         """
         Analyze multiple job postings and calculate skill demand
         
         Args:
             jobs: List of job dictionaries (from multi-source collector)
+            progress_callback: Optional callable receiving a progress event
+                ({'stage': 'analyze', 'processed', 'total'}) after every batch
+            batch_size: Number of jobs per extraction batch (and progress event)
             
         Returns:
             Dictionary with skill statistics
         """
-        print(f"\n{'='*60}")
-        print(f"📊 ANALYZING {len(jobs)} JOB POSTINGS")
-        print(f"{'='*60}\n")
-        
-        # Track by source
-        source_stats = {}
-        all_skills_found = []
-        jobs_processed = 0
-        skills_by_job = {}
-        
-        for i, job in enumerate(jobs, 1):
-            # Get job description and metadata
-            description = job.get('description', '')
-            title = job.get('title', '')
-            source = job.get('source', 'unknown')
+        logger.debug("Analyzing %d job postings", len(jobs))
+        
+        state = self.new_demand_state()
+        self.update_demand(state, jobs, progress_callback, batch_size)
+        
+        logger.debug(
+            "Processed %d/%d jobs with skills; by source: %s",
+            state['jobs_with_skills'], state['total_jobs'],
+            ", ".join(f"{source}={stats['with_skills']}/{stats['total']}" for source, stats in state['source_stats'].items())
+        )
+        
+        return self.build_demand(state)
+    
+    
+    def analyze_stored_jobs(
+        self,
+        store: JobStore,
+        role: Optional[str] = None,
+        location: Optional[str] = None,
+        days: Optional[float] = None,
+        limit: Optional[int] = None,
+        progress_callback: Optional[Callable[[Dict], None]] = None,
+        batch_size: int = 25
+    ) -> Dict:
+        """
+        Skill demand for a slice of the job store, e.g. one role's jobs from
+        the last 30 days
+        
+        Jobs are streamed from the store in chunks, so the slice is never
+        loaded into memory at once.
+        """
+        state = self.new_demand_state()
+        chunk = []
+        for job in store.iter_jobs(role=role, location=location, days=days, limit=limit):
+            chunk.append(job)
+            if len(chunk) >= 500:
+                self.update_demand(state, chunk, progress_callback, batch_size)
+                chunk = []
+        if chunk:
+            self.update_demand(state, chunk, progress_callback, batch_size)
+        
+        logger.debug("Analyzed %d stored jobs (role=%s, location=%s, days=%s)",
+                     state['total_jobs'], role, location, days)
+        return self.build_demand(state)
+    
+    
+    def new_demand_state(self) -> Dict:
+        """Empty running totals for incremental demand analysis"""
+        return {
+            'total_jobs': 0,
+            'jobs_with_skills': 0,
+            'source_stats': {},
+            'skill_counts': Counter()
+        }
+    
+    
+    def update_demand(
+        self,
+        state: Dict,
+        jobs: List[Dict],
+        progress_callback: Optional[Callable[[Dict], None]] = None,
+        batch_size: int = 25
+    ) -> Dict:
+        """
+        Add a batch of jobs (e.g. one collected page) to running demand totals
+        
+        Args:
+            state: Totals from new_demand_state(), updated in place
+            jobs: Jobs to add
+            progress_callback: Optional callable receiving progress events
+            batch_size: Number of jobs per extraction batch (and progress event)
             
-            # Track source
-            if source not in source_stats:
-                source_stats[source] = {'total': 0, 'with_skills': 0}
-            source_stats[source]['total'] += 1
+        Returns:
+            The updated state
+        """
+        for start in range(0, len(jobs), batch_size):
+            batch = jobs[start:start + batch_size]
             
             # Combine title and description for better extraction
-            full_text = f"{title}\n{description}"
+            texts = [f"{job.get('title', '')}\n{job.get('description', '')}" for job in batch]
             
-            # Extract skills
-            skills = self.extract_from_text(full_text)
+            # Extract skills for the whole batch in one pass
+            for job, skills in zip(batch, self.extract_from_texts(texts)):
+                self.record_job_skills(state, skills, job.get('source', 'unknown'))
             
-            if skills:
-                all_skills_found.extend(skills)
-                jobs_processed += 1
-                source_stats[source]['with_skills'] += 1
-                skills_by_job[i-1] = {
-                    'title': title,
-                    'company': job.get('company', ''),
-                    'source': source,
-                    'skills': skills
-                }
+            processed = start + len(batch)
+            logger.debug("Processed %d/%d jobs", processed, len(jobs), extra={'sample_every': 50})
             
-            # Progress indicator
-            if i % 50 == 0:
-                print(f"  Processed {i}/{len(jobs)} jobs...")
-        
-        print(f"\n✅ Processed {jobs_processed} jobs with skills")
-        print(f"\n📋 By Source:")
-        for source, stats in source_stats.items():
-            print(f"  • {source.upper()}: {stats['with_skills']}/{stats['total']} jobs with skills")
+            if progress_callback:
+                progress_callback({'stage': 'analyze', 'processed': processed, 'total': len(jobs)})
         
-        # Calculate statistics
-        skill_counts = Counter(all_skills_found)
-        total_jobs = len(jobs)
+        return state
+    
+    
+    def record_job_skills(self, state: Dict, skills: List[str], source: str = 'unknown'):
+        """Add one job's extracted skills to running demand totals"""
+        source_stats = state['source_stats']
+        
+        # Track source
+        if source not in source_stats:
+            source_stats[source] = {'total': 0, 'with_skills': 0}
+        source_stats[source]['total'] += 1
+        state['total_jobs'] += 1
+        
+        if skills:
+            state['skill_counts'].update(skills)
+            state['jobs_with_skills'] += 1
+            source_stats[source]['with_skills'] += 1
+    
+    
+    def build_demand(self, state: Dict) -> Dict:
+        """Skill demand statistics (analyze_jobs result) from running totals"""
+        skill_counts = state['skill_counts']
+        total_jobs = state['total_jobs']
         
         # Calculate demand percentages
         skill_demand = []
@@ -150,10 +272,10 @@ class SkillExtractor:
         
         return {
             'total_jobs': total_jobs,
-            'jobs_with_skills': jobs_processed,
+            'jobs_with_skills': state['jobs_with_skills'],
             'unique_skills': len(skill_counts),
             'total_skill_mentions': sum(skill_counts.values()),
-            'source_breakdown': source_stats,
+            'source_breakdown': {source: dict(stats) for source, stats in state['source_stats'].items()},
             'skills': skill_demand,
             'top_10_skills': skill_demand[:10],
             'top_20_skills': skill_demand[:20],
@@ -189,9 +311,7 @@ class SkillExtractor:
         for source in sources:
             source_jobs = [j for j in jobs if j.get('source', 'unknown') == source]
             if source_jobs:
-                print(f"\n{'='*60}")
-                print(f"Analyzing {source.upper()} jobs...")
-                print(f"{'='*60}")
+                logger.debug("Analyzing %s jobs", source)
                 results[source] = self.analyze_jobs(source_jobs)
         
         return results
@@ -212,10 +332,10 @@ class SkillExtractor:
         role_jobs = [j for j in jobs if j.get('search_role', '').lower() == role_name.lower()]
         
         if not role_jobs:
-            print(f"\n⚠️  No jobs found for role: {role_name}")
+            logger.warning("No jobs found for role: %s", role_name)
             return None
         
-        print(f"\n📋 Analyzing {len(role_jobs)} jobs for: {role_name}")
+        logger.debug("Analyzing %d jobs for: %s", len(role_jobs), role_name)
         return self.analyze_jobs(role_jobs)
     
     
@@ -229,9 +349,7 @@ class SkillExtractor:
         Returns:
             Comparison data
         """
-        print(f"\n{'='*60}")
-        print(f"🔄 COMPARING SOURCES")
-        print(f"{'='*60}")
+        logger.debug("Comparing sources")
         
         source_analyses = self.analyze_by_source(jobs)
         
@@ -247,10 +365,34 @@ class SkillExtractor:
         }
 
 
-def load_jobs_from_file(file_path: str) -> List[Dict]:
-    """Load jobs from JSON file"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        jobs = json.load(f)
+def load_jobs_from_file(
+    file_path: str,
+    role: Optional[str] = None,
+    location: Optional[str] = None,
+    days: Optional[float] = None,
+    columns: Optional[List[str]] = None
+) -> List[Dict]:
+    """
+    Load jobs from a JSON dump, a Parquet export or a job store (.db)
+    
+    role, location and days select a slice (e.g. one role's jobs from the
+    last 30 days); a job store answers them from its indexes. columns
+    keeps only those fields, e.g. ANALYSIS_COLUMNS; a Parquet export reads
+    nothing else from disk.
+    """
+    suffix = Path(file_path).suffix
+    if suffix == '.parquet':
+        jobs = load_jobs(file_path, columns=columns, role=role, location=location, days=days)
+    else:
+        if suffix in ('.db', '.sqlite', '.sqlite3'):
+            jobs = JobStore(file_path).query(role=role, location=location, days=days)
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                jobs = json.load(f)
+            if role or location or days is not None:
+                jobs = [job for job in jobs if job_matches(job, role=role, location=location, days=days)]
+        if columns is not None:
+            jobs = [{column: job[column] for column in columns if column in job} for job in jobs]
     
     # Validate multi-source format
     if jobs and 'source' in jobs[0]:
@@ -348,14 +490,17 @@ if __name__ == "__main__":
     print("MULTI-SOURCE SKILL DEMAND ANALYZER")
     print("🎯"*30)
     
-    # Find JSON files in current directory
+    # Find the job store or JSON files in current directory
     json_files = list(Path('.').glob('multi_source_jobs_*.json'))
     if not json_files:
         json_files = list(Path('.').glob('jobs_*.json'))
     
-    if not json_files and len(sys.argv) > 1:
+    if len(sys.argv) > 1:
         # File provided as argument
         json_file = sys.argv[1]
+    elif Path(DEFAULT_JOB_STORE_PATH).exists():
+        json_file = DEFAULT_JOB_STORE_PATH
+        print(f"\n📂 Found job store: {json_file}")
     elif json_files:
         # Use most recent JSON file
         json_file = str(max(json_files, key=lambda p: p.stat().st_mtime))
@@ -367,7 +512,7 @@ if __name__ == "__main__":
     try:
         # Load jobs
         print(f"\n📥 Loading jobs from: {json_file}")
-        jobs = load_jobs_from_file(json_file)
+        jobs = load_jobs_from_file(json_file, columns=ANALYSIS_COLUMNS)
         print(f"✅ Loaded {len(jobs)} jobs")
         
         # Create extractor
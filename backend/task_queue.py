@@ -0,0 +1,181 @@
+"""
+Task Queue Module
+In-process background task queue with bounded workers, result TTL and deduplication
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+from metrics import EXECUTOR_QUEUE_DEPTH
+from logging_setup import get_logger
+
+logger = get_logger("task_queue")
+
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+def task_key(kind: str, payload: Any) -> str:
+    """Stable deduplication key for a task kind and JSON-serializable payload"""
+    canonical = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(f"{kind}:{canonical}".encode("utf-8")).hexdigest()
+
+
+class TaskQueue:
+    """
+    Run long analyses in the background and keep their results for a while
+
+    Coroutine functions run on the event loop and must hand blocking or
+    CPU-heavy work to an executor themselves; plain functions run on the
+    executor (a thread pool by default; pass a ProcessPoolExecutor for
+    CPU-bound, picklable work). At most max_workers tasks run at once.
+    Finished tasks are kept for result_ttl seconds. Submitting a task whose
+    key matches a queued or running task returns that task instead of
+    starting a new one.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        result_ttl: float = 3600,
+        executor: Optional[Executor] = None,
+        name: str = "tasks"
+    ):
+        self.max_workers = max_workers
+        self.result_ttl = result_ttl
+        self.executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._tasks: Dict[str, Dict] = {}
+        self._inflight: Dict[str, str] = {}  # dedupe key -> task id
+        self._handles: Dict[str, asyncio.Task] = {}
+
+        EXECUTOR_QUEUE_DEPTH.set_function(self.queued_count, executor=name)
+
+
+    def queued_count(self) -> int:
+        return sum(1 for task in self._tasks.values() if task["status"] == QUEUED)
+
+
+    def submit(self, kind: str, func: Callable, *args, key: Optional[str] = None, **kwargs) -> Dict:
+        """
+        Queue func(*args, **kwargs) and return its task record
+
+        Must be called from within the running event loop.
+        """
+        self._purge_expired()
+
+        if key is not None and key in self._inflight:
+            task = self._tasks[self._inflight[key]]
+            return {**self._public(task), "deduplicated": True}
+
+        task_id = uuid.uuid4().hex
+        task = {
+            "task_id": task_id,
+            "kind": kind,
+            "status": QUEUED,
+            "created_at": datetime.now().isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "error": None,
+            "status_code": None,
+            "result": None,
+            "key": key,
+            "expires_at": None
+        }
+        self._tasks[task_id] = task
+        if key is not None:
+            self._inflight[key] = task_id
+
+        self._handles[task_id] = asyncio.ensure_future(self._run(task, func, args, kwargs))
+        logger.info("Task %s queued (%s)", task_id, kind)
+        return {**self._public(task), "deduplicated": False}
+
+
+    async def _run(self, task: Dict, func: Callable, args: tuple, kwargs: Dict):
+        start = time.perf_counter()
+        try:
+            async with self._semaphore:
+                task["status"] = RUNNING
+                task["started_at"] = datetime.now().isoformat()
+                start = time.perf_counter()
+
+                if asyncio.iscoroutinefunction(func):
+                    result = await func(*args, **kwargs)
+                else:
+                    loop = asyncio.get_running_loop()
+                    result = await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+                task["result"] = result
+                task["status"] = SUCCEEDED
+        except asyncio.CancelledError:
+            # Queued or running (e.g. at shutdown): record it, then let the cancellation through
+            task["status"] = CANCELLED
+            task["error"] = "Task was cancelled"
+            task["status_code"] = 503
+            logger.warning("Task %s (%s) cancelled", task["task_id"], task["kind"])
+            raise
+        except Exception as e:
+            task["status"] = FAILED
+            task["error"] = getattr(e, "detail", None) or str(e)
+            task["status_code"] = getattr(e, "status_code", 500)
+            logger.warning("Task %s (%s) failed: %s", task["task_id"], task["kind"], task["error"])
+        finally:
+            task["finished_at"] = datetime.now().isoformat()
+            task["expires_at"] = time.monotonic() + self.result_ttl
+            if task["key"] is not None:
+                self._inflight.pop(task["key"], None)
+            self._handles.pop(task["task_id"], None)
+
+        logger.info(
+            "Task %s (%s) %s in %.2fs",
+            task["task_id"], task["kind"], task["status"], time.perf_counter() - start
+        )
+
+
+    def get(self, task_id: str) -> Optional[Dict]:
+        """Return the task record (without result), or None if unknown/expired"""
+        self._purge_expired()
+        task = self._tasks.get(task_id)
+        return self._public(task) if task else None
+
+
+    def result(self, task_id: str) -> Optional[Dict]:
+        """Return the full task record including its result"""
+        self._purge_expired()
+        task = self._tasks.get(task_id)
+        return {**self._public(task), "result": task["result"]} if task else None
+
+
+    def _public(self, task: Dict) -> Dict:
+        return {
+            k: v for k, v in task.items()
+            if k not in ("result", "key", "expires_at")
+        }
+
+
+    def _purge_expired(self):
+        now = time.monotonic()
+        expired = [
+            task_id for task_id, task in self._tasks.items()
+            if task["expires_at"] is not None and task["expires_at"] <= now
+        ]
+        for task_id in expired:
+            del self._tasks[task_id]
+
+
+    def shutdown(self):
+        """Cancel unfinished tasks and stop the executor"""
+        for handle in list(self._handles.values()):
+            handle.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,123 @@
+"""Tests for per-class admission control (run with pytest)"""
+
+import asyncio
+
+from admission import AdmissionClass, AdmissionMiddleware
+
+
+def test_slots_are_handed_to_waiters_in_order():
+    async def scenario():
+        limit = AdmissionClass("test", max_concurrency=1, max_queue=2, queue_timeout=1.0)
+        assert await limit.acquire() is None
+
+        order = []
+
+        async def wait(name):
+            assert await limit.acquire() is None
+            order.append(name)
+
+        first = asyncio.ensure_future(wait("first"))
+        second = asyncio.ensure_future(wait("second"))
+        await asyncio.sleep(0)
+        assert await limit.acquire() == 'queue_full'
+
+        limit.release()
+        await first
+        limit.release()
+        await second
+        assert order == ["first", "second"]
+        assert limit.active == 1
+
+        limit.release()
+        assert limit.active == 0
+
+    asyncio.run(scenario())
+
+
+def test_queue_timeout():
+    async def scenario():
+        limit = AdmissionClass("test", max_concurrency=1, max_queue=1, queue_timeout=0.05)
+        await limit.acquire()
+
+        assert await limit.acquire() == 'queue_timeout'
+        assert not limit._waiters
+
+        limit.release()
+        assert await limit.acquire() is None
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def scenario():
+        limit = AdmissionClass("test", max_concurrency=1, max_queue=1, queue_timeout=1.0)
+        await limit.acquire()
+
+        waiter = asyncio.ensure_future(limit.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        assert not limit._waiters
+        limit.release()
+        assert limit.active == 0
+
+    asyncio.run(scenario())
+
+
+def test_retry_after_defaults_to_queue_timeout():
+    assert AdmissionClass("test", max_concurrency=1, queue_timeout=2.5).retry_after == 3
+    assert AdmissionClass("test", max_concurrency=1, queue_timeout=0).retry_after == 1
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv("ADMISSION_TEST_CONCURRENCY", "7")
+    monkeypatch.setenv("ADMISSION_TEST_QUEUE", "3")
+
+    limit = AdmissionClass.from_env("test", max_concurrency=1, queue_timeout=2.0)
+
+    assert (limit.max_concurrency, limit.max_queue, limit.queue_timeout) == (7, 3, 2.0)
+
+
+async def request(middleware, path, method='GET'):
+    """Send one HTTP request through the middleware, returning (status, headers)"""
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware({'type': 'http', 'method': method, 'path': path}, receive, send)
+    start = messages[0]
+    return start['status'], dict(start['headers'])
+
+
+def test_middleware_sheds_load_per_route_class():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def app(scope, receive, send):
+            if scope['path'].startswith('/slow') and scope['method'] == 'GET':
+                await release.wait()
+            await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+            await send({'type': 'http.response.body', 'body': b''})
+
+        limit = AdmissionClass("slow", max_concurrency=1, max_queue=0, queue_timeout=1.0)
+        middleware = AdmissionMiddleware(app, classes={"slow": limit}, routes={"/slow": "slow"})
+
+        running = asyncio.ensure_future(request(middleware, '/slow'))
+        await asyncio.sleep(0)
+
+        status, headers = await request(middleware, '/slow/')
+        assert status == 503
+        assert headers[b'retry-after'] == b'1'
+        assert (await request(middleware, '/slow', method='OPTIONS'))[0] == 200  # CORS preflight
+        assert (await request(middleware, '/health'))[0] == 200  # No class, never limited
+
+        release.set()
+        assert (await running)[0] == 200
+        assert limit.active == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,74 @@
+"""Tests for the multi-role collection scheduler (run with pytest)"""
+
+import asyncio
+
+import pytest
+
+from collection_scheduler import CollectionScheduler
+from job_store import JobStore
+
+
+class FakeCollector:
+    """Stands in for AsyncJobCollector: one request and one new posting per role"""
+
+    def __init__(self):
+        self.stats = {'adzuna': {'attempted': 0, 'collected': 0, 'failed': 0}}
+        self.refreshed = []
+
+    async def collect_new_from_adzuna_async(self, role, store, location="India", max_pages=5, deadline=None):
+        self.stats['adzuna']['attempted'] += 1
+        self.refreshed.append(role)
+        await asyncio.sleep(0)
+        if role == 'Broken Role':
+            raise RuntimeError("upstream error")
+        return [{'id': role}]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / "jobs.db"))
+
+
+def test_never_refreshed_then_stale_and_popular_first(store):
+    store.set_watermark('Recent Role', 'India', '2026-01-01T00:00:00Z')
+    scheduler = CollectionScheduler(FakeCollector(), store)
+    roles = [
+        {'role': 'Recent Role', 'job_count': 500},
+        {'role': 'Old Popular', 'job_count': 400, 'age_hours': 48},
+        {'role': 'Old Niche', 'job_count': 2, 'age_hours': 48},
+        {'role': 'New Role', 'job_count': 0},
+    ]
+
+    ranked = scheduler.prioritize(roles)
+
+    assert [role['role'] for role in ranked] == ['New Role', 'Old Popular', 'Old Niche', 'Recent Role']
+    assert ranked[-1]['staleness_hours'] < 1
+
+
+def test_run_skips_fresh_roles_and_reports_errors(store):
+    store.set_watermark('Recent Role', 'India', '2026-01-01T00:00:00Z')
+    collector = FakeCollector()
+    scheduler = CollectionScheduler(collector, store, max_concurrent_roles=2)
+    roles = [
+        {'role': 'Recent Role', 'job_count': 10},
+        {'role': 'Stale Role', 'job_count': 10, 'age_hours': 30},
+        {'role': 'Broken Role', 'job_count': 10, 'age_hours': 20},
+    ]
+
+    summary = asyncio.run(scheduler.run(roles, min_age_hours=12))
+
+    assert collector.refreshed == ['Stale Role', 'Broken Role']
+    assert summary['roles']['Stale Role'] == {'new_jobs': 1}
+    assert 'error' in summary['roles']['Broken Role']
+    assert summary['new_jobs'] == 1 and summary['requests'] == 2
+
+
+def test_request_budget_stops_new_roles(store):
+    collector = FakeCollector()
+    scheduler = CollectionScheduler(collector, store, max_concurrent_roles=1)
+    roles = [{'role': f"Role {i}", 'job_count': 10 - i} for i in range(4)]
+
+    summary = asyncio.run(scheduler.run(roles, max_requests=2))
+
+    assert len(collector.refreshed) == 2
+    assert sum(1 for result in summary['roles'].values() if 'skipped' in result) == 2
@@ -0,0 +1,75 @@
+"""Tests for batch gap analysis (run with pytest)"""
+
+import pytest
+
+from gap_analyzer import GapAnalyzer, MarketProfile
+
+
+MARKET_SKILLS = [
+    {'skill': 'Python', 'percentage': 80.0, 'count': 40, 'demand_level': 'Critical'},
+    {'skill': 'JavaScript', 'percentage': 60.0, 'count': 30, 'demand_level': 'High'},
+    {'skill': 'PostgreSQL', 'percentage': 40.0, 'count': 20, 'demand_level': 'Medium'},
+    {'skill': 'Docker', 'percentage': 20.0, 'count': 10, 'demand_level': 'Low'},
+]
+
+USERS = [
+    ['Python3', 'Postgres', 'Rust'],
+    ['JS', 'JavaScript', 'Docker'],
+    [],
+    ['Python', 'JavaScript', 'PostgreSQL', 'Docker'],
+    ['COBOL'],
+]
+
+
+@pytest.fixture
+def analyzer():
+    return GapAnalyzer()
+
+
+def test_batch_matches_one_user_at_a_time(analyzer):
+    singles = [analyzer.analyze_gap(skills, MARKET_SKILLS, 'Backend Developer') for skills in USERS]
+
+    assert analyzer.analyze_gap_batch(USERS, MARKET_SKILLS, 'Backend Developer') == singles
+
+
+def test_prepared_profile_gives_the_same_results(analyzer):
+    profile = analyzer.prepare_market_profile(MARKET_SKILLS)
+    assert isinstance(profile, MarketProfile)
+
+    expected = analyzer.analyze_gap_batch(USERS, MARKET_SKILLS)
+    assert analyzer.analyze_gap_batch(USERS, profile) == expected
+    assert analyzer.analyze_gap_batch(list(reversed(USERS)), profile) == list(reversed(expected))
+
+
+def test_weighted_and_tier_results(analyzer):
+    result = analyzer.analyze_gap_batch(USERS, MARKET_SKILLS)[0]
+
+    # Python3 and Postgres match through skill variations: (80 + 40) / 200
+    assert result['matched_skills'] == ['PostgreSQL', 'Python']
+    assert result['match_percentage'] == 60.0
+    assert result['simple_match_percentage'] == 50.0
+    assert result['extra_skills'] == ['Rust']
+    assert result['matched_by_priority'] == {'critical': 1, 'high': 0, 'medium': 1, 'low': 0}
+    assert [gap['skill'] for gap in result['skill_gaps']['high']] == ['JavaScript']
+    assert [gap['skill'] for gap in result['skill_gaps']['low']] == ['Docker']
+
+
+def test_variations_of_one_skill_count_once(analyzer):
+    result = analyzer.analyze_gap_batch(USERS, MARKET_SKILLS)[1]
+
+    assert result['matched_skills'] == ['Docker', 'JavaScript']
+    assert result['match_percentage'] == 40.0
+    assert result['user_skills_count'] == 3
+    assert result['extra_skills_count'] == 0
+
+
+def test_edge_cases(analyzer):
+    empty, full, unmatched = (analyzer.analyze_gap_batch(USERS, MARKET_SKILLS)[i] for i in (2, 3, 4))
+
+    assert empty['match_percentage'] == 0.0
+    assert empty['missing_skills_count'] == 4
+    assert full['match_percentage'] == 100.0
+    assert full['total_gaps_by_priority'] == {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
+    assert unmatched['extra_skills'] == ['COBOL']
+    assert analyzer.analyze_gap_batch([], MARKET_SKILLS) == []
+    assert analyzer.analyze_gap_batch([['Python']], [])[0]['match_percentage'] == 0.0
@@ -0,0 +1,150 @@
+"""Tests for the watermark-based incremental Adzuna refresh (run with pytest)"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from job_store import JobStore
+from multi_source_collector import ADZUNA_PAGE_SIZE, AsyncJobCollector
+
+
+class FakeAdzuna:
+    """Date-sorted Adzuna results; pages listed in fail_pages fail once"""
+
+    def __init__(self):
+        self.postings = []  # Newest first
+        self.fail_pages = set()
+        self.fetched_pages = []
+        self._next_id = 0
+        self._now = datetime.now(timezone.utc) - timedelta(days=1)
+
+    def post(self, count: int):
+        for _ in range(count):
+            self._next_id += 1
+            self._now += timedelta(minutes=1)
+            self.postings.insert(0, {
+                'id': str(self._next_id),
+                'source': 'adzuna',
+                'title': f"Python Developer {self._next_id}",
+                'created': self._now.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'search_role': 'Python Developer',
+                'search_location': 'India'
+            })
+
+    def page(self, page: int):
+        self.fetched_pages.append(page)
+        if page in self.fail_pages:
+            self.fail_pages.discard(page)
+            return None
+        start = (page - 1) * ADZUNA_PAGE_SIZE
+        return [dict(job) for job in self.postings[start:start + ADZUNA_PAGE_SIZE]]
+
+
+@pytest.fixture
+def adzuna():
+    return FakeAdzuna()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / "jobs.db"))
+
+
+@pytest.fixture
+def collector(adzuna):
+    collector = AsyncJobCollector()
+
+    async def fetch_adzuna_page(role, location, page, deadline=None):
+        return adzuna.page(page)
+
+    collector.fetch_adzuna_page = fetch_adzuna_page
+    return collector
+
+
+def refresh(collector, store, max_pages=5):
+    return asyncio.run(collector.collect_new_from_adzuna_async('Python Developer', store, max_pages=max_pages))
+
+
+def stored_ids(store, adzuna):
+    return store.known_ids('adzuna', (job['id'] for job in adzuna.postings))
+
+
+def test_complete_refresh_advances_watermark(adzuna, collector, store):
+    adzuna.post(120)
+
+    new_jobs = refresh(collector, store)
+
+    assert len(new_jobs) == 120
+    assert adzuna.fetched_pages == [1, 2, 3]
+    watermark = store.get_watermark('Python Developer', 'India')
+    assert watermark['latest_created'] == adzuna.postings[0]['created']
+    assert watermark['resume_page'] is None
+
+
+def test_refresh_stops_at_a_page_of_stored_postings(adzuna, collector, store):
+    adzuna.post(200)
+    refresh(collector, store)
+    adzuna.post(10)
+    adzuna.fetched_pages.clear()
+
+    new_jobs = refresh(collector, store)
+
+    assert [job['id'] for job in new_jobs] == [job['id'] for job in adzuna.postings[:10]]
+    assert adzuna.fetched_pages == [1]
+
+
+def test_failed_page_keeps_watermark(adzuna, collector, store):
+    adzuna.post(120)
+    refresh(collector, store)
+    watermark = store.get_watermark('Python Developer', 'India')['latest_created']
+    adzuna.post(150)
+    adzuna.fail_pages = {2}
+
+    new_jobs = refresh(collector, store)
+
+    assert len(new_jobs) == 50
+    after = store.get_watermark('Python Developer', 'India')
+    assert after['latest_created'] == watermark
+    assert after['resume_page'] == 2
+
+
+def test_max_pages_cutoff_keeps_watermark(adzuna, collector, store):
+    adzuna.post(300)
+
+    new_jobs = refresh(collector, store, max_pages=2)
+
+    assert len(new_jobs) == 100
+    watermark = store.get_watermark('Python Developer', 'India')
+    assert watermark['latest_created'] is None
+    assert watermark['resume_page'] == 3
+
+
+def test_resumed_refresh_fills_the_gap(adzuna, collector, store):
+    adzuna.post(300)
+    refresh(collector, store, max_pages=2)
+    adzuna.post(60)
+    adzuna.fetched_pages.clear()
+
+    refresh(collector, store, max_pages=5)
+    refresh(collector, store, max_pages=5)
+
+    assert len(stored_ids(store, adzuna)) == 360
+    watermark = store.get_watermark('Python Developer', 'India')
+    assert watermark['latest_created'] == adzuna.postings[0]['created']
+    assert watermark['resume_page'] is None
+
+
+def test_repeated_interruptions_lose_nothing(adzuna, collector, store):
+    adzuna.post(100)
+    refresh(collector, store)
+    for arrivals, fail_page, max_pages in [(180, 2, 5), (70, 3, 2), (120, None, 1), (40, 1, 5), (260, 4, 3)]:
+        adzuna.post(arrivals)
+        adzuna.fail_pages = {fail_page} if fail_page else set()
+        refresh(collector, store, max_pages=max_pages)
+
+    for _ in range(10):
+        refresh(collector, store)
+
+    assert len(stored_ids(store, adzuna)) == len(adzuna.postings)
+    assert store.get_watermark('Python Developer', 'India')['resume_page'] is None
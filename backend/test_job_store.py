@@ -0,0 +1,66 @@
+"""Tests for the SQLite job store (run with pytest)"""
+
+import pytest
+
+from job_store import JobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / "jobs.db"))
+
+
+def job(job_id, title="Python Developer", created="2026-01-01T00:00:00Z", source="adzuna"):
+    return {
+        'id': job_id,
+        'source': source,
+        'title': title,
+        'created': created,
+        'search_role': 'Python Developer',
+        'search_location': 'India'
+    }
+
+
+def test_upsert_counts_new_and_updated(store):
+    assert store.upsert([job('1'), job('2')]) == (2, 0)
+    assert store.upsert([job('2', title="Senior Python Developer"), job('3')]) == (1, 1)
+
+    assert len(store) == 3
+    titles = {j['id']: j['title'] for j in store.query()}
+    assert titles == {'1': "Python Developer", '2': "Senior Python Developer", '3': "Python Developer"}
+
+
+def test_upsert_skips_jobs_without_id_and_keys_by_source(store):
+    assert store.upsert([job(''), job(None)]) == (0, 0)
+    assert store.upsert([job('1'), job('1', source='jooble')]) == (2, 0)
+    assert store.known_ids('adzuna', ['1', '2']) == {'1'}
+
+
+def test_role_and_location_filters_are_normalized(store):
+    store.upsert([job('1')])
+
+    assert store.count(role='python devs', location='  INDIA ') == 1
+    assert store.count(role='Data Scientist') == 0
+
+
+def test_watermark_never_moves_back(store):
+    assert store.get_watermark('Python Developer', 'India') is None
+
+    store.set_watermark('Python Developer', 'India', '2026-01-02T00:00:00Z')
+    store.set_watermark('Python Developer', 'India', '2026-01-01T00:00:00Z')
+    assert store.get_watermark('Python Developer', 'India')['latest_created'] == '2026-01-02T00:00:00Z'
+
+    store.set_watermark('Python Developer', 'India', None, resume_page=3)
+    watermark = store.get_watermark('python developer', 'india')
+    assert watermark['latest_created'] == '2026-01-02T00:00:00Z'
+    assert watermark['resume_page'] == 3
+
+
+def test_completed_refresh_clears_resume_page(store):
+    store.set_watermark('Python Developer', 'India', None, resume_page=2)
+    assert store.get_watermark('Python Developer', 'India')['latest_created'] is None
+
+    store.set_watermark('Python Developer', 'India', '2026-01-03T00:00:00Z')
+    watermark = store.get_watermark('Python Developer', 'India')
+    assert watermark['latest_created'] == '2026-01-03T00:00:00Z'
+    assert watermark['resume_page'] is None
@@ -0,0 +1,37 @@
+"""Tests for sampled hot-path logging (run with pytest)"""
+
+import logging
+
+from logging_setup import SamplingFilter, sampled
+
+
+def make_record(msg, args=(), **extra):
+    record = logging.LogRecord('skillsphere.test', logging.INFO, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_sampled_records_pass_one_in_n_per_template():
+    sampling = SamplingFilter()
+
+    passed = [
+        sampling.filter(make_record("Adzuna page %d: %d jobs", (page, 50), **sampled(5)))
+        for page in range(12)
+    ]
+
+    assert passed == [True, False, False, False, False] * 2 + [True, False]
+
+
+def test_templates_are_counted_separately():
+    sampling = SamplingFilter()
+
+    assert sampling.filter(make_record("Gap analysis request", **sampled(3)))
+    assert sampling.filter(make_record("Job search", **sampled(3)))
+    assert not sampling.filter(make_record("Gap analysis request", **sampled(3)))
+
+
+def test_unsampled_records_always_pass():
+    sampling = SamplingFilter()
+
+    assert all(sampling.filter(make_record("Circuit opened")) for _ in range(5))
+    assert all(sampling.filter(make_record("Every line", **sampled(1))) for _ in range(5))
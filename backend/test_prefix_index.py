@@ -0,0 +1,48 @@
+"""Tests for the prefix autocomplete index (run with pytest)"""
+
+import pytest
+
+from prefix_index import PrefixIndex, normalize_key
+
+
+@pytest.fixture
+def index():
+    index = PrefixIndex()
+    index.add("Machine Learning Engineer", "mle")
+    index.add("Machine Learning", "ml")
+    index.add("Software Engineer", "swe")
+    index.add("ML Engineer", "mle")  # Variant of an entry already indexed
+    index.add("Engineering Manager", "em", {"role": "Engineering Manager"})
+    return index
+
+
+def test_normalize_key():
+    assert normalize_key("  Data \t Scientist ") == "data scientist"
+
+
+def test_search_matches_full_name_prefix(index):
+    assert index.search("machine l") == ["ml", "mle"]
+    assert index.search("  MACHINE   learning e") == ["mle"]
+
+
+def test_full_name_matches_rank_before_later_words(index):
+    assert index.search("engineer") == [{"role": "Engineering Manager"}, "mle", "swe"]
+
+
+def test_variants_are_returned_once(index):
+    assert index.search("m") == ["ml", "mle", {"role": "Engineering Manager"}]  # "manager" is a later word
+    assert len(index) == 4
+
+
+def test_limit_and_empty_prefix(index):
+    assert len(index.search("engineer", limit=2)) == 2
+    assert index.search("") == []
+    assert index.search("cobol") == []
+
+
+def test_set_value(index):
+    index.set_value("ml", {"role": "Machine Learning"})
+    index.set_value("unknown", "ignored")
+
+    assert index.search("machine learning") == [{"role": "Machine Learning"}, "mle"]
+    assert "unknown" not in index
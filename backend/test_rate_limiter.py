@@ -0,0 +1,92 @@
+"""Tests for the shared token bucket and retry backoff (run with pytest)"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from rate_limiter import TokenBucket, backoff_delay, get_bucket, parse_retry_after
+
+
+def test_burst_then_steady_rate():
+    bucket = TokenBucket('test', rate=20.0, capacity=3)
+    start = time.monotonic()
+    for _ in range(3):
+        assert bucket.acquire()
+    assert time.monotonic() - start < 0.02  # The burst is immediate
+
+    assert bucket.acquire()
+    assert bucket.acquire()
+    assert time.monotonic() - start == pytest.approx(0.1, abs=0.03)  # Then 1 per 1/rate
+
+
+def test_concurrent_callers_queue_up_as_debt():
+    bucket = TokenBucket('test', rate=10.0, capacity=1)
+    bucket.acquire()
+
+    # Each reservation waits behind the previous one
+    assert bucket._reserve(1) == pytest.approx(0.1, abs=0.02)
+    assert bucket._reserve(1) == pytest.approx(0.2, abs=0.02)
+
+
+def test_timeout_refunds_the_token():
+    bucket = TokenBucket('test', rate=10.0, capacity=1)
+    bucket.acquire()
+
+    assert not bucket.acquire(timeout=0.01)
+    assert not bucket.acquire(timeout=0.01)
+    # The failed attempts left no debt behind
+    assert bucket._reserve(1) == pytest.approx(0.1, abs=0.02)
+
+
+def test_cancelled_async_wait_refunds_the_token():
+    bucket = TokenBucket('test', rate=5.0, capacity=1)
+    bucket.acquire()
+
+    async def scenario():
+        waiter = asyncio.ensure_future(bucket.acquire_async())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(scenario())
+    assert bucket._reserve(1) <= 0.2  # Not 0.4: the cancelled wait gave its token back
+
+
+def test_pause_holds_back_every_caller():
+    bucket = TokenBucket('test', rate=100.0, capacity=5)
+    bucket.pause(0.1)
+
+    start = time.monotonic()
+    assert bucket.acquire()
+    assert time.monotonic() - start == pytest.approx(0.1, abs=0.03)
+
+
+def test_buckets_are_shared_by_name():
+    first = get_bucket('test-shared', rate=1.0)
+    assert get_bucket('test-shared', rate=50.0) is first
+    assert first.rate == 1.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('') is None
+    assert parse_retry_after('2.5') == 2.5
+    assert parse_retry_after('-3') == 0.0
+    assert parse_retry_after('soon') is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(30, abs=2)
+    assert parse_retry_after(format_datetime(retry_at - timedelta(minutes=5), usegmt=True)) == 0.0
+
+
+def test_backoff_delay_is_jittered_capped_and_honours_retry_after():
+    delays = [backoff_delay(3, base=1.0, cap=5.0) for _ in range(200)]
+    assert all(0 <= delay <= 5.0 for delay in delays)
+    assert max(delays) > 2.0 and min(delays) < 2.0  # Full jitter over [0, cap]
+
+    assert all(0 <= backoff_delay(0, base=1.0) <= 1.0 for _ in range(50))
+    assert all(backoff_delay(0, retry_after=7.0) == 7.0 for _ in range(20))
@@ -0,0 +1,114 @@
+"""Tests for circuit breakers and deadlines (run with pytest)"""
+
+import asyncio
+import time
+
+import pytest
+
+from multi_source_collector import AsyncJobCollector
+from rate_limiter import TokenBucket
+from resilience import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, Deadline, DeadlineExceeded, call_timeout
+)
+
+
+def make_breaker(**settings) -> CircuitBreaker:
+    settings.setdefault('failure_threshold', 2)
+    settings.setdefault('reset_timeout', 0.05)
+    return CircuitBreaker('test', **settings)
+
+
+def test_consecutive_failures_open_the_circuit():
+    breaker = make_breaker()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED  # A success resets the count
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.allow()
+    assert 0 < error.value.retry_after <= 0.05
+
+
+def test_slow_calls_count_as_failures():
+    breaker = make_breaker(failure_threshold=1, slow_call_seconds=1.0)
+    breaker.record_success(duration=0.5)
+    assert breaker.state == CLOSED
+    breaker.record_success(duration=2.0)
+    assert breaker.state == OPEN
+
+
+def test_half_open_probe_closes_or_reopens():
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+
+    breaker.allow()  # The probe
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.allow()  # Only one probe at a time
+    assert error.value.retry_after > 0
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    time.sleep(0.06)
+    breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_release_returns_the_probe_slot():
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    breaker.allow()
+    breaker.release()
+    breaker.allow()  # The slot is free again
+    assert breaker.state == HALF_OPEN
+
+
+def test_call_records_the_outcome():
+    breaker = make_breaker(failure_threshold=1)
+    assert breaker.call(lambda x: x + 1, 1) == 2
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        breaker.call(fail)
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: None)
+
+
+def test_deadline_caps_call_timeouts():
+    deadline = Deadline(0.05)
+    assert call_timeout(deadline, 10.0) <= 0.05
+    assert call_timeout(None, 10.0) == 10.0
+    time.sleep(0.06)
+    assert deadline.expired
+    with pytest.raises(DeadlineExceeded):
+        deadline.check("roadmap")
+
+
+def test_expired_deadline_does_not_hold_a_probe_slot():
+    collector = AsyncJobCollector()
+    breaker = collector.adzuna_breaker = make_breaker()
+    collector.rate_limiter = TokenBucket('test', rate=1.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    async def fetch():
+        # The rate limiter cannot grant a token within the budget
+        collector.rate_limiter.pause(1.0)
+        return await collector.fetch_adzuna_page('Python Developer', 'India', 1, Deadline(0.01))
+
+    assert asyncio.run(fetch()) is None
+    breaker.allow()  # The probe slot was released
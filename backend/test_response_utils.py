@@ -0,0 +1,70 @@
+"""Tests for ETag conditional responses (run with pytest)"""
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from response_utils import conditional_response, etag_matches, make_etag
+
+
+def test_make_etag_is_weak_and_versioned():
+    etag = make_etag("skill_analysis.json", 1700000000, 2048)
+
+    assert etag.startswith('W/"') and etag.endswith('"')
+    assert etag == make_etag("skill_analysis.json", 1700000000, 2048)
+    assert etag != make_etag("skill_analysis.json", 1700000001, 2048)
+    assert etag != make_etag("skill_analysis.json", 1700000000, 2048, "fields=skills")
+
+
+def test_etag_matches_uses_weak_comparison():
+    etag = make_etag("v1")
+    opaque = etag[2:]
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(opaque, etag)
+    assert etag_matches(f'"other", {opaque}', etag)
+    assert etag_matches('*', etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def make_client():
+    app = FastAPI()
+    state = {"version": 1, "builds": 0}
+
+    @app.get("/profile")
+    async def profile(request: Request):
+        def build():
+            state["builds"] += 1
+            return {"version": state["version"]}
+
+        return conditional_response(request, make_etag(state["version"]), build)
+
+    return TestClient(app), state
+
+
+def test_matching_if_none_match_returns_304_without_building():
+    client, state = make_client()
+
+    first = client.get("/profile")
+    assert first.status_code == 200
+    assert first.json() == {"version": 1}
+    assert first.headers["cache-control"] == "private, no-cache"
+    etag = first.headers["etag"]
+
+    repeat = client.get("/profile", headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["etag"] == etag
+    assert state["builds"] == 1
+
+
+def test_changed_version_is_sent_again():
+    client, state = make_client()
+    etag = client.get("/profile").headers["etag"]
+    state["version"] = 2
+
+    response = client.get("/profile", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json() == {"version": 2}
+    assert response.headers["etag"] != etag
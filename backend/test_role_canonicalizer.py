@@ -0,0 +1,49 @@
+"""Tests for role name canonicalization (run with pytest)"""
+
+import pytest
+
+from role_canonicalizer import RoleCanonicalizer, clean_role
+
+
+@pytest.mark.parametrize("role, cleaned", [
+    ("Sr. Python Dev", "senior python developer"),
+    ("  python   DEVS ", "python developer"),
+    ("Front-End Engineer", "frontend developer"),
+    ("SWE", "software engineer"),
+    ("ML Engineer", "machine learning engineer"),
+    ("", ""),
+])
+def test_clean_role(role, cleaned):
+    assert clean_role(role) == cleaned
+
+
+@pytest.fixture
+def roles():
+    return RoleCanonicalizer(["Python Developer", "Java Developer", "Data Scientist", "Software Engineer"])
+
+
+def test_variants_share_a_key(roles):
+    assert roles.key("python developers") == roles.key("Python Developer") == "python developer"
+    assert roles.canonicalize("python dev") == "Python Developer"
+
+
+def test_similar_but_different_roles_stay_apart(roles):
+    assert roles.key("JavaScript Developer") != roles.key("Java Developer")
+    assert "JavaScript Developer" not in roles
+
+
+def test_match_ignores_level_qualifiers(roles):
+    assert roles.match("Senior Software Engineer") == "software engineer"
+    assert roles.match("Lead Data Scientist") == "data scientist"
+    assert roles.match("DevOps Engineer") is None
+
+
+def test_add_makes_a_role_known(roles):
+    assert roles.key("DevOps Engineer") == "devops engineer"
+    assert "DevOps Engineer" not in roles
+
+    assert roles.add("DevOps Engineer") == "devops engineer"
+    assert roles.add("devops engineers") == "devops engineer"  # Matches, no new role
+    assert "devops engineer" in roles
+    assert len(roles) == 5
+    assert roles.canonicalize("devops engineer") == "DevOps Engineer"
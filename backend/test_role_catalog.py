@@ -0,0 +1,56 @@
+"""Tests for the role catalog behind /api/roles (run with pytest)"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from role_catalog import RoleCatalog
+
+
+def write_json(path, data):
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+
+def test_catalog_reads_job_files_and_profiles(tmp_path):
+    write_json(tmp_path / "multi_source_jobs_1.json", [
+        {'id': '1', 'search_role': 'Data Scientist', 'collected_at': '2026-01-01T10:00:00'},
+        {'id': '2', 'search_role': 'Data Scientist', 'collected_at': '2026-01-02T10:00:00'},
+        {'id': '3', 'search_role': 'DevOps Engineer', 'collected_at': '2026-01-01T10:00:00'},
+    ])
+    write_json(tmp_path / "skill_analysis_data_scientist.json", {'analyzed_role': 'Data Scientist'})
+    catalog = RoleCatalog(str(tmp_path), default_roles=[])
+    catalog.refresh()
+
+    roles = {role['role']: role for role in catalog.search('', limit=10)}
+
+    assert roles['Data Scientist']['job_count'] == 2
+    assert roles['Data Scientist']['has_profile']
+    assert roles['Data Scientist']['last_collected_at'] == '2026-01-02T10:00:00'
+    assert catalog.profile_path('data scientist') == tmp_path / "skill_analysis_data_scientist.json"
+    assert [role['role'] for role in catalog.search('dev')] == ['DevOps Engineer']
+
+
+def test_prefix_matches_rank_before_later_words(tmp_path):
+    catalog = RoleCatalog(str(tmp_path), default_roles=['DevOps Engineer', 'Engineering Manager'])
+
+    assert [role['role'] for role in catalog.search('eng')] == ['Engineering Manager', 'DevOps Engineer']
+
+
+def test_timezone_aware_timestamps_have_an_age(tmp_path):
+    analyzed_at = (datetime.now(timezone.utc) - timedelta(hours=5)).isoformat()
+    write_json(tmp_path / "skill_analysis_qa_engineer.json", {'analyzed_role': 'QA Engineer', 'analyzed_at': analyzed_at})
+    catalog = RoleCatalog(str(tmp_path), default_roles=[])
+    catalog.refresh()
+
+    [role] = catalog.search('qa')
+
+    assert role['age_hours'] == 5.0
+
+
+def test_live_collections_merge_equivalent_names(tmp_path):
+    catalog = RoleCatalog(str(tmp_path), default_roles=['Python Developer'])
+
+    catalog.record_collection('python developers', 40)
+
+    [role] = catalog.search('python')
+    assert role['role'] == 'Python Developer' and role['job_count'] == 40
+    assert role['age_hours'] == 0.0
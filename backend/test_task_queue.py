@@ -0,0 +1,127 @@
+"""Tests for the background task queue (run with pytest)"""
+
+import asyncio
+import time
+
+from task_queue import CANCELLED, FAILED, SUCCEEDED, TaskQueue, task_key
+
+
+async def _wait(queue: TaskQueue, task_id: str):
+    while queue.get(task_id)["status"] not in (SUCCEEDED, FAILED, CANCELLED):
+        await asyncio.sleep(0.005)
+    return queue.result(task_id)
+
+
+def test_task_key_ignores_dict_order():
+    assert task_key("gap-analysis", {"a": 1, "b": 2}) == task_key("gap-analysis", {"b": 2, "a": 1})
+    assert task_key("gap-analysis", {"a": 1}) != task_key("generate-roadmap", {"a": 1})
+
+
+def test_inflight_tasks_are_deduplicated():
+    async def scenario():
+        queue = TaskQueue(max_workers=2)
+        calls = []
+
+        async def work(value):
+            calls.append(value)
+            await asyncio.sleep(0.02)
+            return value * 2
+
+        first = queue.submit("double", work, 21, key="k")
+        second = queue.submit("double", work, 21, key="k")
+        result = await _wait(queue, first["task_id"])
+        third = queue.submit("double", work, 21, key="k")
+        await _wait(queue, third["task_id"])
+        queue.shutdown()
+        return first, second, third, result, calls
+
+    first, second, third, result, calls = asyncio.run(scenario())
+    assert second["deduplicated"] and second["task_id"] == first["task_id"]
+    assert result["status"] == SUCCEEDED and result["result"] == 42
+    # Finished tasks no longer deduplicate
+    assert not third["deduplicated"] and third["task_id"] != first["task_id"]
+    assert calls == [21, 21]
+
+
+def test_results_expire_after_ttl():
+    async def scenario():
+        queue = TaskQueue(result_ttl=0.05)
+        task = queue.submit("noop", lambda: "done")
+        await _wait(queue, task["task_id"])
+        kept = queue.result(task["task_id"])
+        await asyncio.sleep(0.08)
+        expired = queue.result(task["task_id"])
+        queue.shutdown()
+        return kept, expired
+
+    kept, expired = asyncio.run(scenario())
+    assert kept["result"] == "done"
+    assert expired is None
+
+
+def test_failures_keep_their_status_code():
+    class NotFound(Exception):
+        status_code = 404
+        detail = "no such resume"
+
+    def fail():
+        raise NotFound()
+
+    async def scenario():
+        queue = TaskQueue()
+        task = queue.submit("fail", fail)
+        result = await _wait(queue, task["task_id"])
+        queue.shutdown()
+        return result
+
+    result = asyncio.run(scenario())
+    assert result["status"] == FAILED
+    assert result["status_code"] == 404 and result["error"] == "no such resume"
+
+
+def test_workers_bound_concurrency():
+    async def scenario():
+        queue = TaskQueue(max_workers=2)
+        running, peak = 0, 0
+
+        async def work():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+        tasks = [queue.submit("work", work) for _ in range(6)]
+        for task in tasks:
+            await _wait(queue, task["task_id"])
+        queue.shutdown()
+        return peak
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_cancelled_tasks_are_marked():
+    async def scenario():
+        queue = TaskQueue(max_workers=1)
+
+        async def slow():
+            await asyncio.sleep(10)
+
+        running = queue.submit("slow", slow, key="a")
+        queued = queue.submit("slow", slow, key="b")
+        await asyncio.sleep(0.01)
+        start = time.monotonic()
+        queue.shutdown()
+        await asyncio.sleep(0.01)
+        records = queue.result(running["task_id"]), queue.result(queued["task_id"])
+        resubmitted = queue.submit("slow", slow, key="a")
+        queue.shutdown()
+        await asyncio.sleep(0)
+        return records, resubmitted, time.monotonic() - start
+
+    (running, queued), resubmitted, elapsed = asyncio.run(scenario())
+    assert elapsed < 1
+    for record in (running, queued):
+        assert record["status"] == CANCELLED
+        assert record["status_code"] == 503 and record["finished_at"] is not None
+    assert not resubmitted["deduplicated"]